@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Compares fetching the pages of many searches at once from thread pools
+(page_fetch_workers threads for each search) with fetching them on the
+loop of the async engine, from a local HTTP server answering every request
+after --latency seconds.
+
+--streams searches of --pages pages are iterated at once, each from a
+thread of its own as concurrent streams are, with up to --workers pages of
+each in flight. Each page is a POST of a SOAP sized request, sent through
+the transport's requests session from the threads, and with the engine's
+httpx client from the loop, at most --connections at once as the request slots allow.
+The time taken and the most threads alive at once are reported. Requires
+httpx (pip install tap-netsuite[async]).
+
+    python benchmarks/bench_async_engine.py [--streams 50] [--pages 20] [--workers 8] [--latency 0.05]
+                                            [--connections 10]
+"""
+import argparse
+import asyncio
+import logging
+import threading
+import time
+import types
+
+from tap_netsuite.netsuite.async_engine import AsyncEngine
+from tap_netsuite.netsuite.pagination import SearchPages
+from tap_netsuite.netsuite.transport import NetSuiteTransport
+
+
+REQUEST = b'<soapenv:Envelope>' + b' ' * 2048 + b'</soapenv:Envelope>'
+
+
+class LatencyServer:
+    """An HTTP server on a loop of its own thread, answering every request with its page index after latency
+    seconds, over kept alive connections."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.loop = asyncio.new_event_loop()
+        self.server = self.loop.run_until_complete(asyncio.start_server(self.handle, '127.0.0.1', 0))
+        self.url = 'http://127.0.0.1:{}/'.format(self.server.sockets[0].getsockname()[1])
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                headers = dict(line.split(b': ', 1) for line in head.split(b'\r\n')[1:] if b': ' in line)
+                await reader.readexactly(int(headers.get(b'Content-Length', headers.get(b'content-length', 0))))
+                page_index = head.split(b' ', 2)[1].rsplit(b'/', 1)[1]
+                await asyncio.sleep(self.latency)
+                writer.write(b'HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s' % (len(page_index), page_index))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+
+class MockClient:
+    """Answers searchMoreWithId with a page of one record, the page index posted to the server. At most
+    connections requests are sent at once, as the request slots allow."""
+
+    def __init__(self, url, transport, connections, engine=None):
+        self.url = url
+        self.transport = transport
+        self.engine = engine
+        self.slots = threading.BoundedSemaphore(connections)
+        self.async_slots = asyncio.Semaphore(connections)
+
+    @staticmethod
+    def result(content):
+        return types.SimpleNamespace(records=[{'internalId': content.decode()}])
+
+    def searchMoreWithId(self, searchId, pageIndex):  # pylint: disable=invalid-name,unused-argument
+        with self.slots:
+            return self.result(self.transport.session.post(self.url + str(pageIndex), data=REQUEST).content)
+
+    async def search_more_with_id_async(self, search_id, page_index):  # pylint: disable=unused-argument
+        async with self.async_slots:
+            return self.result((await self.engine.http.post(self.url + str(page_index), content=REQUEST)).content)
+
+
+def search(client, pages):
+    """A performed search of pages pages, as SearchPages reads it."""
+    return types.SimpleNamespace(_ns=client,
+                                 _result=types.SimpleNamespace(searchId='bench'),
+                                 total_records=pages,
+                                 total_pages=pages,
+                                 num_records=1,
+                                 records=[{'internalId': '1'}])
+
+
+class PeakThreads:
+    """The most threads alive at once while in the block."""
+
+    def __init__(self):
+        self.peak = threading.active_count()
+        self.done = threading.Event()
+        self.thread = threading.Thread(target=self.sample, daemon=True)
+
+    def sample(self):
+        while not self.done.wait(0.005):
+            self.peak = max(self.peak, threading.active_count())
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.done.set()
+        self.thread.join()
+
+
+def run(client, args):
+    def sync_stream():
+        pages = list(SearchPages(search(client, args.pages), max_workers=args.workers))
+        assert [page[0]['internalId'] for page in pages] == [str(i) for i in range(1, args.pages + 1)]
+
+    start = time.perf_counter()
+    with PeakThreads() as peak_threads:
+        streams = [threading.Thread(target=sync_stream) for _ in range(args.streams)]
+        for stream in streams:
+            stream.start()
+        for stream in streams:
+            stream.join()
+    return time.perf_counter() - start, peak_threads.peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--streams', type=int, default=50)
+    parser.add_argument('--pages', type=int, default=20)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument('--connections', type=int, default=10)
+    args = parser.parse_args()
+
+    print(f'{args.streams} searches of {args.pages} pages, {args.workers} pages of each in flight, '
+          f'{args.latency * 1000:.0f} ms a request, {args.connections} connections')
+    logging.getLogger('httpx').setLevel(logging.WARNING)
+    server = LatencyServer(args.latency)
+    transport = NetSuiteTransport(pool_size=args.connections)
+    engine = AsyncEngine(None, None, transport)
+    for name, client in (('threads', MockClient(server.url, transport, args.connections)),
+                         ('engine', MockClient(server.url, transport, args.connections, engine))):
+        elapsed, peak = run(client, args)
+        print(f'{name + ":":9} {elapsed:.2f} s, at most {peak} threads')
+
+
+if __name__ == '__main__':
+    main()
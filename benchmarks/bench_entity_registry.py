@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Compares building every entity of ExtendedNetSuiteConnection up front with
+the lazy EntityRegistry, for a sync of a couple of streams.
+
+    python benchmarks/bench_entity_registry.py [--number 200] [--streams SalesOrders,Invoice]
+"""
+import argparse
+import timeit
+import tracemalloc
+
+from tap_netsuite.netsuite.netsuite_connection import ENTITY_FACTORIES, EntityRegistry
+
+
+class Client:
+    """Stands for the ExtendedNetSuiteClient, entities only keep a reference to it."""
+
+    page_fetch_workers = 1
+
+
+def eager(client, streams):
+    entities = {stream: factory(client) for stream, factory in ENTITY_FACTORIES.items()}
+    for stream in streams:
+        entities[stream]  # pylint: disable=pointless-statement
+    return entities
+
+
+def lazy(client, streams):
+    entities = EntityRegistry(client, ENTITY_FACTORIES)
+    for stream in streams:
+        entities[stream]  # pylint: disable=pointless-statement
+    return entities
+
+
+def allocated(func, *args):
+    """Bytes still allocated by the entities func returns."""
+    tracemalloc.start()
+    entities = func(*args)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entities
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=200)
+    parser.add_argument('--streams', default='SalesOrders,Invoice')
+    args = parser.parse_args()
+
+    client = Client()
+    streams = args.streams.split(',')
+
+    eager_time = timeit.timeit(lambda: eager(client, streams), number=args.number)
+    lazy_time = timeit.timeit(lambda: lazy(client, streams), number=args.number)
+    print(f'entities:  {len(ENTITY_FACTORIES)}, streams synced: {len(streams)}')
+    print(f'eager:     {eager_time / args.number * 1e6:.1f} us, {allocated(eager, client, streams) / 1024:.1f} KiB')
+    print(f'lazy:      {lazy_time / args.number * 1e6:.1f} us, {allocated(lazy, client, streams) / 1024:.1f} KiB')
+    print(f'speedup:   {eager_time / lazy_time:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Compares the search session pager (search, then searchMoreWithId) with
+the keyset pager (one internalIdNumber > last search per page) on a full
+table scan of a mocked NetSuite whose search sessions expire.
+
+Every request takes --latency seconds of a simulated clock and a search
+session can be paged for --session-seconds after its search. A scan
+outlasting its session fails, and the session pager can only start over
+from the first page; the keyset pager has no session to lose.
+
+    python benchmarks/bench_keyset_pagination.py [--records 200000] [--page-size 1000]
+"""
+import argparse
+import bisect
+import time
+import types
+
+from tap_netsuite.netsuite.transaction_entities import EntityDefinition, SearchEntity
+
+
+class SearchExpired(Exception):
+    pass
+
+
+class MockClient:
+    """Answers search and searchMoreWithId from an in-memory table ordered by internalId."""
+
+    page_fetch_workers = 1
+
+    SearchLongField = types.SimpleNamespace
+
+    def __init__(self, records, page_size, latency, session_seconds):
+        self.records = records
+        self.internal_ids = [int(rec['internalId']) for rec in records]
+        self.page_size = page_size
+        self.latency = latency
+        self.session_seconds = session_seconds
+        self.clock = 0.0
+        self.requests = 0
+        self.sessions = {}
+
+    def basic_search_factory(self, type_name, **kwargs):
+        return types.SimpleNamespace(type_name=type_name, **kwargs)
+
+    def search_factory(self, type_name):
+        return types.SimpleNamespace(type_name=type_name)
+
+    def page(self, search_id, page_index):
+        start, _ = self.sessions[search_id]
+        total_records = len(self.records) - start
+        start += (page_index - 1) * self.page_size
+        return types.SimpleNamespace(totalRecords=total_records,
+                                     pageSize=self.page_size,
+                                     totalPages=-(-total_records // self.page_size),
+                                     pageIndex=page_index,
+                                     searchId=search_id,
+                                     records=self.records[start:start + self.page_size])
+
+    def search(self, searchRecord):
+        self.requests += 1
+        self.clock += self.latency
+        after = getattr(searchRecord.basic, 'internalIdNumber', None)
+        start = 0 if after is None else bisect.bisect_right(self.internal_ids, after.searchValue)
+        search_id = len(self.sessions)
+        self.sessions[search_id] = (start, self.clock)
+        return self.page(search_id, 1)
+
+    def searchMoreWithId(self, searchId, pageIndex):
+        self.requests += 1
+        self.clock += self.latency
+        if self.clock - self.sessions[searchId][1] > self.session_seconds:
+            raise SearchExpired('The search has expired, search again')
+        return self.page(searchId, pageIndex)
+
+
+def scan(pages):
+    """Reads pages until done or the search expires, returns the pages read and whether it completed."""
+    read = 0
+    try:
+        for _ in pages:
+            read += 1
+    except SearchExpired:
+        return read, False
+    return read, True
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=200000)
+    parser.add_argument('--page-size', type=int, default=1000)
+    parser.add_argument('--latency', type=float, default=0.5)
+    parser.add_argument('--session-seconds', type=float, default=60)
+    args = parser.parse_args()
+
+    records = [{'internalId': str(internal_id)} for internal_id in range(1, args.records * 2, 2)]
+    total_pages = -(-len(records) // args.page_size)
+    print(f'records: {len(records)} in {total_pages} pages, {args.latency} s per request, '
+          f'search sessions expire after {args.session_seconds:.0f} s')
+
+    for name in ('session', 'keyset'):
+        client = MockClient(records, args.page_size, args.latency, args.session_seconds)
+        entity = SearchEntity(client, EntityDefinition('Account', 'Account', require_lastModified_date=False,
+                                                       page_size=args.page_size))
+        start = time.perf_counter()
+        if name == 'session':
+            read, completed = scan(entity.get_all_generator())
+        else:
+            read, completed = scan(entity.get_all_keyset())
+        elapsed = time.perf_counter() - start
+        outcome = 'completed' if completed else f'expired on page {read + 1}, restarts from page 1'
+        print(f'{name + ":":9} {read} pages, {client.requests} requests, {client.clock:.0f} s simulated, '
+              f'{elapsed * 1000:.0f} ms cpu, {outcome}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Compares syncing the pages of a search one after the other with syncing
+them while the next ones are fetched ahead (PrefetchedPages), for a mocked
+NetSuite answering every page after --latency seconds.
+
+Each page holds a response of --page-kb KB and takes --sync seconds of CPU
+to sync. The time taken is reported for each depth, with the most bytes
+held by the pages fetched ahead, which --max-kb bounds.
+
+    python benchmarks/bench_prefetch.py [--pages 40] [--latency 0.03] [--sync 0.05] [--page-kb 512] [--max-kb 1024]
+"""
+import argparse
+import time
+import types
+
+from tap_netsuite.netsuite.pagination import PrefetchBudget, PrefetchedPages
+
+
+class MockPages:
+    """Pages of page_bytes bytes, each fetched after latency seconds."""
+
+    def __init__(self, pages, latency, page_bytes):
+        self.pages = pages
+        self.latency = latency
+        self.page_bytes = page_bytes
+
+    def __iter__(self):
+        for _ in range(self.pages):
+            time.sleep(self.latency)
+            yield types.SimpleNamespace(content=b'x' * self.page_bytes)
+
+
+def sync(seconds):
+    """Keeps the CPU busy for seconds, as transforming and writing a page does."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def run(args, depth):
+    pages = MockPages(args.pages, args.latency, args.page_kb * 1024)
+    budget = PrefetchBudget(args.max_kb * 1024)
+    peak_bytes = 0
+    start = time.perf_counter()
+    for _ in PrefetchedPages(pages, depth, budget) if depth else pages:
+        sync(args.sync)
+        peak_bytes = max(peak_bytes, budget.held)
+    return time.perf_counter() - start, peak_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--pages', type=int, default=40)
+    parser.add_argument('--latency', type=float, default=0.03)
+    parser.add_argument('--sync', type=float, default=0.05)
+    parser.add_argument('--page-kb', type=int, default=512)
+    parser.add_argument('--max-kb', type=int, default=1024)
+    args = parser.parse_args()
+
+    print(f'{args.pages} pages of {args.page_kb} KB, {args.latency * 1000:.0f} ms to fetch and '
+          f'{args.sync * 1000:.0f} ms to sync a page, {args.max_kb} KB fetched ahead at most')
+    for depth in (0, 1, 4):
+        elapsed, peak_bytes = run(args, depth)
+        print(f'prefetch_pages={depth}: {elapsed:.2f} s, at most {peak_bytes // 1024} KB fetched ahead')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Compares singer's Transformer with the compiled record projector on the
+SalesOrders fixture.
+
+    python benchmarks/bench_projector.py [--number 2000]
+"""
+import argparse
+import json
+import os
+import timeit
+
+import dateutil.parser
+import singer
+from singer import Transformer, metadata
+
+from tap_netsuite import create_property_schema
+from tap_netsuite.netsuite import NetSuite
+from tap_netsuite.projector import compile_projector
+from tap_netsuite.sync import build_field_map, get_internal_name_by_name, transform_data_hook
+
+STREAM = 'SalesOrders'
+FIXTURE = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'salesorders.json')
+
+
+def load_record(ns):
+    with open(FIXTURE) as f:
+        record = json.load(f)[STREAM]
+    # The fixture was dumped with default=str, zeep hands us datetime objects.
+    datetime_fields = {f['name'] for f in ns.describe(STREAM) if f['type'] == 'datetime'}
+    for field, value in record.items():
+        if field in datetime_fields and isinstance(value, str):
+            record[field] = dateutil.parser.parse(value)
+    return record
+
+
+def build_schema(ns):
+    properties = {}
+    mdata = metadata.new()
+    for field in ns.describe(STREAM):
+        properties[field['displayName']], mdata = create_property_schema(field, mdata)
+    # Round trip through JSON like a properties file read by the tap.
+    return json.loads(json.dumps({'type': 'object', 'additionalProperties': False, 'properties': properties}))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=2000)
+    args = parser.parse_args()
+
+    ns = NetSuite()
+    record = load_record(ns)
+    schema = build_schema(ns)
+
+    pre_hook = transform_data_hook(ns, STREAM, schema)
+    field_map, _ = build_field_map(get_internal_name_by_name(ns, STREAM), schema)
+    project = compile_projector(field_map, schema, pre_hook)
+
+    def transformer():
+        with Transformer(pre_hook=pre_hook) as t:
+            return t.transform(dict(record), schema)
+
+    def projector():
+        return project(dict(record))
+
+    expected = singer.format_message(singer.RecordMessage(stream=STREAM, record=transformer()))
+    actual = singer.format_message(singer.RecordMessage(stream=STREAM, record=projector()))
+    assert expected == actual, 'projector output differs from the Transformer output'
+
+    transformer_time = timeit.timeit(transformer, number=args.number)
+    projector_time = timeit.timeit(projector, number=args.number)
+    print(f'records:     {args.number}')
+    print(f'transformer: {transformer_time / args.number * 1e6:.1f} us/record')
+    print(f'projector:   {projector_time / args.number * 1e6:.1f} us/record')
+    print(f'speedup:     {transformer_time / projector_time:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""Checks that the records decoded by decode_search_results are those zeep's
+records serialize to, on the records of tests/data, and times both.
+
+The fixtures are records zeep returned, serialized to JSON. A schema is
+derived from them, shaped like NetSuite's: RecordRefs and custom fields
+(polymorphic through xsi:type, as NetSuite sends them) with attributes,
+sublists of repeated elements, and dateTime, double, long and boolean
+fields. The records are rendered into a search response, which is parsed
+by zeep and by the decoder. Exits with 1 on any difference.
+
+    python benchmarks/bench_search_decoder.py [--records 2000]
+"""
+import argparse
+import datetime
+import itertools
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from xml.sax.saxutils import escape, quoteattr
+
+from zeep import Client
+
+from bench_streaming_search import CORE, XSD, PageTransport, search_response, write_wsdl
+from tap_netsuite.netsuite.decoder import RecordDecoder
+from tap_netsuite.netsuite.streaming import parse_search_response
+from tap_netsuite.sync import serialize_fields
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tests', 'data')
+FIXTURES = ['salesorders.json', 'customer.json', 'journal_entries.json', 'chart_of_accounts.json',
+            'all_other_entities.json']
+FIXTURES_NS = 'urn:fixtures.webservices.netsuite.com'
+
+DATETIME = re.compile(r'^\d{4}-\d\d-\d\d[ T]\d\d:\d\d:\d\d')
+ATTRIBUTES = {'internalId', 'externalId', 'scriptId', 'typeId'}
+# Custom field types by the kind of their value, as in NetSuite's core schema
+CUSTOM_FIELDS = {'string': 'StringCustomFieldRef', 'boolean': 'BooleanCustomFieldRef',
+                 'double': 'DoubleCustomFieldRef', 'long': 'LongCustomFieldRef',
+                 'dateTime': 'DateCustomFieldRef', 'select': 'SelectCustomFieldRef',
+                 'multiSelect': 'MultiSelectCustomFieldRef'}
+
+
+def load_records():
+    """The fixture records by the name of their type, e.g. SalesOrders."""
+    records = {}
+    for fixture in FIXTURES:
+        with open(os.path.join(DATA_DIR, fixture), encoding='utf-8') as f:
+            for name, value in json.load(f).items():
+                type_name = name[0].upper() + name[1:]
+                records.setdefault(type_name, []).extend(value if isinstance(value, list) else [value])
+    return {name: recs for name, recs in records.items() if recs}
+
+
+def kind(value):
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, int):
+        return 'long'
+    if isinstance(value, float):
+        return 'double'
+    if isinstance(value, str):
+        return 'dateTime' if DATETIME.match(value) else 'string'
+    if isinstance(value, dict):
+        return 'select'
+    if isinstance(value, list):
+        return 'multiSelect'
+    return None
+
+
+def merge(shape, value):
+    """Merges the shape of value into shape: a dict of shapes, ['list', shape], an xsd type or None."""
+    if value is None:
+        return shape
+    if isinstance(value, dict):
+        shape = shape if isinstance(shape, dict) else {}
+        for key, child in value.items():
+            # Custom fields have a type of their own for each kind of value
+            shape[key] = 'custom' if key == 'customFieldList' else merge(shape.get(key), child)
+        return shape
+    if isinstance(value, list):
+        shape = shape if isinstance(shape, list) else ['list', None]
+        for item in value:
+            shape[1] = merge(shape[1], item)
+        return shape
+    value_kind = kind(value)
+    if isinstance(shape, (dict, list)):
+        return shape
+    if shape is None or shape == value_kind:
+        return value_kind
+    return 'double' if {shape, value_kind} == {'long', 'double'} else 'string'
+
+
+def is_attribute(key, shape, parent):
+    return shape in (None, 'string') and (key in ATTRIBUTES or (key == 'type' and 'internalId' in parent))
+
+
+class SchemaWriter:
+    """Writes the complex types of the shapes of the fixtures."""
+
+    def __init__(self):
+        self.types = []
+
+    def field_type(self, name, shape):
+        if isinstance(shape, dict):
+            return self.complex_type(name, shape)
+        return f'xsd:{shape or "string"}'
+
+    def complex_type(self, name, shape, base=None):
+        elements, attributes = [], []
+        for key, child in shape.items():
+            if key == 'customFieldList':
+                elements.append(f'<xsd:element name="{key}" type="core:CustomFieldList" minOccurs="0"/>')
+            elif is_attribute(key, child, shape):
+                attributes.append(f'<xsd:attribute name="{key}" type="xsd:string"/>')
+            elif isinstance(child, list):
+                item_type = self.field_type(f'{name}_{key}', child[1])
+                elements.append(f'<xsd:element name="{key}" type="{item_type}" minOccurs="0" '
+                                'maxOccurs="unbounded"/>')
+            else:
+                elements.append(f'<xsd:element name="{key}" type="{self.field_type(f"{name}_{key}", child)}" '
+                                'minOccurs="0"/>')
+        content = f'<xsd:sequence>{"".join(elements)}</xsd:sequence>{"".join(attributes)}'
+        if base:
+            content = (f'<xsd:complexContent><xsd:extension base="{base}">{content}</xsd:extension>'
+                       '</xsd:complexContent>')
+        self.types.append(f'<xsd:complexType name="{name}">{content}</xsd:complexType>')
+        return f'f:{name}'
+
+    def schema(self, shapes):
+        for name, shape in shapes.items():
+            # nullFieldList is an element of core:Record
+            fields = {key: child for key, child in shape.items() if key != 'nullFieldList'}
+            self.complex_type(name, fields, base='core:Record')
+        custom_fields = ''.join(
+            f'<xsd:complexType name="{type_name}"><xsd:complexContent><xsd:extension base="core:CustomFieldRef">'
+            f'<xsd:sequence><xsd:element name="value" type="{custom_field_value_type(value_kind)}" minOccurs="0" '
+            f'maxOccurs="{"unbounded" if value_kind == "multiSelect" else 1}"/></xsd:sequence>'
+            '</xsd:extension></xsd:complexContent></xsd:complexType>'
+            for value_kind, type_name in CUSTOM_FIELDS.items())
+        return (f'<xsd:schema xmlns:xsd="{XSD}" xmlns:core="{CORE}" xmlns:f="{FIXTURES_NS}" '
+                f'targetNamespace="{FIXTURES_NS}" elementFormDefault="qualified">'
+                f'<xsd:import namespace="{CORE}" schemaLocation="core.xsd"/>'
+                f'<xsd:complexType name="ListOrRecordRef"><xsd:sequence><xsd:element name="name" type="xsd:string" '
+                'minOccurs="0"/></xsd:sequence><xsd:attribute name="internalId" type="xsd:string"/>'
+                '<xsd:attribute name="externalId" type="xsd:string"/><xsd:attribute name="typeId" '
+                'type="xsd:string"/></xsd:complexType>'
+                f'{custom_fields}{"".join(self.types)}</xsd:schema>')
+
+
+def custom_field_value_type(value_kind):
+    return 'f:ListOrRecordRef' if value_kind in ('select', 'multiSelect') else f'xsd:{value_kind}'
+
+
+def render_value(value, shape):
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if shape == 'dateTime':
+        return escape(value.replace(' ', 'T', 1))
+    return escape(str(value))
+
+
+def render(name, value, shape):
+    """The XML of the element name holding value."""
+    if value is None:
+        return ''
+    if isinstance(value, list):
+        return ''.join(render(name, item, shape[1]) for item in value)
+    attributes = ''
+    if not isinstance(value, dict):
+        return f'<f:{name}{attributes}>{render_value(value, shape)}</f:{name}>'
+    children = []
+    for key, child in value.items():
+        if key == 'customFieldList':
+            children.append(render_custom_fields(child))
+        elif is_attribute(key, shape.get(key), shape):
+            if child is not None:
+                attributes += f' {key}={quoteattr(str(child))}'
+        else:
+            children.append(render(key, child, shape.get(key)))
+    return f'<f:{name}{attributes}>{"".join(children)}</f:{name}>'
+
+
+def render_custom_fields(custom_field_list):
+    if custom_field_list is None:
+        return ''
+    fields = []
+    for field in custom_field_list.get('customField') or []:
+        value_kind = kind(field['value']) or 'string'
+        value_shape = merge(None, field['value']) if value_kind in ('select', 'multiSelect') else value_kind
+        value = render('value', field['value'], value_shape)
+        attributes = ''.join(f' {key}={quoteattr(field[key])}' for key in ('internalId', 'scriptId') if field.get(key))
+        fields.append(f'<core:customField xsi:type="f:{CUSTOM_FIELDS[value_kind]}"{attributes}>{value}'
+                      '</core:customField>')
+    return f'<f:customFieldList>{"".join(fields)}</f:customFieldList>'
+
+
+def json_value(value):
+    return value.isoformat() if isinstance(value, (datetime.date, datetime.time)) else str(value)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=2000)
+    args = parser.parse_args()
+
+    fixtures = load_records()
+    shapes = {name: {} for name in fixtures}
+    for name, records in fixtures.items():
+        for rec in records:
+            merge(shapes[name], rec)
+    # The records rendered as f:record elements, renamed core:record with their xsi:type
+    records_xml = [f'<core:record xsi:type="f:{name}"{render("record", rec, shapes[name])[len("<f:record"):-len("</f:record>")]}'
+                   '</core:record>' for name, records in fixtures.items() for rec in records]
+
+    with tempfile.TemporaryDirectory() as directory:
+        records_xsd = SchemaWriter().schema(shapes)
+        wsdl = write_wsdl(directory, FIXTURES_NS, records_xsd)
+
+        def search(records_xml, decoder):
+            content = search_response(''.join(records_xml), len(records_xml), f'xmlns:f="{FIXTURES_NS}"')
+            client = Client(wsdl, transport=PageTransport(content))
+            search_record = client.get_type(f'{{{CORE}}}TransactionSearch')()
+            start = time.perf_counter()
+            if decoder:
+                with client.settings(raw_response=True):
+                    response = client.service.search(searchRecord=search_record)
+                result = parse_search_response(response, client.wsdl.types, RecordDecoder(client.wsdl.types))
+            else:
+                result = client.service.search(searchRecord=search_record)
+            records = [serialize_fields(rec, list(rec)) for rec in result.body.searchResult.recordList.record]
+            return records, time.perf_counter() - start
+
+        expected, _ = search(records_xml, decoder=False)
+        decoded, _ = search(records_xml, decoder=True)
+        differences = [(zeep_record, decoded_record) for zeep_record, decoded_record in zip(expected, decoded)
+                       if zeep_record != decoded_record or
+                       json.dumps(zeep_record, default=json_value) != json.dumps(decoded_record, default=json_value)]
+        print(f'parity: {len(decoded)} records of {len(fixtures)} types from tests/data, '
+              f'{len(differences)} differences')
+        for zeep_record, decoded_record in differences[:3]:
+            print('  zeep:    ', json.dumps(zeep_record, default=json_value)[:500])
+            print('  decoded: ', json.dumps(decoded_record, default=json_value)[:500])
+
+        page = list(itertools.islice(itertools.cycle(records_xml), args.records))
+        for name, decoder in (('zeep', False), ('decoded', True)):
+            records, elapsed = search(page, decoder)
+            print(f'{name + ":":9} {len(records)} records in {elapsed:.2f} s')
+
+    if differences or len(decoded) != len(expected):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
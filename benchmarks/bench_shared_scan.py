@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Counts the SOAP requests of syncing several transaction streams with one
+search per stream and with a shared Transaction scan, against a mocked client.
+
+    python benchmarks/bench_shared_scan.py [--records 5000] [--page-size 200]
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import random
+import types
+
+from singer import metadata
+
+import tap_netsuite
+from tap_netsuite import create_property_schema, output
+from tap_netsuite.netsuite import NetSuite
+from tap_netsuite.netsuite.netsuite_connection import ExtendedNetSuiteConnection
+from tap_netsuite.netsuite.transaction_entities import (ENTITY_DEFINITIONS, SEARCH_ENTITIES, TRANSACTION_TYPES,
+                                                        TransactionScan)
+
+START_DATE = '2021-01-01T00:00:00Z'
+STREAMS = ['SalesOrders', 'Invoice', 'CreditMemos', 'Estimate', 'CashSale', 'PurchaseOrder', 'ItemFulfillment',
+           'ItemReceipt', 'CustomerPayment', 'CustomerDeposit', 'VendorCredit', 'Deposit', 'JournalEntry',
+           'InterCompanyJournalEntry']
+
+
+class MockClient:
+    """Answers search and searchMoreWithId from an in-memory Transaction table."""
+
+    page_fetch_workers = 1
+
+    def __init__(self, records, page_size):
+        self.records = records
+        self.page_size = page_size
+        self.calls = {'search': 0, 'searchMoreWithId': 0}
+        self.results = {}
+
+    SearchStringField = types.SimpleNamespace
+    SearchEnumMultiSelectField = types.SimpleNamespace
+
+    def basic_search_factory(self, type_name, **kwargs):
+        return types.SimpleNamespace(type_name=type_name, **kwargs)
+
+    def search_factory(self, type_name):
+        return types.SimpleNamespace(type_name=type_name)
+
+    def matches(self, basic, rec):
+        record_type = type(rec).__name__
+        if getattr(basic, 'recordType', None) is not None and basic.recordType.searchValue not in record_type:
+            return False
+        if getattr(basic, 'type', None) is not None and TRANSACTION_TYPES[record_type] not in basic.type.searchValue:
+            return False
+        since = datetime.datetime.fromisoformat(basic.lastModifiedDate['searchValue'].replace('Z', '+00:00'))
+        return rec['lastModifiedDate'] >= since
+
+    def page(self, search_id, page_index):
+        records = self.results[search_id]
+        return types.SimpleNamespace(totalRecords=len(records),
+                                     pageSize=self.page_size,
+                                     totalPages=-(-len(records) // self.page_size),
+                                     pageIndex=page_index,
+                                     searchId=search_id,
+                                     records=records[(page_index - 1) * self.page_size:page_index * self.page_size])
+
+    def search(self, searchRecord):
+        self.calls['search'] += 1
+        search_id = len(self.results)
+        self.results[search_id] = [rec for rec in self.records if self.matches(searchRecord.basic, rec)]
+        return self.page(search_id, 1)
+
+    def searchMoreWithId(self, searchId, pageIndex):
+        self.calls['searchMoreWithId'] += 1
+        return self.page(searchId, pageIndex)
+
+
+class MockConnection(ExtendedNetSuiteConnection):
+    def __init__(self, client):  # pylint: disable=super-init-not-called
+        self.client = client
+        self.transaction_scan = TransactionScan(client)
+        self.entities = {stream: SEARCH_ENTITIES[stream](client) for stream in STREAMS}
+
+
+def make_records(count):
+    rng = random.Random(0)
+    record_types = [ENTITY_DEFINITIONS[stream].record_type for stream in STREAMS]
+    record_classes = {record_type: type(record_type, (dict,), {}) for record_type in record_types}
+    start = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+    records = []
+    for internal_id in range(count):
+        record_class = rng.choice(list(record_classes.values()))
+        records.append(record_class(internalId=str(internal_id),
+                                    lastModifiedDate=start + datetime.timedelta(minutes=internal_id)))
+    return records
+
+
+def catalog_entry(ns, stream):
+    properties = {}
+    mdata = metadata.new()
+    for field in ns.describe(stream):
+        properties[field['displayName']], mdata = create_property_schema(field, mdata)
+        mdata = metadata.write(mdata, ('properties', field['displayName']), 'selected-by-default', True)
+    mdata = metadata.write(mdata, (), 'selected', True)
+    mdata = metadata.write(mdata, (), 'replication-key', 'lastModifiedDate')
+    mdata = metadata.write(mdata, (), 'replication-method', 'INCREMENTAL')
+    mdata = metadata.write(mdata, (), 'table-key-properties', ['Id'])
+    return {'stream': stream,
+            'tap_stream_id': stream,
+            'schema': {'type': 'object', 'additionalProperties': False, 'properties': properties},
+            'metadata': metadata.to_list(mdata)}
+
+
+def sync(records, page_size, shared_transaction_scan):
+    client = MockClient(records, page_size)
+    ns = NetSuite(default_start_date=START_DATE, shared_transaction_scan=shared_transaction_scan)
+    ns.ns_client = MockConnection(client)
+    catalog = {'streams': [catalog_entry(ns, stream) for stream in STREAMS]}
+
+    stdout = io.StringIO()
+    with contextlib.redirect_stdout(stdout):
+        output.configure()
+        tap_netsuite.do_sync(ns, catalog, {})
+        output.flush()
+
+    records_by_stream = {}
+    for line in stdout.getvalue().splitlines():
+        message = json.loads(line)
+        if message['type'] == 'RECORD':
+            records_by_stream.setdefault(message['stream'], []).append(message['record']['Id'])
+    return client.calls, records_by_stream
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=5000)
+    parser.add_argument('--page-size', type=int, default=200)
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+    separate_calls, separate_records = sync(records, args.page_size, shared_transaction_scan=False)
+    shared_calls, shared_records = sync(records, args.page_size, shared_transaction_scan=True)
+    assert separate_records == shared_records, 'the shared scan synced different records'
+
+    print(f'streams:     {len(STREAMS)}')
+    print(f'records:     {args.records}')
+    print(f'separate:    {separate_calls["search"]} search, {separate_calls["searchMoreWithId"]} searchMoreWithId')
+    print(f'shared scan: {shared_calls["search"]} search, {shared_calls["searchMoreWithId"]} searchMoreWithId')
+    print(f'requests:    {sum(separate_calls.values())} -> {sum(shared_calls.values())}')
+
+
+if __name__ == '__main__':
+    main()
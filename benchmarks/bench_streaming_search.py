@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Compares the peak memory and time of syncing a search page parsed by zeep
+with the same page parsed a record at a time (stream_search_results), for a
+generated WSDL shaped like NetSuite's search and a page of sales orders
+with --lines item lines each.
+
+Each mode runs in a process of its own and reports its peak RSS, which
+includes the memory of the lxml trees.
+
+    python benchmarks/bench_streaming_search.py [--records 1000] [--lines 40]
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import requests
+from zeep import Client
+from zeep.helpers import serialize_object
+from zeep.transports import Transport
+
+from tap_netsuite.netsuite.streaming import parse_search_response
+
+XSD = 'http://www.w3.org/2001/XMLSchema'
+CORE = 'urn:core_2019_1.platform.webservices.netsuite.com'
+MESSAGES = 'urn:messages_2019_1.platform.webservices.netsuite.com'
+SALES = 'urn:sales_2019_1.transactions.webservices.netsuite.com'
+
+CORE_XSD = f'''<schema xmlns="{XSD}" xmlns:core="{CORE}" targetNamespace="{CORE}" elementFormDefault="qualified">
+<complexType name="Record" abstract="true"><sequence>
+<element name="nullFieldList" type="string" minOccurs="0"/></sequence></complexType>
+<complexType name="RecordRef"><sequence><element name="name" type="string" minOccurs="0"/></sequence>
+<attribute name="internalId" type="string"/><attribute name="type" type="string"/></complexType>
+<complexType name="StatusDetail"><sequence><element name="code" type="string"/>
+<element name="message" type="string"/></sequence></complexType>
+<complexType name="Status"><sequence><element name="statusDetail" type="core:StatusDetail" minOccurs="0"
+maxOccurs="unbounded"/></sequence><attribute name="isSuccess" type="boolean" use="required"/></complexType>
+<complexType name="RecordList"><sequence><element name="record" type="core:Record" minOccurs="0"
+maxOccurs="unbounded"/></sequence></complexType>
+<complexType name="SearchResult"><sequence><element ref="core:status"/>
+<element name="totalRecords" type="int" minOccurs="0"/><element name="pageSize" type="int" minOccurs="0"/>
+<element name="totalPages" type="int" minOccurs="0"/><element name="pageIndex" type="int" minOccurs="0"/>
+<element name="searchId" type="string" minOccurs="0"/>
+<element name="recordList" type="core:RecordList" minOccurs="0"/></sequence></complexType>
+<complexType name="CustomFieldRef" abstract="true"><sequence/>
+<attribute name="internalId" type="string"/><attribute name="scriptId" type="string"/></complexType>
+<complexType name="CustomFieldList"><sequence><element name="customField" type="core:CustomFieldRef"
+minOccurs="0" maxOccurs="unbounded"/></sequence></complexType>
+<complexType name="SearchRecord" abstract="true"><sequence/></complexType>
+<complexType name="TransactionSearch"><complexContent><extension base="core:SearchRecord"><sequence/>
+</extension></complexContent></complexType>
+<element name="status" type="core:Status"/>
+<element name="searchResult" type="core:SearchResult"/>
+</schema>'''
+
+SALES_XSD = f'''<schema xmlns="{XSD}" xmlns:sales="{SALES}" xmlns:core="{CORE}" targetNamespace="{SALES}"
+elementFormDefault="qualified"><import namespace="{CORE}" schemaLocation="core.xsd"/>
+<complexType name="SalesOrderItem"><sequence><element name="item" type="core:RecordRef" minOccurs="0"/>
+<element name="line" type="long" minOccurs="0"/><element name="quantity" type="double" minOccurs="0"/>
+<element name="description" type="string" minOccurs="0"/></sequence></complexType>
+<complexType name="SalesOrderItemList"><sequence><element name="item" type="sales:SalesOrderItem" minOccurs="0"
+maxOccurs="unbounded"/></sequence></complexType>
+<complexType name="SalesOrder"><complexContent><extension base="core:Record"><sequence>
+<element name="lastModifiedDate" type="dateTime" minOccurs="0"/>
+<element name="entity" type="core:RecordRef" minOccurs="0"/><element name="total" type="double" minOccurs="0"/>
+<element name="memo" type="string" minOccurs="0"/>
+<element name="itemList" type="sales:SalesOrderItemList" minOccurs="0"/></sequence>
+<attribute name="internalId" type="string"/></extension></complexContent></complexType>
+</schema>'''
+
+MESSAGES_XSD = f'''<schema xmlns="{XSD}" xmlns:msg="{MESSAGES}" xmlns:core="{CORE}" targetNamespace="{MESSAGES}"
+elementFormDefault="qualified"><import namespace="{CORE}" schemaLocation="core.xsd"/>
+<import namespace="{{records_namespace}}" schemaLocation="records.xsd"/>
+<complexType name="DocumentInfo"><sequence><element name="nsId" type="string"/></sequence></complexType>
+<complexType name="SearchRequest"><sequence><element name="searchRecord" type="core:SearchRecord"/></sequence>
+</complexType><complexType name="SearchResponse"><sequence><element ref="core:searchResult"/></sequence>
+</complexType><element name="documentInfo" type="msg:DocumentInfo"/>
+<element name="search" type="msg:SearchRequest"/><element name="searchResponse" type="msg:SearchResponse"/>
+</schema>'''
+
+WSDL = f'''<definitions xmlns="http://schemas.xmlsoap.org/wsdl/" xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/"
+xmlns:tns="urn:platform" xmlns:msg="{MESSAGES}" targetNamespace="urn:platform">
+<types><schema xmlns="{XSD}"><import namespace="{MESSAGES}" schemaLocation="messages.xsd"/></schema></types>
+<message name="searchRequest"><part name="parameters" element="msg:search"/></message>
+<message name="searchResponse"><part name="searchResponse" element="msg:searchResponse"/></message>
+<message name="documentInfo"><part name="documentInfo" element="msg:documentInfo"/></message>
+<portType name="NetSuitePortType"><operation name="search"><input message="tns:searchRequest"/>
+<output message="tns:searchResponse"/></operation></portType>
+<binding name="NetSuiteBinding" type="tns:NetSuitePortType">
+<soap:binding style="document" transport="http://schemas.xmlsoap.org/soap/http"/>
+<operation name="search"><soap:operation soapAction="search"/><input><soap:body use="literal"/></input>
+<output><soap:body use="literal"/><soap:header message="tns:documentInfo" part="documentInfo" use="literal"/>
+</output></operation></binding>
+<service name="NetSuiteService"><port name="NetSuitePort" binding="tns:NetSuiteBinding">
+<soap:address location="http://localhost/services/NetSuitePort"/></port></service>
+</definitions>'''
+
+
+def write_wsdl(directory, records_namespace, records_xsd):
+    """Writes the WSDL of a NetSuite search returning the records of records_xsd, returns its path."""
+    for name, content in (('core.xsd', CORE_XSD), ('records.xsd', records_xsd),
+                          ('messages.xsd', MESSAGES_XSD.replace('{records_namespace}', records_namespace)),
+                          ('netsuite.wsdl', WSDL)):
+        with open(os.path.join(directory, name), 'w', encoding='utf-8') as f:
+            f.write(content)
+    return os.path.join(directory, 'netsuite.wsdl')
+
+
+def search_response(records, count, namespaces=''):
+    """The SOAP response of a search returning the XML of count records, in a single page."""
+    return ('<?xml version="1.0" encoding="UTF-8"?><soapenv:Envelope '
+            'xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" '
+            'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"><soapenv:Header>'
+            f'<msg:documentInfo xmlns:msg="{MESSAGES}"><msg:nsId>bench</msg:nsId></msg:documentInfo>'
+            f'</soapenv:Header><soapenv:Body><searchResponse xmlns="{MESSAGES}">'
+            f'<core:searchResult xmlns:core="{CORE}" {namespaces}>'
+            f'<core:status isSuccess="true"/><core:totalRecords>{count}</core:totalRecords>'
+            f'<core:pageSize>{count}</core:pageSize><core:totalPages>1</core:totalPages>'
+            '<core:pageIndex>1</core:pageIndex><core:searchId>WEBSERVICES_bench</core:searchId>'
+            f'<core:recordList>{records}</core:recordList></core:searchResult></searchResponse>'
+            '</soapenv:Body></soapenv:Envelope>').encode()
+
+
+def search_page(records, lines):
+    parts = []
+    for i in range(records):
+        items = ''.join(f'<sales:item><sales:item internalId="{j}"><core:name>Item {j}</core:name></sales:item>'
+                        f'<sales:line>{j + 1}</sales:line><sales:quantity>{j}.5</sales:quantity>'
+                        f'<sales:description>Line {j} of order {i}</sales:description></sales:item>'
+                        for j in range(lines))
+        parts.append(f'<core:record xsi:type="sales:SalesOrder" internalId="{i + 1}">'
+                     f'<sales:lastModifiedDate>2024-01-01T10:00:00.000-08:00</sales:lastModifiedDate>'
+                     f'<sales:entity internalId="7"><core:name>Customer</core:name></sales:entity>'
+                     f'<sales:total>{i}.25</sales:total><sales:memo>Order {i}</sales:memo>'
+                     f'<sales:itemList>{items}</sales:itemList></core:record>')
+    return search_response(''.join(parts), records, f'xmlns:sales="{SALES}"')
+
+
+class PageTransport(Transport):
+    """Answers every request with the same search page."""
+
+    def __init__(self, content):
+        super().__init__()
+        self.content = content
+
+    def post_xml(self, address, envelope, headers):
+        response = requests.models.Response()
+        response.status_code = 200
+        response.headers['Content-Type'] = 'text/xml; charset=utf-8'
+        response._content = self.content  # pylint: disable=protected-access
+        return response
+
+
+def run(mode, directory, records, lines):
+    """Searches the page and serializes its records as sync_records does, prints the peak RSS and seconds."""
+    client = Client(os.path.join(directory, 'netsuite.wsdl'), transport=PageTransport(search_page(records, lines)))
+    search_record = client.get_type(f'{{{CORE}}}TransactionSearch')()
+    start = time.perf_counter()
+    if mode == 'zeep':
+        result = client.service.search(searchRecord=search_record).body.searchResult
+    else:
+        with client.settings(raw_response=True):
+            response = client.service.search(searchRecord=search_record)
+        result = parse_search_response(response, client.wsdl.types).body.searchResult
+    written = sum(1 for rec in result.recordList.record if serialize_object(rec, dict))
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f'{mode + ":":9} {written} records in {elapsed:.2f} s, peak RSS {peak / 1024:.0f} MB')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=1000)
+    parser.add_argument('--lines', type=int, default=40)
+    parser.add_argument('--mode', choices=['zeep', 'streamed'])
+    parser.add_argument('--directory')
+    args = parser.parse_args()
+
+    if args.mode:
+        run(args.mode, args.directory, args.records, args.lines)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_wsdl(directory, SALES, SALES_XSD)
+        size = len(search_page(args.records, args.lines))
+        print(f'page: {args.records} sales orders of {args.lines} lines, {size / 2 ** 20:.1f} MB of XML')
+        for mode in ('zeep', 'streamed'):
+            subprocess.run([sys.executable, __file__, '--mode', mode, '--directory', directory,
+                            '--records', str(args.records), '--lines', str(args.lines)], check=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Times parsing a WSDL against loading it from a pre-parsed bundle, for a
+generated WSDL shaped like NetSuite's: records extending Record, with their
+fields, line lists and record refs, in an XSD imported by the WSDL.
+
+    python benchmarks/bench_wsdl_bundle.py [--types 1500]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import zeep
+
+from tap_netsuite.netsuite.wsdl_cache import load_bundle, save_bundle
+
+XSD = 'http://www.w3.org/2001/XMLSchema'
+FIELD_TYPES = ['xsd:string', 'xsd:double', 'xsd:dateTime', 'xsd:boolean', 'core:RecordRef']
+
+
+def core_schema(types):
+    rng = random.Random(0)
+    parts = [f'<xsd:schema xmlns:xsd="{XSD}" xmlns:core="urn:core" targetNamespace="urn:core" '
+             'elementFormDefault="qualified">',
+             '<xsd:complexType name="Record" abstract="true"><xsd:sequence>'
+             '<xsd:element name="nullFieldList" type="xsd:string" minOccurs="0"/></xsd:sequence>'
+             '<xsd:attribute name="internalId" type="xsd:string"/></xsd:complexType>',
+             '<xsd:complexType name="RecordRef"><xsd:sequence>'
+             '<xsd:element name="name" type="xsd:string" minOccurs="0"/></xsd:sequence>'
+             '<xsd:attribute name="internalId" type="xsd:string"/></xsd:complexType>']
+    for i in range(types):
+        fields = ''.join(f'<xsd:element name="field{j}" type="{rng.choice(FIELD_TYPES)}" minOccurs="0"/>'
+                         for j in range(rng.randint(5, 40)))
+        parts.append(f'<xsd:complexType name="Record{i}"><xsd:complexContent><xsd:extension base="core:Record">'
+                     f'<xsd:sequence>{fields}<xsd:element name="lineList" type="core:Record{i}LineList" '
+                     'minOccurs="0"/></xsd:sequence></xsd:extension></xsd:complexContent></xsd:complexType>')
+        parts.append(f'<xsd:complexType name="Record{i}LineList"><xsd:sequence><xsd:element name="line" '
+                     'type="core:RecordRef" minOccurs="0" maxOccurs="unbounded"/></xsd:sequence></xsd:complexType>')
+    parts.append('</xsd:schema>')
+    return '\n'.join(parts)
+
+
+WSDL = f'''<?xml version="1.0"?>
+<definitions xmlns="http://schemas.xmlsoap.org/wsdl/" xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/"
+             xmlns:core="urn:core" xmlns:tns="urn:service" xmlns:xsd="{XSD}" targetNamespace="urn:service">
+<types><xsd:schema targetNamespace="urn:service" elementFormDefault="qualified">
+<xsd:import namespace="urn:core" schemaLocation="core.xsd"/>
+<xsd:element name="get"><xsd:complexType><xsd:sequence><xsd:element name="baseRef" type="core:RecordRef"/>
+</xsd:sequence></xsd:complexType></xsd:element>
+</xsd:schema></types>
+<message name="getRequest"><part name="parameters" element="tns:get"/></message>
+<portType name="Port"><operation name="get"><input message="tns:getRequest"/></operation></portType>
+<binding name="Binding" type="tns:Port"><soap:binding style="document" transport="http://schemas.xmlsoap.org/soap/http"/>
+<operation name="get"><soap:operation soapAction="get"/><input><soap:body use="literal"/></input></operation></binding>
+<service name="Service"><port name="port" binding="tns:Binding"><soap:address location="http://localhost/"/></port></service>
+</definitions>'''
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--types', type=int, default=1500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        wsdl_path = os.path.join(directory, 'wsdl', 'netsuite.wsdl')
+        bundle_path = os.path.join(directory, 'netsuite-wsdl.bundle')
+        os.makedirs(os.path.dirname(wsdl_path))
+        with open(os.path.join(directory, 'wsdl', 'core.xsd'), 'w') as f:
+            f.write(core_schema(args.types))
+        with open(wsdl_path, 'w') as f:
+            f.write(WSDL)
+
+        start = time.perf_counter()
+        client = zeep.Client(wsdl_path)
+        parse_time = time.perf_counter() - start
+
+        save_bundle(client.wsdl, wsdl_path, bundle_path)
+        start = time.perf_counter()
+        document = load_bundle(wsdl_path, bundle_path)
+        load_time = time.perf_counter() - start
+        assert len(list(document.types.types)) == len(list(client.wsdl.types.types))
+
+        print(f'types:   {len(list(document.types.types))}')
+        print(f'bundle:  {os.path.getsize(bundle_path) / 2 ** 20:.1f} MiB')
+        print(f'parse:   {parse_time * 1000:.0f} ms')
+        print(f'load:    {load_time * 1000:.0f} ms')
+        print(f'speedup: {parse_time / load_time:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
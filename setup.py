@@ -19,13 +19,17 @@ setup(
         'jsonschema==2.6.0',
         'pytz==2018.4'
     ],
+    extras_require={
+        'orjson': ['orjson'],
+        'async': ['httpx']
+    },
     entry_points='''
         [console_scripts]
         tap-netsuite=tap_netsuite:main
     ''',
     packages=find_packages(exclude=['tests']),
     package_data={
-        'tap_netsuite.netsuite': ['schemas/*.json']
+        'tap_netsuite.netsuite': ['schemas/*.json', 'schemas/*.idx']
     },
     include_package_data=True,
 )
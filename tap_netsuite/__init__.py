@@ -1,12 +1,19 @@
 #!/usr/bin/env python3
+import copy
+import functools
 import json
 import sys
+import threading
+from concurrent import futures
 import singer
 import singer.utils as singer_utils
 from singer import metadata, metrics
 import tap_netsuite.netsuite as netsuite
 from tap_netsuite.netsuite import NetSuite
+from tap_netsuite.netsuite.checkpoint import CHECKPOINT_KEYS
 from tap_netsuite.netsuite.exceptions import TapNetSuiteException, TapNetSuiteQuotaExceededException
+from tap_netsuite.netsuite.retry import RETRY_STATS, stream_context
+from tap_netsuite import output
 from tap_netsuite.sync import (sync_stream, get_stream_version)
 
 LOGGER = singer.get_logger()
@@ -65,14 +72,12 @@ def build_state(raw_state, catalog):
                                       tap_stream_id,
                                       'version')
 
-        # Preserve state that deals with resuming an incomplete bulk job
+        # Preserve the checkpoint of an interrupted search, see netsuite.checkpoint
         if singer.get_bookmark(raw_state, tap_stream_id, 'JobID'):
-            job_id = singer.get_bookmark(raw_state, tap_stream_id, 'JobID')
-            batches = singer.get_bookmark(raw_state, tap_stream_id, 'BatchIDs')
-            current_bookmark = singer.get_bookmark(raw_state, tap_stream_id, 'JobHighestBookmarkSeen')
-            state = singer.write_bookmark(state, tap_stream_id, 'JobID', job_id)
-            state = singer.write_bookmark(state, tap_stream_id, 'BatchIDs', batches)
-            state = singer.write_bookmark(state, tap_stream_id, 'JobHighestBookmarkSeen', current_bookmark)
+            for key in CHECKPOINT_KEYS:
+                value = singer.get_bookmark(raw_state, tap_stream_id, key)
+                if value is not None:
+                    state = singer.write_bookmark(state, tap_stream_id, key, value)
 
         if replication_method == 'INCREMENTAL':
             replication_key = catalog_metadata.get((), {}).get('replication-key')
@@ -87,10 +92,118 @@ def build_state(raw_state, catalog):
                     state, tap_stream_id, replication_key, replication_key_value)
         elif replication_method == 'FULL_TABLE' and version is None:
             state = singer.write_bookmark(state, tap_stream_id, 'version', version)
+        elif replication_method == 'FULL_TABLE' and singer.get_bookmark(state, tap_stream_id,
+                                                                         'LastInternalId') is not None:
+            # The sync resumed after its last internalId keeps writing the same version
+            state = singer.write_bookmark(state, tap_stream_id, 'version', version)
+
+    return state
+
+
+class StreamStateMerger:
+    """Merges the bookmarks of streams synced concurrently into one STATE.
+
+    Every worker syncs against its own copy of the stream's bookmarks. When a
+    worker writes its state, its bookmarks are copied into the merged state,
+    which is written with current_stream set to the first stream (in catalog
+    order) that has not completed. Resuming from it re-syncs every stream
+    that may not have finished, from its own bookmarks."""
+
+    def __init__(self, state, tap_stream_ids):
+        self.state = state
+        self.pending = list(tap_stream_ids)
+        self.lock = threading.Lock()
+
+    def stream_state(self, tap_stream_id):
+        with self.lock:
+            stream_state = {}
+            bookmark = self.state.get('bookmarks', {}).get(tap_stream_id)
+            if bookmark is not None:
+                stream_state['bookmarks'] = {tap_stream_id: copy.deepcopy(bookmark)}
+            return stream_state
+
+    def write_state(self, tap_stream_id, stream_state):
+        with self.lock:
+            bookmark = stream_state.get('bookmarks', {}).get(tap_stream_id)
+            if bookmark is not None:
+                self.state.setdefault('bookmarks', {})[tap_stream_id] = copy.deepcopy(bookmark)
+            self.state['current_stream'] = self.pending[0] if self.pending else None
+            output.write_state(self.state)
+
+    def complete(self, tap_stream_id, stream_state):
+        with self.lock:
+            self.pending.remove(tap_stream_id)
+        self.write_state(tap_stream_id, stream_state)
+
+
+def sync_catalog_entry(ns, catalog_entry, state, write_state=output.write_state):
+    stream_version = get_stream_version(catalog_entry, state)
+    stream = catalog_entry['stream']
+    stream_alias = catalog_entry.get('stream_alias')
+    stream_name = catalog_entry["tap_stream_id"]
+    activate_version_message = singer.ActivateVersionMessage(
+        stream=(stream_alias or stream), version=stream_version)
+
+    catalog_metadata = metadata.to_map(catalog_entry['metadata'])
+    replication_key = catalog_metadata.get((), {}).get('replication-key')
+
+    key_properties = metadata.to_map(catalog_entry['metadata']).get((), {}).get('table-key-properties')
+    output.write_schema(
+        stream,
+        catalog_entry['schema'],
+        key_properties,
+        replication_key,
+        stream_alias)
+
+    # Tables with a replication_key or an empty bookmark will emit an
+    # activate_version at the beginning of their sync
+    bookmark_is_empty = state.get('bookmarks', {}).get(
+        catalog_entry['tap_stream_id']) is None
+
+    if replication_key or bookmark_is_empty:
+        output.write_message(activate_version_message)
+        state = singer.write_bookmark(state,
+                                      catalog_entry['tap_stream_id'],
+                                      'version',
+                                      stream_version)
+    with stream_context(stream_name):
+        counter = sync_stream(ns, catalog_entry, state, write_state)
+    LOGGER.info("%s: Completed sync (%s rows)", stream_name, counter.value)
+    RETRY_STATS.log(stream_name)
 
     return state
 
 
+def sync_concurrently(ns, catalog_entries, merger, max_workers):
+    """Syncs the catalog entries on a pool of max_workers workers.
+
+    Messages from all workers go through the single output writer and the
+    stream bookmarks are merged into one STATE by the StreamStateMerger."""
+    def sync_entry(catalog_entry):
+        tap_stream_id = catalog_entry['tap_stream_id']
+        stream_state = merger.stream_state(tap_stream_id)
+        stream_state = sync_catalog_entry(ns, catalog_entry, stream_state,
+                                          functools.partial(merger.write_state, tap_stream_id))
+        merger.complete(tap_stream_id, stream_state)
+
+    LOGGER.info("Syncing %s streams with %s workers", len(catalog_entries), max_workers)
+    executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+    pending = [executor.submit(sync_entry, catalog_entry) for catalog_entry in catalog_entries]
+    try:
+        for future in futures.as_completed(pending):
+            future.result()
+    except Exception:
+        # Streams already running stop after the page they are writing and
+        # keep their checkpoints, the ones not started yet are dropped.
+        # Streams reading from a shared search that has lost a reader could
+        # wait on it forever.
+        ns.stop_streams.set()
+        ns.stop_shared_scans()
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+
+
 def do_sync(ns, catalog, state):
     starting_stream = state.get("current_stream")
 
@@ -99,17 +212,9 @@ def do_sync(ns, catalog, state):
     else:
         LOGGER.info("Starting sync")
 
+    catalog_entries = []
     for catalog_entry in catalog["streams"]:
-        stream_version = get_stream_version(catalog_entry, state)
-        stream = catalog_entry['stream']
-        stream_alias = catalog_entry.get('stream_alias')
         stream_name = catalog_entry["tap_stream_id"]
-        activate_version_message = singer.ActivateVersionMessage(
-            stream=(stream_alias or stream), version=stream_version)
-
-        catalog_metadata = metadata.to_map(catalog_entry['metadata'])
-        replication_key = catalog_metadata.get((), {}).get('replication-key')
-
         mdata = metadata.to_map(catalog_entry['metadata'])
 
         if not stream_is_selected(mdata):
@@ -126,53 +231,31 @@ def do_sync(ns, catalog, state):
         else:
             LOGGER.info("%s: Starting", stream_name)
 
-        state["current_stream"] = stream_name
-        singer.write_state(state)
-        key_properties = metadata.to_map(catalog_entry['metadata']).get((), {}).get('table-key-properties')
-        singer.write_schema(
-            stream,
-            catalog_entry['schema'],
-            key_properties,
-            replication_key,
-            stream_alias)
-
-        job_id = singer.get_bookmark(state, catalog_entry['tap_stream_id'], 'JobID')
-        if job_id:
-            with metrics.record_counter(stream) as counter:
-                # Remove Job info from state once we complete this resumed query. One of a few cases could have occurred:
-                # 1. The job succeeded, in which case make JobHighestBookmarkSeen the new bookmark
-                # 2. The job partially completed, in which case make JobHighestBookmarkSeen the new bookmark, or
-                #    existing bookmark if no bookmark exists for the Job.
-                # 3. The job completely failed, in which case maintain the existing bookmark, or None if no bookmark
-                state.get('bookmarks', {}).get(catalog_entry['tap_stream_id'], {}).pop('JobID', None)
-                state.get('bookmarks', {}).get(catalog_entry['tap_stream_id'], {}).pop('BatchIDs', None)
-                bookmark = state.get('bookmarks', {}).get(catalog_entry['tap_stream_id'], {}) \
-                    .pop('JobHighestBookmarkSeen', None)
-                existing_bookmark = state.get('bookmarks', {}).get(catalog_entry['tap_stream_id'], {}) \
-                    .pop(replication_key, None)
-                state = singer.write_bookmark(
-                    state,
-                    catalog_entry['tap_stream_id'],
-                    replication_key,
-                    bookmark or existing_bookmark)  # If job is removed, reset to existing bookmark or None
-                singer.write_state(state)
-        else:
-            # Tables with a replication_key or an empty bookmark will emit an
-            # activate_version at the beginning of their sync
-            bookmark_is_empty = state.get('bookmarks', {}).get(
-                catalog_entry['tap_stream_id']) is None
-
-            if replication_key or bookmark_is_empty:
-                singer.write_message(activate_version_message)
-                state = singer.write_bookmark(state,
-                                              catalog_entry['tap_stream_id'],
-                                              'version',
-                                              stream_version)
-            counter = sync_stream(ns, catalog_entry, state)
-            LOGGER.info("%s: Completed sync (%s rows)", stream_name, counter.value)
+        catalog_entries.append(catalog_entry)
+
+    shared_scan_entries = ns.start_shared_scans(catalog_entries, state)
+
+    if shared_scan_entries or (ns.max_concurrent_streams > 1 and len(catalog_entries) > 1):
+        tap_stream_ids = [catalog_entry['tap_stream_id'] for catalog_entry in catalog_entries]
+        merger = StreamStateMerger(state, tap_stream_ids)
+        merger.write_state(tap_stream_ids[0], {})
+        if shared_scan_entries:
+            # Every stream reading from a shared search must be consumed at
+            # once, they make no requests of their own.
+            sync_concurrently(ns, shared_scan_entries, merger, len(shared_scan_entries))
+            catalog_entries = [catalog_entry for catalog_entry in catalog_entries
+                               if catalog_entry not in shared_scan_entries]
+        if catalog_entries:
+            sync_concurrently(ns, catalog_entries, merger, ns.max_concurrent_streams)
+    else:
+        for catalog_entry in catalog_entries:
+            state["current_stream"] = catalog_entry["tap_stream_id"]
+            output.write_state(state)
+            state = sync_catalog_entry(ns, catalog_entry, state)
 
     state["current_stream"] = None
-    singer.write_state(state)
+    output.write_state(state)
+    RETRY_STATS.log_all()
     LOGGER.info("Finished sync")
 
 
@@ -250,12 +333,25 @@ def do_discover(ns):
     json.dump(result, sys.stdout, indent=4)
 
 
+def parse_warm_cache_arg():
+    """--warm-cache is not a Singer option, it is taken out of the arguments Singer parses."""
+    if '--warm-cache' not in sys.argv:
+        return False
+    sys.argv.remove('--warm-cache')
+    return True
+
+
 def main_impl():
+    warm_cache = parse_warm_cache_arg()
     args = singer_utils.parse_args(REQUIRED_CONFIG_KEYS)
 
     CONFIG.update(args.config)
     LOGGER.debug(f"NetSuite CONFIG IS {json.dumps(CONFIG)}")
 
+    output.configure(buffer_size=CONFIG.get('output_buffer_size'),
+                     flush_interval=CONFIG.get('output_flush_interval'),
+                     use_orjson=netsuite.parse_bool(CONFIG.get('use_orjson')))
+
     ns = None
     try:
         ns = NetSuite(ns_account=CONFIG.get('ns_account'),
@@ -265,7 +361,37 @@ def main_impl():
                       ns_token_secret=CONFIG.get('ns_token_secret'),
                       is_sandbox=CONFIG.get('is_sandbox'),
                       default_start_date=CONFIG.get('start_date'),
-                      select_fields_by_default=CONFIG.get('select_fields_by_default'), )
+                      select_fields_by_default=CONFIG.get('select_fields_by_default'),
+                      use_record_projector=CONFIG.get('use_record_projector'),
+                      max_concurrent_streams=CONFIG.get('max_concurrent_streams'),
+                      concurrency_limit=CONFIG.get('concurrency_limit'),
+                      page_fetch_workers=CONFIG.get('page_fetch_workers'),
+                      backfill_window_days=CONFIG.get('backfill_window_days'),
+                      backfill_max_window_records=CONFIG.get('backfill_max_window_records'),
+                      backfill_workers=CONFIG.get('backfill_workers'),
+                      shared_transaction_scan=CONFIG.get('shared_transaction_scan'),
+                      shared_item_scan=CONFIG.get('shared_item_scan'),
+                      header_only_streams=CONFIG.get('header_only_streams'),
+                      keyset_pagination_streams=CONFIG.get('keyset_pagination_streams'),
+                      full_table_partitions=CONFIG.get('full_table_partitions'),
+                      full_table_workers=CONFIG.get('full_table_workers'),
+                      full_table_ordered=CONFIG.get('full_table_ordered'),
+                      wsdl_cache_dir=CONFIG.get('wsdl_cache_dir'),
+                      wsdl_bundle=CONFIG.get('wsdl_bundle'),
+                      request_slots_dir=CONFIG.get('request_slots_dir'),
+                      max_retries=CONFIG.get('max_retries'),
+                      retry_max_seconds=CONFIG.get('retry_max_seconds'),
+                      stream_search_results=CONFIG.get('stream_search_results'),
+                      decode_search_results=CONFIG.get('decode_search_results'),
+                      http_connect_timeout=CONFIG.get('http_connect_timeout'),
+                      http_read_timeout=CONFIG.get('http_read_timeout'),
+                      async_engine=CONFIG.get('async_engine'),
+                      prefetch_pages=CONFIG.get('prefetch_pages'),
+                      prefetch_max_bytes=CONFIG.get('prefetch_max_bytes'), )
+
+        if warm_cache:
+            ns.warm_cache()
+            return
 
         ns.connect_tba()
 
@@ -274,8 +400,13 @@ def main_impl():
         elif args.properties:
             catalog = args.properties
             state = build_state(args.state, catalog)
-            do_sync(ns, catalog, state)
+            try:
+                do_sync(ns, catalog, state)
+            finally:
+                # Also logged for failed syncs, often throttled ones
+                ns.log_request_slot_waits()
     finally:
+        output.flush()
         if ns:
             ns = None
 
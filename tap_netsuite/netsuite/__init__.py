@@ -1,29 +1,43 @@
 #!/usr/bin/env python3
-from .netsuite_connection import ExtendedNetSuiteConnection
 import os
+import threading
+
+from .netsuite_client import ExtendedNetSuiteClient
+from .netsuite_connection import ExtendedNetSuiteConnection
 import singer
-from typing import Dict
 import singer.utils as singer_utils
 from singer import metadata, metrics
 from tap_netsuite.netsuite.soap import Soap
+from tap_netsuite.netsuite.definitions import ObjectDefinitions
+from tap_netsuite.netsuite.pagination import PrefetchBudget
+from tap_netsuite.netsuite.retry import stream_context
+from tap_netsuite.netsuite.shared_scan import SharedScan, record_type_name
+from tap_netsuite.netsuite.transaction_entities import ITEM_TYPES, TRANSACTION_TYPES
+from tap_netsuite.netsuite.wsdl_cache import save_bundle
 
 LOGGER = singer.get_logger()
 
 
-def _get_abs_path(path: str) -> str:
-    return os.path.join(os.path.dirname(os.path.realpath(__file__)), path)
+# Definitions are read on demand, from the compiled index if it is up to date
+NS_OBJECT_DEFINITIONS = ObjectDefinitions()
+NS_OBJECTS = NS_OBJECT_DEFINITIONS.keys()
 
+# Concurrent SOAP requests allowed for an account without SuiteCloud Plus licenses
+DEFAULT_CONCURRENCY_LIMIT = 5
 
-def _load_object_definitions() -> Dict:
-    """Loads a JSON schema file for a given
-    NetSuite Report resource into a dict representation.
-    """
-    schema_path = _get_abs_path("schemas")
-    return singer.utils.load_json(f"{schema_path}/object_definition.json")
+# Backfill windows holding more records than this are halved
+DEFAULT_BACKFILL_MAX_WINDOW_RECORDS = 10000
 
+# Bytes of the search pages fetched ahead by all streams at once
+DEFAULT_PREFETCH_MAX_BYTES = 64 * 1024 * 1024
 
-NS_OBJECT_DEFINITIONS = _load_object_definitions()
-NS_OBJECTS = NS_OBJECT_DEFINITIONS.keys()
+# File name of the pre-parsed WSDL bundle in the WSDL cache directory
+WSDL_BUNDLE_NAME = 'netsuite-wsdl.bundle'
+
+
+def parse_bool(value):
+    """Config values may be booleans or their string representation."""
+    return value is True or (isinstance(value, str) and value.lower() == 'true')
 
 
 def field_to_property_schema(field):  # pylint:disable=too-many-branches
@@ -99,7 +113,33 @@ class NetSuite:
                  ns_token_secret=None,
                  is_sandbox=True,
                  select_fields_by_default=None,
-                 default_start_date=None):
+                 default_start_date=None,
+                 use_record_projector=None,
+                 max_concurrent_streams=None,
+                 concurrency_limit=None,
+                 page_fetch_workers=None,
+                 backfill_window_days=None,
+                 backfill_max_window_records=None,
+                 backfill_workers=None,
+                 shared_transaction_scan=None,
+                 shared_item_scan=None,
+                 header_only_streams=None,
+                 keyset_pagination_streams=None,
+                 full_table_partitions=None,
+                 full_table_workers=None,
+                 full_table_ordered=None,
+                 wsdl_cache_dir=None,
+                 wsdl_bundle=None,
+                 request_slots_dir=None,
+                 max_retries=None,
+                 retry_max_seconds=None,
+                 stream_search_results=None,
+                 decode_search_results=None,
+                 http_connect_timeout=None,
+                 http_read_timeout=None,
+                 async_engine=None,
+                 prefetch_pages=None,
+                 prefetch_max_bytes=None):
 
         self.ns_account = ns_account
         self.ns_consumer_key = ns_consumer_key
@@ -107,8 +147,62 @@ class NetSuite:
         self.ns_token_key = ns_token_key
         self.ns_token_secret = ns_token_secret
         self.is_sandbox = is_sandbox
-        self.select_fields_by_default = select_fields_by_default is True or (
-                isinstance(select_fields_by_default, str) and select_fields_by_default.lower() == 'true')
+        self.select_fields_by_default = parse_bool(select_fields_by_default)
+        self.use_record_projector = parse_bool(use_record_projector)
+
+        # NetSuite limits the concurrent SOAP requests of an account, running
+        # more streams at once than there are request slots does not help.
+        self.concurrency_limit = int(concurrency_limit or DEFAULT_CONCURRENCY_LIMIT)
+        self.max_concurrent_streams = min(int(max_concurrent_streams or 1), self.concurrency_limit)
+        # Set when a stream synced concurrently fails, the others stop after their current page
+        self.stop_streams = threading.Event()
+        self.page_fetch_workers = min(int(page_fetch_workers or 1), self.concurrency_limit)
+        # The request slots are shared with the other processes using this directory
+        self.request_slots_dir = request_slots_dir
+        # Throttled and failed reads are retried with a growing delay
+        self.max_retries = max_retries
+        self.retry_max_seconds = retry_max_seconds
+        # Search pages are parsed a record at a time, holding one record instead of the whole page
+        self.stream_search_results = parse_bool(stream_search_results)
+        # Search records are decoded into plain values instead of zeep objects, implies streaming
+        self.decode_search_results = parse_bool(decode_search_results)
+        # Seconds to open a connection and between the bytes of a response before a request fails
+        self.http_connect_timeout = http_connect_timeout
+        self.http_read_timeout = http_read_timeout
+        # Requests are made from one event loop, the pages of a search fetched ahead without threads
+        self.async_engine = parse_bool(async_engine)
+        # Search pages fetched ahead of the page being synced, holding up to prefetch_max_bytes for all streams
+        self.prefetch_pages = int(prefetch_pages or 0)
+        self.prefetch_budget = PrefetchBudget(int(prefetch_max_bytes or DEFAULT_PREFETCH_MAX_BYTES))
+
+        # Searches from a start date older than one window are split in windows
+        self.backfill_window_days = float(backfill_window_days) if backfill_window_days else None
+        self.backfill_max_window_records = int(backfill_max_window_records or DEFAULT_BACKFILL_MAX_WINDOW_RECORDS)
+        self.backfill_workers = min(int(backfill_workers or 1), self.concurrency_limit)
+
+        # Transaction and item streams may read from one search over all their record types
+        self.shared_transaction_scan = parse_bool(shared_transaction_scan)
+        self.shared_item_scan = parse_bool(shared_item_scan)
+        self.shared_scans = []
+
+        # Streams synced without their sublists (item lines, addresses, ...)
+        if isinstance(header_only_streams, str):
+            header_only_streams = header_only_streams.split(',')
+        self.header_only_streams = {stream.strip() for stream in header_only_streams or []}
+
+        # Streams paged by internalId, one search per page, instead of through a search session
+        if isinstance(keyset_pagination_streams, str):
+            keyset_pagination_streams = keyset_pagination_streams.split(',')
+        self.keyset_pagination_streams = {stream.strip() for stream in keyset_pagination_streams or []}
+
+        # Streams without a replication key are searched in internalId ranges fetched concurrently
+        self.full_table_partitions = int(full_table_partitions or 1)
+        self.full_table_workers = min(int(full_table_workers or self.full_table_partitions), self.concurrency_limit)
+        self.full_table_ordered = parse_bool(full_table_ordered) if full_table_ordered is not None else True
+
+        # The WSDL is downloaded to a persistent cache and parsed once into a bundle
+        self.wsdl_cache_dir = wsdl_cache_dir
+        self.wsdl_bundle = wsdl_bundle or (os.path.join(wsdl_cache_dir, WSDL_BUNDLE_NAME) if wsdl_cache_dir else None)
 
         self.default_start_date = default_start_date
 
@@ -136,10 +230,32 @@ class NetSuite:
             consumer_secret=self.ns_consumer_secret,
             token_key=self.ns_token_key,
             token_secret=self.ns_token_secret,
-            caching=caching
+            caching=caching,
+            concurrency_limit=self.concurrency_limit,
+            page_fetch_workers=self.page_fetch_workers,
+            cache_dir=self.wsdl_cache_dir,
+            wsdl_bundle=self.wsdl_bundle,
+            request_slots_dir=self.request_slots_dir,
+            max_retries=self.max_retries,
+            retry_max_seconds=self.retry_max_seconds,
+            stream_search_results=self.stream_search_results,
+            decode_search_results=self.decode_search_results,
+            connect_timeout=self.http_connect_timeout,
+            read_timeout=self.http_read_timeout,
+            async_engine=self.async_engine
         )
         self.ns_client = nc
 
+    def log_request_slot_waits(self):
+        self.ns_client.client.request_slot_waits.log(self.ns_account)
+
+    def warm_cache(self):
+        """Downloads the WSDL to the persistent cache and parses it into the bundle."""
+        client = ExtendedNetSuiteClient(account=self.ns_account, caching=True, cache_dir=self.wsdl_cache_dir)
+        if self.wsdl_bundle:
+            save_bundle(client._client.wsdl, client._wsdl_url, self.wsdl_bundle)  # pylint: disable=protected-access
+            LOGGER.info('Parsed the WSDL into %s', self.wsdl_bundle)
+
     def get_start_date(self, state, catalog_entry):
         catalog_metadata = metadata.to_map(catalog_entry['metadata'])
         replication_key = catalog_metadata.get((), {}).get('replication-key')
@@ -148,6 +264,80 @@ class NetSuite:
                                     catalog_entry['tap_stream_id'],
                                     replication_key) or self.default_start_date)
 
+    def start_shared_scans(self, catalog_entries, state):
+        """Starts the enabled searches shared by several incremental streams.
+
+        Returns the catalog entries reading from them, which must be synced
+        concurrently."""
+        members = []
+        if self.shared_transaction_scan:
+            members += self._start_shared_scan(catalog_entries, state, 'Transaction', TRANSACTION_TYPES,
+                                               self.ns_client.query_transactions)
+        if self.shared_item_scan:
+            members += self._start_shared_scan(catalog_entries, state, 'Item', ITEM_TYPES,
+                                               self.ns_client.query_items)
+        return members
+
+    def _start_shared_scan(self, catalog_entries, state, search_type_name, record_types, query):
+        """Starts one search_type_name search for the streams of record_types.
+
+        Only streams searching search_type_name themselves read from it, a
+        stream without a record type filter gets every record. As its own
+        search, whose recordType contains its record type, a stream gets the
+        records of every type whose name contains it, e.g. JournalEntry the
+        InterCompanyJournalEntry records too. Nothing is started if fewer
+        than two streams can read from the search."""
+        streams_by_record_type = {}
+        all_records_streams = []
+        start_dates = {}
+        members = []
+        for catalog_entry in catalog_entries:
+            stream = catalog_entry['stream']
+            entity = self.ns_client.entities.get(stream)
+            record_type = getattr(entity, 'record_type', None)
+            catalog_metadata = metadata.to_map(catalog_entry['metadata'])
+            start_date = self.get_start_date(state, catalog_entry)
+            if (getattr(entity, 'search_type_name', None) != search_type_name
+                    or (record_type is not None and record_type not in record_types)
+                    or getattr(entity, 'require_lastModified_date', False) is not True
+                    or stream in self.header_only_streams
+                    or stream in self.keyset_pagination_streams
+                    or not catalog_metadata.get((), {}).get('replication-key')
+                    or not start_date
+                    or singer.get_bookmark(state, catalog_entry['tap_stream_id'], 'JobID')):
+                continue
+            if record_type is None:
+                all_records_streams.append(stream)
+            else:
+                for name in record_types:
+                    if record_type in name:
+                        streams_by_record_type.setdefault(name, []).append(stream)
+            start_dates[stream] = singer_utils.strptime_with_tz(start_date)
+            members.append(catalog_entry)
+
+        if len(members) < 2:
+            return []
+
+        def search():
+            return query(None if all_records_streams else list(streams_by_record_type),
+                         {'searchValue': singer_utils.strftime(min(start_dates.values())),
+                          'type': 'dateTime',
+                          'operator': 'onOrAfter'})
+
+        def route(rec):
+            return streams_by_record_type.get(record_type_name(rec), []) + all_records_streams
+
+        LOGGER.info('Syncing %s from one %s search', ', '.join(start_dates), search_type_name)
+        shared_scan = SharedScan(search, route, start_dates)
+        with stream_context(search_type_name):
+            shared_scan.start()
+        self.shared_scans.append(shared_scan)
+        return members
+
+    def stop_shared_scans(self):
+        for shared_scan in self.shared_scans:
+            shared_scan.stop()
+
     def query(self, ns, catalog_entry, state):
         soap = Soap(ns)
         return soap.query(catalog_entry, state)
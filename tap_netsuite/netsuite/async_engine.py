@@ -0,0 +1,129 @@
+# pylint: disable=protected-access
+"""Makes the SOAP requests to NetSuite from one asyncio event loop.
+
+With async_engine, every request of the tap is made on an event loop
+running on a thread of its own: the stream threads wait for their requests
+on the loop instead of making them, and the remaining pages of a search are
+requested from the loop, up to page_fetch_workers of them at once, without
+a thread for each (SearchPages' async iteration).
+
+The requests are sent with httpx, through a connection pool as large as the
+transport's; without httpx the engine is not used. The waits for a request
+slot, which may be held by another process, are made on threads of their
+own. The engine saves the threads of the streams' page fetches, not time:
+the requests are still as many at once as there are request slots."""
+import asyncio
+import threading
+import time
+from concurrent import futures
+
+import requests
+import singer
+from zeep.wsdl.utils import etree_to_string
+
+from .exceptions import TapNetSuiteException
+from .retry import CURRENT_STREAM, stream_context
+from .transport import NetSuiteTransport
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+LOGGER = singer.get_logger()
+
+
+async def _in_stream(stream, awaitable):
+    with stream_context(stream):
+        return await awaitable
+
+
+class AsyncEngine:
+    """Runs the operations of a zeep service on an event loop of its own thread.
+
+    run(coroutine) runs a coroutine on the loop and returns its result to the
+    calling thread, iterate(iterable) iterates over an async iterable from
+    the calling thread. Both run in the stream of the calling thread."""
+
+    def __init__(self, client, service_proxy, transport):
+        self.client = client
+        self.service_proxy = service_proxy
+        self.transport = transport
+        self._wait_threads = futures.ThreadPoolExecutor(max_workers=transport.pool_size,
+                                                        thread_name_prefix='netsuite-slot')
+        if httpx is None:
+            raise TapNetSuiteException('The async engine requires httpx (pip install tap-netsuite[async])')
+        connect_timeout, read_timeout = transport.operation_timeout
+        self.http = httpx.AsyncClient(limits=httpx.Limits(max_connections=transport.pool_size,
+                                                          max_keepalive_connections=transport.pool_size),
+                                      timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+                                      headers={'Accept-Encoding': 'gzip, deflate'})
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name='netsuite-async', daemon=True)
+        self._thread.start()
+
+    def run(self, coroutine):
+        """Runs coroutine on the loop and returns its result."""
+        future = asyncio.run_coroutine_threadsafe(_in_stream(CURRENT_STREAM.get(), coroutine), self.loop)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def iterate(self, iterable):
+        """Yields the items of an async iterable, iterated on the loop."""
+        iterator = iterable.__aiter__()
+        try:
+            while True:
+                try:
+                    item = self.run(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            if hasattr(iterator, 'aclose'):
+                self.run(iterator.aclose())
+
+    async def acquire(self, acquire, release):
+        """Calls the blocking acquire on a thread and returns its result.
+
+        If the caller is cancelled while acquire waits, what it acquires is
+        released with release(result)."""
+        future = self.loop.run_in_executor(self._wait_threads, acquire)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            def release_acquired(done):
+                if not done.cancelled() and done.exception() is None:
+                    release(done.result())
+
+            future.add_done_callback(release_acquired)
+            raise
+
+    async def send(self, name, args, kwargs):
+        """Sends the request of the operation name, returns its response as a requests Response."""
+        operation = getattr(self.service_proxy, name)
+        kwargs = dict(kwargs, _soapheaders=operation._merge_soap_headers(kwargs.get('_soapheaders')))
+        binding = self.service_proxy._binding
+        options = self.service_proxy._binding_options
+        envelope, headers = binding._create(name, args, kwargs, client=self.client, options=options)
+        start = time.perf_counter()
+        async with self.http.stream('POST', options['address'], content=etree_to_string(envelope),
+                                    headers=headers) as http_response:
+            time_to_first_byte = time.perf_counter() - start
+            content = await http_response.aread()
+        # As zeep's AsyncTransport, the response is handed to zeep as a requests Response
+        response = requests.Response()
+        response._content = content
+        response.status_code = http_response.status_code
+        response.headers = requests.structures.CaseInsensitiveDict(http_response.headers)
+        response.encoding = http_response.encoding
+        response.url = str(http_response.url)
+        NetSuiteTransport.log_response(name, response, http_response.num_bytes_downloaded, time_to_first_byte)
+        return response
+
+    def process_reply(self, name, response):
+        """The result of the operation name from its response, as zeep returns it."""
+        binding = self.service_proxy._binding
+        return binding.process_reply(self.client, binding.get(name), response)
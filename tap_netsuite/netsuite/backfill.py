@@ -0,0 +1,85 @@
+import datetime
+from collections import deque
+from concurrent import futures
+from itertools import islice
+
+import singer
+
+from tap_netsuite.netsuite.pagination import FetchedPages
+from tap_netsuite.netsuite.retry import submit_in_context
+
+LOGGER = singer.get_logger()
+
+# Windows are not halved below this size, however many records they hold
+MIN_WINDOW_SIZE = datetime.timedelta(minutes=1)
+
+
+def plan_windows(start, end, window_size):
+    """Splits [start, end) into consecutive windows of at most window_size."""
+    windows = []
+    while start < end:
+        window_end = min(start + window_size, end)
+        windows.append((start, window_end))
+        start = window_end
+    return windows
+
+
+class BackfillWindows:
+    """Iterates over (window_end, pages) for date windows of a lastModifiedDate search.
+
+    query_window(start, end, after=None) performs the search of one window,
+    of its records after the internalId after if it is given, and returns
+    its pages. A window holding more than max_records records is halved
+    until it does not, or until it reaches MIN_WINDOW_SIZE, and each half is
+    yielded as a window of its own. With max_workers > 1 that many windows
+    are searched and fetched concurrently; windows are still yielded in date
+    order, so when one is yielded every record modified before its end has
+    been yielded."""
+
+    def __init__(self, query_window, windows, max_records, max_workers=1):
+        self.query_window = query_window
+        self.windows = windows
+        self.max_records = max_records
+        self.max_workers = max(int(max_workers or 1), 1)
+        self.first_window_after = None
+
+    def resume_after(self, internal_id):
+        """Searches the first window for the records after internal_id only."""
+        self.first_window_after = internal_id
+        return self
+
+    def split(self, start, end):
+        """Returns the (end, pages) of the searches of [start, end), halving the window as needed."""
+        if self.first_window_after is not None and (start, end) == self.windows[0]:
+            # What is left of a resumed window is not halved again
+            return [(end, self.query_window(start, end, self.first_window_after))]
+        pages = self.query_window(start, end)
+        if self.max_records and pages.total_records > self.max_records and end - start > MIN_WINDOW_SIZE:
+            middle = start + (end - start) / 2
+            LOGGER.info('Window %s - %s has %s records, halving it', start, end, pages.total_records)
+            return self.split(start, middle) + self.split(middle, end)
+        return [(end, pages)]
+
+    def fetch(self, start, end):
+        return [(window_end, FetchedPages(pages)) for window_end, pages in self.split(start, end)]
+
+    def __iter__(self):
+        if self.max_workers == 1:
+            for start, end in self.windows:
+                LOGGER.info('Syncing window %s - %s', start, end)
+                yield from self.split(start, end)
+            return
+
+        executor = futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            windows = iter(self.windows)
+            in_flight = deque(submit_in_context(executor, self.fetch, start, end)
+                              for start, end in islice(windows, self.max_workers))
+            while in_flight:
+                searches = in_flight.popleft().result()
+                window = next(windows, None)
+                if window is not None:
+                    in_flight.append(submit_in_context(executor, self.fetch, *window))
+                yield from searches
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,86 @@
+"""Page checkpoints of the lastModifiedDate search a stream is synced from.
+
+While the pages of a search are written, the stream's bookmark holds, next
+to its replication key, where the sync stopped:
+
+    JobID                   the window searched, '<start>/<end>'; a search
+                            with no end ends when the sync started
+    BatchIDs                how many of its pages were written
+    JobHighestBookmarkSeen  the highest replication key value written
+    LastInternalId          the internalId of the last record written
+
+NetSuite returns the records of a search in internalId order. The
+replication key itself only moves once a whole window was written, a sync
+interrupted in a window searches what is left of it again, the records of
+[start, end] after LastInternalId, then the records modified since its end.
+Records modified in between, and so moved ahead of LastInternalId or out
+of the window, are searched again in the following windows.
+
+Searches paged by internalId are checkpointed for FULL_TABLE streams too,
+whose bookmark then also keeps the version of the table being written: the
+resumed sync writes its rows with it, so that its ActivateVersion does not
+drop the rows written before."""
+from collections import namedtuple
+
+import singer
+import singer.utils as singer_utils
+
+LOGGER = singer.get_logger()
+
+CHECKPOINT_KEYS = ('JobID', 'BatchIDs', 'JobHighestBookmarkSeen', 'LastInternalId')
+
+SearchCheckpoint = namedtuple('SearchCheckpoint', ['start', 'end', 'pages', 'highest_bookmark', 'last_internal_id'])
+
+
+def window_id(start, end=None):
+    if end is None:
+        return singer_utils.strftime(start)
+    return f'{singer_utils.strftime(start)}/{singer_utils.strftime(end)}'
+
+
+def read_checkpoint(state, tap_stream_id, start):
+    """The checkpoint of the stream's search starting at start, or None.
+
+    A checkpoint of a window starting elsewhere than the stream's bookmark
+    does not belong to it, it is dropped."""
+    job_id = singer.get_bookmark(state, tap_stream_id, 'JobID')
+    if not job_id:
+        return None
+    pages = singer.get_bookmark(state, tap_stream_id, 'BatchIDs')
+    try:
+        window_start, _, window_end = str(job_id).partition('/')
+        checkpoint = SearchCheckpoint(singer_utils.strptime_with_tz(window_start),
+                                      singer_utils.strptime_with_tz(window_end) if window_end else None,
+                                      pages,
+                                      singer.get_bookmark(state, tap_stream_id, 'JobHighestBookmarkSeen'),
+                                      singer.get_bookmark(state, tap_stream_id, 'LastInternalId'))
+    except ValueError:
+        checkpoint = None
+    if checkpoint is None or checkpoint.start != start or not isinstance(pages, int):
+        LOGGER.warning('%s: Dropping the checkpoint of search %s, it does not resume from the bookmark %s',
+                       tap_stream_id, job_id, singer_utils.strftime(start))
+        clear_checkpoint(state, tap_stream_id)
+        return None
+    if checkpoint.end is None or checkpoint.last_internal_id is None:
+        # Written by an older version, by page count
+        LOGGER.warning('%s: Dropping the checkpoint of search %s, it has no end or last internalId',
+                       tap_stream_id, job_id)
+        clear_checkpoint(state, tap_stream_id)
+        return None
+    return checkpoint
+
+
+def write_checkpoint(state, tap_stream_id, start, end, pages, highest_bookmark, last_internal_id):
+    state = singer.write_bookmark(state, tap_stream_id, 'JobID', window_id(start, end))
+    state = singer.write_bookmark(state, tap_stream_id, 'BatchIDs', pages)
+    state = singer.write_bookmark(state, tap_stream_id, 'JobHighestBookmarkSeen', highest_bookmark)
+    if last_internal_id is not None:
+        state = singer.write_bookmark(state, tap_stream_id, 'LastInternalId', last_internal_id)
+    return state
+
+
+def clear_checkpoint(state, tap_stream_id):
+    bookmark = state.get('bookmarks', {}).get(tap_stream_id, {})
+    for key in CHECKPOINT_KEYS:
+        bookmark.pop(key, None)
+    return state
@@ -0,0 +1,181 @@
+"""Decodes the records of search responses straight into plain values.
+
+sync_records only ever reads the records zeep builds through
+serialize_object, this builds the same dicts, lists and values from the XML
+without the zeep objects in between. The types of the elements and
+attributes come from the schema zeep loaded, compiled once per record type
+into a table of the children of each complex type and the conversion of
+each simple one: strings as is, integers with int, doubles with float,
+booleans and dateTimes as zeep parses them.
+
+Only sequences of elements and named attributes are decoded this way. A
+type using anything else (choices, xsd:any, simple content, ...) is parsed
+by zeep, as is a record holding an element its type does not declare."""
+import datetime
+
+import singer
+from zeep.helpers import serialize_object
+from zeep.utils import qname_attr
+from zeep.xsd.const import xsi_ns
+from zeep.xsd.elements import Element
+from zeep.xsd.elements.indicators import All, Sequence
+from zeep.xsd.types.builtins import Boolean, DateTime, Double, Float, Integer, String
+from zeep.xsd.types.complex import ComplexType
+from zeep.xsd.types.simple import AnySimpleType
+
+LOGGER = singer.get_logger()
+
+XSI_TYPE = xsi_ns('type')
+
+
+class DecodedRecord(dict):
+    """A record decoded into plain values, keeping the name of its type."""
+
+    def __init__(self, type_name, values):
+        super().__init__(values)
+        self.type_name = type_name
+
+
+class _Undecodable(Exception):
+    """The XML does not match the types the record is decoded with."""
+
+
+class _ComplexPlan:
+    """The children and attributes of a complex type, by element name."""
+
+    def __init__(self, xsd_type):
+        # zeep's order: the elements, then the attributes
+        self.names = [name for name, _ in xsd_type.elements] + [name for name, _ in xsd_type.attributes]
+        self.lists = [name for name, element in xsd_type.elements if element.accepts_multiple]
+        self.children = {element.qname.localname: (name, element, element.accepts_multiple)
+                         for name, element in xsd_type.elements}
+        self.attributes = [(attribute.qname.text, name, _converter(attribute.type))
+                           for name, attribute in xsd_type.attributes]
+        self.empty = not self.names and not self.attributes
+
+
+def _boolean(text):
+    return text.strip() in ('true', '1')
+
+
+def _converter(xsd_type):
+    """The function converting the text of a simple type to its value, as zeep does."""
+    if isinstance(xsd_type, String) and type(xsd_type).pythonvalue is String.pythonvalue:
+        return str
+    if isinstance(xsd_type, Boolean):
+        convert = _boolean
+    elif isinstance(xsd_type, Integer):
+        convert = int
+    elif isinstance(xsd_type, (Double, Float)):
+        convert = float
+    elif isinstance(xsd_type, DateTime):
+        def convert(text):
+            try:
+                return datetime.datetime.fromisoformat(text.strip())
+            except ValueError:
+                return xsd_type.pythonvalue(text)
+    else:
+        convert = xsd_type.pythonvalue
+
+    def safe_convert(text):
+        # zeep reads values it cannot convert as None
+        try:
+            return convert(text)
+        except (TypeError, ValueError):
+            return None
+
+    return safe_convert
+
+
+def _is_plain(xsd_type):
+    """Whether a complex type is a sequence of elements with named attributes."""
+    if getattr(xsd_type, '_array_type', None) or len(xsd_type.elements_nested) > 1:
+        return False
+    if any(not attribute.name for _, attribute in xsd_type.attributes):
+        return False
+    for _, indicator in xsd_type.elements_nested:
+        if not isinstance(indicator, (Sequence, All)) or indicator.accepts_multiple:
+            return False
+        if not all(isinstance(child, Element) for child in indicator):
+            return False
+    return len({element.qname.localname for _, element in xsd_type.elements}) == len(xsd_type.elements)
+
+
+class RecordDecoder:
+    """Decodes record elements into DecodedRecords, equal to zeep's serialize_object of them."""
+
+    def __init__(self, schema):
+        self.schema = schema
+        # By type: a converter for simple types, a _ComplexPlan, or None for the types parsed by zeep
+        self._plans = {}
+
+    def decode(self, element, xsd_element):
+        xsd_type = self._type(element, xsd_element)
+        try:
+            plan = self._plan(xsd_type)
+            if not isinstance(plan, _ComplexPlan):
+                raise _Undecodable()
+            values = self._decode_complex(element, plan, allow_none=False) or {}
+        except _Undecodable:
+            values = serialize_object(xsd_element.parse(element, self.schema), dict)
+        return DecodedRecord(xsd_type.name, values)
+
+    def _type(self, element, xsd_element):
+        if element.get(XSI_TYPE) is not None:
+            xsd_type = self.schema.get_type(qname_attr(element, XSI_TYPE), fail_silently=True)
+            if xsd_type is not None:
+                return xsd_type
+        return xsd_element.type
+
+    def _plan(self, xsd_type):
+        key = id(xsd_type)
+        if key not in self._plans:
+            if isinstance(xsd_type, AnySimpleType) and (
+                    type(xsd_type).parse_xmlelement is AnySimpleType.parse_xmlelement):
+                plan = _converter(xsd_type)
+            elif isinstance(xsd_type, ComplexType) and _is_plain(xsd_type):
+                plan = _ComplexPlan(xsd_type)
+            else:
+                LOGGER.debug('Decoding %s with zeep', xsd_type.name)
+                plan = None
+            self._plans[key] = plan
+        return self._plans[key]
+
+    def _decode_complex(self, element, plan, allow_none):
+        if plan.empty or (allow_none and len(element) == 0 and not element.attrib):
+            return None
+        values = dict.fromkeys(plan.names)
+        for name in plan.lists:
+            values[name] = []
+        seen = set()
+        for child in element:
+            tag = child.tag
+            if not isinstance(tag, str):
+                continue
+            try:
+                name, xsd_element, multiple = plan.children[tag[tag.find('}') + 1:]]
+            except KeyError as e:
+                raise _Undecodable() from e
+            value = self._decode_child(child, xsd_element)
+            if multiple:
+                values[name].append(value)
+            elif name in seen:
+                raise _Undecodable()
+            else:
+                seen.add(name)
+                values[name] = value
+        for qname, name, convert in plan.attributes:
+            value = element.get(qname)
+            if value is not None:
+                values[name] = convert(value)
+        return values
+
+    def _decode_child(self, child, xsd_element):
+        plan = self._plan(self._type(child, xsd_element))
+        if isinstance(plan, _ComplexPlan):
+            return self._decode_complex(child, plan, allow_none=True)
+        if plan is None:
+            return serialize_object(xsd_element.parse(child, self.schema, allow_none=True), dict)
+        if child.text is None:
+            return None
+        return plan(child.text)
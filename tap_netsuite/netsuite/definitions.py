@@ -0,0 +1,138 @@
+"""Compiled index of the NetSuite object definitions.
+
+The index holds the definitions of schemas/object_definition.json as one
+compact blob per object, behind an offset table, so describing an object
+decodes that object only. Rebuild it whenever the JSON file changes:
+
+    python -m tap_netsuite.netsuite.definitions
+
+Layout (little endian):
+    header   magic, SHA-256 of the JSON file it was built from, object count,
+             length of the names section
+    names    object names in definition order, separated by newlines
+    table    (offset, length) of each object's blob, relative to the blobs
+    blobs    each a compact JSON list of [name, displayName, type] fields
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from collections.abc import Mapping
+
+import singer
+
+LOGGER = singer.get_logger()
+
+MAGIC = b'NSDEFIX2'
+HEADER = struct.Struct('<8s32sII')
+ENTRY = struct.Struct('<II')
+
+SCHEMAS_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'schemas')
+JSON_PATH = os.path.join(SCHEMAS_PATH, 'object_definition.json')
+INDEX_PATH = os.path.join(SCHEMAS_PATH, 'object_definition.idx')
+
+
+def compile_index(json_path=JSON_PATH, index_path=INDEX_PATH):
+    with open(json_path, 'rb') as f:
+        source = f.read()
+    definitions = json.loads(source)
+
+    names = '\n'.join(definitions).encode('utf-8')
+    blobs = [json.dumps([[field['name'], field['displayName'], field['type']] for field in fields],
+                        separators=(',', ':')).encode('utf-8')
+             for fields in definitions.values()]
+
+    table = []
+    offset = 0
+    for blob in blobs:
+        table.append(ENTRY.pack(offset, len(blob)))
+        offset += len(blob)
+
+    with open(index_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, hashlib.sha256(source).digest(), len(definitions), len(names)))
+        f.write(names)
+        f.write(b''.join(table))
+        f.write(b''.join(blobs))
+    return len(definitions)
+
+
+class ObjectDefinitions(Mapping):
+    """Maps NetSuite object names to their field definitions, read on demand.
+
+    Nothing is read until the first lookup. The definitions then come from
+    the compiled index, an object being decoded the first time it is looked
+    up, or from the JSON file if the index is missing or was built from a
+    different version of it."""
+
+    def __init__(self, json_path=JSON_PATH, index_path=INDEX_PATH):
+        self.json_path = json_path
+        self.index_path = index_path
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._names = None
+        self._table = None
+        self._blobs = None
+        self._definitions = {}
+
+    def _load(self):
+        with self._lock:
+            if self._loaded:
+                return
+            try:
+                self._load_index()
+            except (OSError, ValueError) as e:
+                LOGGER.debug('Object definition index not used (%s), loading %s', e, self.json_path)
+                with open(self.json_path) as f:
+                    self._definitions = json.load(f)
+                self._names = list(self._definitions)
+            self._loaded = True
+
+    def _load_index(self):
+        with open(self.index_path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(data) < HEADER.size:
+            raise ValueError('truncated index')
+        magic, source_digest, count, names_length = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError('not an object definition index')
+        # Any edit of the JSON file changes its hash, not always its size; hashing is much cheaper than parsing
+        with open(self.json_path, 'rb') as f:
+            if source_digest != hashlib.sha256(f.read()).digest():
+                raise ValueError('index is stale')
+
+        names = data[HEADER.size:HEADER.size + names_length].decode('utf-8').split('\n') if count else []
+        table_offset = HEADER.size + names_length
+        self._table = {name: ENTRY.unpack_from(data, table_offset + i * ENTRY.size)
+                       for i, name in enumerate(names)}
+        self._blobs = memoryview(data)[table_offset + count * ENTRY.size:]
+        self._names = names
+
+    def __getitem__(self, name):
+        if not self._loaded:
+            self._load()
+        fields = self._definitions.get(name)
+        if fields is None:
+            if self._table is None or name not in self._table:
+                raise KeyError(name)
+            offset, length = self._table[name]
+            fields = [{'displayName': display_name, 'name': field_name, 'type': field_type}
+                      for field_name, display_name, field_type
+                      in json.loads(bytes(self._blobs[offset:offset + length]))]
+            fields = self._definitions.setdefault(name, fields)
+        return fields
+
+    def __iter__(self):
+        if not self._loaded:
+            self._load()
+        return iter(self._names)
+
+    def __len__(self):
+        if not self._loaded:
+            self._load()
+        return len(self._names)
+
+
+if __name__ == '__main__':
+    print(f'Compiled {compile_index()} object definitions into {INDEX_PATH}')
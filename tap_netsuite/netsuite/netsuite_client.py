@@ -1,12 +1,238 @@
+import asyncio
+import contextlib
+import os
+import threading
+import time
+
+import singer
 from netsuitesdk.internal.client import NetSuiteClient
+from netsuitesdk.internal.exceptions import NetSuiteLoginError, NetSuiteRateLimitError
+from zeep.exceptions import Fault
+
+from .async_engine import AsyncEngine
+from .decoder import RecordDecoder
+from .exceptions import TapNetSuiteQuotaExceededException
+from .request_slots import AccountSlots, AdaptiveLimit, SlotWaits
+from .retry import RETRIED_OPERATIONS, RETRY_STATS, THROTTLING_FAULTS, RetryPolicy, classify_fault
+from .streaming import STREAMED_OPERATIONS, parse_search_response
+from .transport import NetSuiteTransport
+from .wsdl_cache import preparsed_wsdl
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+LOGGER = singer.get_logger()
 
 
 class ExtendedNetSuiteClient(NetSuiteClient):
-    def __init__(self, account=None, caching=True, caching_timeout=2592000):
-        NetSuiteClient.__init__(self, account, caching, caching_timeout)
+    def __init__(self, account=None, caching=True, caching_timeout=2592000, concurrency_limit=None,
+                 page_fetch_workers=1, cache_dir=None, wsdl_bundle=None, request_slots_dir=None,
+                 max_retries=None, retry_max_seconds=None, stream_search_results=False,
+                 decode_search_results=False, connect_timeout=None, read_timeout=None, async_engine=False):
+        if async_engine and httpx is None:
+            LOGGER.warning('httpx is not installed, the requests are made without the async engine')
+            async_engine = False
+        # The downloaded WSDL is cached in cache_dir, kept between runs, instead of the library's directory
+        kwargs = {}
+        if caching and cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            kwargs['caching_path'] = cache_dir
+        with preparsed_wsdl(wsdl_bundle) if wsdl_bundle else contextlib.nullcontext():
+            NetSuiteClient.__init__(self, account, caching, caching_timeout, **kwargs)
+        # Requests are sent with a transport of our own, with a connection for each request slot
+        self._client.transport = NetSuiteTransport(pool_size=concurrency_limit,
+                                                   connect_timeout=connect_timeout,
+                                                   read_timeout=read_timeout,
+                                                   cache=self._client.transport.cache)
         # self.set_search_preferences(page_size=100, return_search_columns=True)
         self._search_preferences = self.SearchPreferences(
             bodyFieldsOnly=False,
             pageSize=100,
             returnSearchColumns=True
         )
+        # Used instead by the searches of header only streams, without sublists
+        self._header_search_preferences = self.SearchPreferences(
+            bodyFieldsOnly=True,
+            pageSize=100,
+            returnSearchColumns=True
+        )
+        self._local = threading.local()
+        # Requests made from concurrent streams share the account's request slots,
+        # with request_slots_dir those of every process syncing the account on this machine
+        if concurrency_limit and request_slots_dir:
+            self._request_slots = AccountSlots(account, concurrency_limit, request_slots_dir)
+        elif concurrency_limit:
+            self._request_slots = threading.BoundedSemaphore(concurrency_limit)
+        else:
+            self._request_slots = None
+        self.request_slot_waits = SlotWaits()
+        # Throttled requests lower how many of them this process makes at once
+        self._adaptive_limit = AdaptiveLimit(concurrency_limit) if concurrency_limit else None
+        self.retry_policy = RetryPolicy(max_retries, retry_max_seconds)
+        # Pages after the first one of a search fetched concurrently
+        self.page_fetch_workers = page_fetch_workers
+        # Search pages are kept as their response and their records converted as they are read,
+        # always with the async engine, whose loop must not be kept busy converting whole pages
+        self.stream_search_results = stream_search_results or async_engine
+        # Search records are decoded into plain values, without zeep objects, from the streamed responses
+        self._record_decoder = RecordDecoder(self._client.wsdl.types) if decode_search_results else None
+        # Requests are made on the event loop of the engine instead of the threads making them
+        self.engine = AsyncEngine(self._client, self._service_proxy, self._client.transport) if async_engine else None
+
+    def request(self, name, *args, **kwargs):
+        if self.engine is not None:
+            return self.engine.run(self.request_async(name, *args, _header_only=self._header_only(), **kwargs))
+        if name not in RETRIED_OPERATIONS:
+            return self._request(name, *args, **kwargs)
+        retry = 0
+        while True:
+            try:
+                response = self._request(name, *args, **kwargs)
+            except Exception as e:  # pylint: disable=broad-except
+                delay = self._retry_delay(name, e, retry)
+                retry += 1
+                time.sleep(delay)
+                continue
+            if self._adaptive_limit is not None:
+                self._adaptive_limit.succeeded()
+            return response
+
+    async def request_async(self, name, *args, _header_only=False, **kwargs):
+        """request, made on the loop of the async engine. _header_only is
+        whether the searches of the thread it is made for are header only."""
+        if name not in RETRIED_OPERATIONS:
+            return await self._request_async(name, args, kwargs, _header_only)
+        retry = 0
+        while True:
+            try:
+                response = await self._request_async(name, args, kwargs, _header_only)
+            except Exception as e:  # pylint: disable=broad-except
+                delay = self._retry_delay(name, e, retry)
+                retry += 1
+                await asyncio.sleep(delay)
+                continue
+            if self._adaptive_limit is not None:
+                self._adaptive_limit.succeeded()
+            return response
+
+    def _retry_delay(self, name, error, retry):
+        """The seconds to wait before retrying the request failed with error, raises error if it is not retried."""
+        fault = classify_fault(error)
+        if fault is None:
+            raise error
+        if fault in THROTTLING_FAULTS and self._adaptive_limit is not None:
+            self._adaptive_limit.throttled()
+        if retry >= self.retry_policy.max_retries:
+            if fault in THROTTLING_FAULTS:
+                raise TapNetSuiteQuotaExceededException(
+                    f'{name} still throttled by NetSuite after {retry} retries: {error}') from error
+            raise error
+        delay = self.retry_policy.delay(retry)
+        LOGGER.warning('%s failed (%s: %s), retry %s of %s in %.1f seconds',
+                       name, fault, error, retry + 1, self.retry_policy.max_retries, delay)
+        RETRY_STATS.add(fault, delay)
+        return delay
+
+    def _request(self, name, *args, **kwargs):
+        if self._streamed(name):
+            with self._client.settings(raw_response=True):
+                response = self._send(name, *args, **kwargs)
+            return parse_search_response(response, self._client.wsdl.types, self._record_decoder)
+        response = self._send(name, *args, **kwargs)
+        if name in STREAMED_OPERATIONS:
+            # The records zeep converted are weighed by their response when fetched ahead
+            response.body.searchResult.response_bytes = self._client.transport.response_bytes()
+        return response
+
+    async def _request_async(self, name, args, kwargs, header_only):
+        kwargs = dict(kwargs, _soapheaders=self._build_soap_headers(include_search_preferences=name == 'search',
+                                                                    header_only=header_only))
+        response = await self._send_async(name, args, kwargs)
+        if self._streamed(name):
+            return parse_search_response(response, self._client.wsdl.types, self._record_decoder)
+        try:
+            return self.engine.process_reply(name, response)
+        except Fault as e:
+            # As NetSuiteClient.request
+            if 'SuiteTalk concurrent request limit exceeded. Request blocked' in str(e):
+                raise NetSuiteRateLimitError(str(e)) from e
+            if 'Invalid login attempt' in str(e):
+                raise NetSuiteLoginError(str(e), e.code) from e
+            raise
+
+    def _streamed(self, name):
+        return (self.stream_search_results or self._record_decoder is not None) and name in STREAMED_OPERATIONS
+
+    def _send(self, name, *args, **kwargs):
+        if self._request_slots is None:
+            return NetSuiteClient.request(self, name, *args, **kwargs)
+        start = time.perf_counter()
+        with self._adaptive_limit, self._request_slots:
+            self.request_slot_waits.add(time.perf_counter() - start)
+            return NetSuiteClient.request(self, name, *args, **kwargs)
+
+    async def _send_async(self, name, args, kwargs):
+        if self._request_slots is None:
+            return await self.engine.send(name, args, kwargs)
+        start = time.perf_counter()
+        slot = await self.engine.acquire(self._acquire_slot, self._release_slot)
+        try:
+            self.request_slot_waits.add(time.perf_counter() - start)
+            return await self.engine.send(name, args, kwargs)
+        finally:
+            self._release_slot(slot)
+
+    def _acquire_slot(self):
+        """Waits for a request slot, returns it to be released with _release_slot from any thread."""
+        self._adaptive_limit.__enter__()
+        try:
+            if isinstance(self._request_slots, AccountSlots):
+                return self._request_slots.acquire_slot()
+            self._request_slots.acquire()
+            return None
+        except BaseException:
+            self._adaptive_limit.__exit__(None, None, None)
+            raise
+
+    def _release_slot(self, slot):
+        if isinstance(self._request_slots, AccountSlots):
+            self._request_slots.release_slot(slot)
+        else:
+            self._request_slots.release()
+        self._adaptive_limit.__exit__(None, None, None)
+
+    async def search_more_with_id_async(self, search_id, page_index):
+        """searchMoreWithId, made on the loop of the async engine."""
+        response = await self.request_async('searchMoreWithId', searchId=search_id, pageIndex=page_index)
+        result = response.body.searchResult
+        if not result.status.isSuccess:
+            raise self._request_error('searchMoreWithId', detail=result.status['statusDetail'][0])
+        result.records = result.recordList.record if hasattr(result.recordList, 'record') else None
+        return result
+
+    @contextlib.contextmanager
+    def header_only_searches(self):
+        """Searches made by this thread in the block return body fields only,
+        and Transaction searches match main lines only."""
+        header_only = self._header_only()
+        self._local.header_only = True
+        try:
+            yield
+        finally:
+            self._local.header_only = header_only
+
+    def _header_only(self):
+        return getattr(self._local, 'header_only', False)
+
+    def basic_search_factory(self, type_name, **kwargs):
+        if type_name == 'Transaction' and self._header_only():
+            kwargs.setdefault('mainLine', self.SearchBooleanField(searchValue=True))
+        return NetSuiteClient.basic_search_factory(self, type_name, **kwargs)
+
+    def _build_soap_headers(self, include_search_preferences=False, header_only=None):
+        soapheaders = NetSuiteClient._build_soap_headers(self, include_search_preferences)
+        if include_search_preferences and (self._header_only() if header_only is None else header_only):
+            soapheaders['searchPreferences'] = self._header_search_preferences
+        return soapheaders
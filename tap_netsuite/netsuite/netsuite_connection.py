@@ -15,21 +15,90 @@ from netsuitesdk.api.custom_lists import CustomLists
 from netsuitesdk.api.custom_records import CustomRecords
 from netsuitesdk.api.price_level import PriceLevel
 
+import contextlib
+import functools
+import threading
 import time
+from collections.abc import Mapping
 import json
 import singer
-from .transaction_entities import Customers, PurchaseOrder, Invoice, JournalEntries, InventoryTransfer, InventoryAdjustment, InventoryItem, VendorBills, VendorPayments, SalesOrders, CreditMemos, Items, Address, CustomFieldType, SubtotalItem, Topic, CostCategory, ItemDemandPlan, LotNumberedInventoryItem, CampaignChannel, State, TaxAcct, CouponCode, VendorCategory, TaxType, NonInventorySaleItem, SupportCaseStatus, LeadSource, CurrencyRate, WinLossReason, SupportCaseOrigin, Deposit, TaxGroup, TransactionColumnCustomField, Opportunity, ItemNumberCustomField, StatisticalJournalEntry, InventoryDetail, CampaignSearchEngine, GlobalAccountMapping, FairValuePrice, SupportCaseType, Solution, RevRecTemplate, TimeBill, Charge, InterCompanyTransferOrder, ItemRevision, Contact, CampaignResponse, PromotionCode, WorkOrderClose, PurchaseRequisition, JobType, Term, Issue, ManufacturingRouting, ServiceSaleItem, InventoryCostRevaluation, UnitsType, EntityGroup, DepositApplication, SalesTaxItem, CustomTransaction, LandedCost, Task, TimeSheet, GiftCertificate, KitItem, DescriptionItem, ItemFulfillment, ContactCategory, CustomerMessage, OtherChargeResaleItem, NoteType, VendorReturnAuthorization, Job, CampaignSubscription, CampaignFamily, CrmCustomField, BinWorksheet, SerializedInventoryItem, DiscountItem, CustomerRefund, TransferOrder, PartnerCategory, OtherChargePurchaseItem, BinTransfer, PaymentMethod, ItemAccountMapping, CustomerStatus, Estimate, SalesRole, ManufacturingCostTemplate, AssemblyUnbuild, ItemSupplyPlan, NonInventoryResaleItem, BillingSchedule, PaymentItem, ItemGroup, WorkOrder, WorkOrderIssue, SupportCaseIssue, ContactRole, CustomerPayment, PricingGroup, SupportCasePriority, Campaign, LotNumberedAssemblyItem, InventoryNumber, VendorCredit, CustomRecordCustomField, CustomerDeposit, SupportCase, ServicePurchaseItem, CampaignOffer, CampaignAudience, AccountingPeriod, ServiceResaleItem, CustomerCategory, RevRecSchedule, CashSale, CalendarEvent, CampaignVertical, OtherCustomField, EntityCustomField, PayrollItem, SerializedAssemblyItem, OtherNameCategory, ReturnAuthorization, Nexus, TransactionBodyCustomField, WorkOrderCompletion, BudgetCategory, SiteCategory, DownloadItem, CustomRecordType, ItemOptionCustomField, CashRefund, ResourceAllocation, ItemReceipt, ManufacturingOperationTask, PhoneCall, BillingAccount, NonInventoryPurchaseItem, MarkupItem, ProjectTask, PaycheckJournal, Partner, AssemblyItem, GiftCertificateItem, JobStatus, InterCompanyJournalEntry, Budget, OtherChargeSaleItem, Note, AssemblyBuild, Bin, CampaignCategory, TimeEntry, Check, ItemCustomField, Message
+from .transaction_entities import (SEARCH_ENTITIES, EntityDefinition, ItemScan, SearchEntity, TransactionLines,
+                                   TransactionScan)
 from .netsuite_client import ExtendedNetSuiteClient
 
 LOGGER = singer.get_logger()
 
 
+# Stream names and the factories of their entities
+ENTITY_FACTORIES = {
+    **SEARCH_ENTITIES,
+    'Accounts': Accounts,
+    'Classifications': Classifications,
+    'Vendors': Vendors,
+    'PriceLevel': PriceLevel,
+    'Department': Departments,
+    'Folder': Folders,
+    'Location': Locations,
+    'Subsidiary': Subsidiaries,
+    'ExpenseReport': ExpenseReports,
+    'ExpenseCategory': ExpenseCategory,
+    'CustomRecord': CustomRecords,
+    'Employee': Employees,
+    'File': Files,
+    'CustomList': CustomLists,
+    'Currency': Currencies,
+}
+
+# Item lines of transactions, synced as streams of their own
+ENTITY_FACTORIES.update({
+    f'{stream}Lines': functools.partial(TransactionLines, transaction=ENTITY_FACTORIES[stream])
+    for stream in ['SalesOrders', 'Invoice', 'CreditMemos', 'Estimate', 'CashSale', 'ReturnAuthorization',
+                   'PurchaseOrder', 'VendorBills', 'VendorCredit']
+})
+
+
+class EntityRegistry(Mapping):
+    """Maps stream names to their entities, built on first use from their factories."""
+
+    def __init__(self, ns_client, factories):
+        self.ns_client = ns_client
+        self.factories = factories
+        self._entities = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, stream):
+        entity = self._entities.get(stream)
+        if entity is None:
+            factory = self.factories[stream]
+            with self._lock:
+                entity = self._entities.get(stream)
+                if entity is None:
+                    entity = self._entities[stream] = factory(self.ns_client)
+        return entity
+
+    def __iter__(self):
+        return iter(self.factories)
+
+    def __len__(self):
+        return len(self.factories)
+
+
 class ExtendedNetSuiteConnection:
-    def __init__(self, account, consumer_key, consumer_secret, token_key, token_secret, caching=True):
+    def __init__(self, account, consumer_key, consumer_secret, token_key, token_secret, caching=True,
+                 concurrency_limit=None, page_fetch_workers=1, cache_dir=None, wsdl_bundle=None,
+                 request_slots_dir=None, max_retries=None, retry_max_seconds=None, stream_search_results=False,
+                 decode_search_results=False, connect_timeout=None, read_timeout=None, async_engine=False):
         # NetSuiteConnection.__init__(self, account, consumer_key, consumer_secret, token_key, token_secret)
         # ns_client: NetSuiteClient = self.client
 
-        ns_client = ExtendedNetSuiteClient(account=account, caching=caching)
+        ns_client = ExtendedNetSuiteClient(account=account, caching=caching, concurrency_limit=concurrency_limit,
+                                           page_fetch_workers=page_fetch_workers, cache_dir=cache_dir,
+                                           wsdl_bundle=wsdl_bundle, request_slots_dir=request_slots_dir,
+                                           max_retries=max_retries, retry_max_seconds=retry_max_seconds,
+                                           stream_search_results=stream_search_results,
+                                           decode_search_results=decode_search_results,
+                                           connect_timeout=connect_timeout, read_timeout=read_timeout,
+                                           async_engine=async_engine)
         ns_client.connect_tba(
             consumer_key=consumer_key,
             consumer_secret=consumer_secret,
@@ -37,205 +106,36 @@ class ExtendedNetSuiteConnection:
             token_secret=token_secret
         )
         self.client = ns_client
-        self.departments = Departments(ns_client)
-        self.currencies = Currencies(ns_client)
-        self.locations = Locations(ns_client)
-        self.vendor_bills = VendorBills(ns_client)
-        self.vendors = Vendors(ns_client)
-        self.subsidiaries = Subsidiaries(ns_client)
-        self.employees = Employees(ns_client)
-        self.expense_reports = ExpenseReports(ns_client)
-        self.folders = Folders(ns_client)
-        self.files = Files(ns_client)
-        self.expense_categories = ExpenseCategory(ns_client)
-        self.custom_lists = CustomLists(ns_client)
-        self.custom_records = CustomRecords(ns_client)
-        self.projects = Projects(ns_client)
-        self.vendor_payments = VendorPayments(ns_client)
-        self.invoice = Invoice(ns_client)
+        self.entities = EntityRegistry(ns_client, ENTITY_FACTORIES)
+
+    # Entities of the underlying NetSuiteConnection, built on first use
+    departments = property(lambda self: self.entities['Department'])
+    currencies = property(lambda self: self.entities['Currency'])
+    locations = property(lambda self: self.entities['Location'])
+    vendor_bills = property(lambda self: self.entities['VendorBills'])
+    vendors = property(lambda self: self.entities['Vendors'])
+    subsidiaries = property(lambda self: self.entities['Subsidiary'])
+    employees = property(lambda self: self.entities['Employee'])
+    expense_reports = property(lambda self: self.entities['ExpenseReport'])
+    folders = property(lambda self: self.entities['Folder'])
+    files = property(lambda self: self.entities['File'])
+    expense_categories = property(lambda self: self.entities['ExpenseCategory'])
+    custom_lists = property(lambda self: self.entities['CustomList'])
+    custom_records = property(lambda self: self.entities['CustomRecord'])
+    vendor_payments = property(lambda self: self.entities['VendorPayment'])
+    invoice = property(lambda self: self.entities['Invoice'])
+
+    @functools.cached_property
+    def projects(self):
+        return Projects(self.client)
 
-        self.entities = {
-            'Customer': Customers(ns_client),
-            'Invoice': Invoice(ns_client),
-            'Accounts': Accounts(ns_client),
-            'JournalEntry': JournalEntries(ns_client),
-            'Commission': JournalEntries(ns_client),
-            'Classifications': Classifications(ns_client),
-            'Vendors': self.vendors,
-            'VendorBills': self.vendor_bills,
-            'VendorPayment': self.vendor_payments,
-            'InventoryAdjustment': InventoryAdjustment(ns_client),
-            'InventoryTransfer': InventoryTransfer(ns_client),
-            'PriceLevel': PriceLevel(ns_client),
-            'InventoryItem': InventoryItem(ns_client),
-            'SalesOrders': SalesOrders(ns_client),
-            'CreditMemos': CreditMemos(ns_client),
-            'Items': Items(ns_client),
-            'PurchaseOrder': PurchaseOrder(ns_client),
-            
-            'Address': Address(ns_client),
-            'CustomFieldType': CustomFieldType(ns_client),
-            'SubtotalItem': SubtotalItem(ns_client),
-            'Topic': Topic(ns_client),
-            'CostCategory': CostCategory(ns_client),
-            'ItemDemandPlan': ItemDemandPlan(ns_client),
-            'Department': Departments(ns_client),
-            'LotNumberedInventoryItem': LotNumberedInventoryItem(ns_client),
-            'CampaignChannel': CampaignChannel(ns_client),
-            'State': State(ns_client),
-            'TaxAcct': TaxAcct(ns_client),
-            'CouponCode': CouponCode(ns_client),
-            'VendorCategory': VendorCategory(ns_client),
-            'TaxType': TaxType(ns_client),
-            'NonInventorySaleItem': NonInventorySaleItem(ns_client),
-            'SupportCaseStatus': SupportCaseStatus(ns_client),
-            'LeadSource': LeadSource(ns_client),
-            'CurrencyRate': CurrencyRate(ns_client),
-            'Folder': Folders(ns_client),
-            'Location': Locations(ns_client),
-            'WinLossReason': WinLossReason(ns_client),
-            'SupportCaseOrigin': SupportCaseOrigin(ns_client),
-            'Deposit': Deposit(ns_client),
-            'TaxGroup': TaxGroup(ns_client),
-            'TransactionColumnCustomField': TransactionColumnCustomField(ns_client),
-            'Opportunity': Opportunity(ns_client),
-            'ItemNumberCustomField': ItemNumberCustomField(ns_client),
-            'StatisticalJournalEntry': StatisticalJournalEntry(ns_client),
-            'InventoryDetail': InventoryDetail(ns_client),
-            'CampaignSearchEngine': CampaignSearchEngine(ns_client),
-            'GlobalAccountMapping': GlobalAccountMapping(ns_client),
-            'FairValuePrice': FairValuePrice(ns_client),
-            'SupportCaseType': SupportCaseType(ns_client),
-            'Solution': Solution(ns_client),
-            'RevRecTemplate': RevRecTemplate(ns_client),
-            'TimeBill': TimeBill(ns_client),
-            'Charge': Charge(ns_client),
-            'Subsidiary': Subsidiaries(ns_client),
-            'InterCompanyTransferOrder': InterCompanyTransferOrder(ns_client),
-            'ItemRevision': ItemRevision(ns_client),
-            'Contact': Contact(ns_client),
-            'CampaignResponse': CampaignResponse(ns_client),
-            'PromotionCode': PromotionCode(ns_client),
-            'WorkOrderClose': WorkOrderClose(ns_client),
-            'PurchaseRequisition': PurchaseRequisition(ns_client),
-            'JobType': JobType(ns_client),
-            'Term': Term(ns_client),
-            'Issue': Issue(ns_client),
-            'ManufacturingRouting': ManufacturingRouting(ns_client),
-            'ServiceSaleItem': ServiceSaleItem(ns_client),
-            'ExpenseReport': ExpenseReports(ns_client),
-            'InventoryCostRevaluation': InventoryCostRevaluation(ns_client),
-            'UnitsType': UnitsType(ns_client),
-            'EntityGroup': EntityGroup(ns_client),
-            'DepositApplication': DepositApplication(ns_client),
-            'SalesTaxItem': SalesTaxItem(ns_client),
-            'CustomTransaction': CustomTransaction(ns_client),
-            'LandedCost': LandedCost(ns_client),
-            'Task': Task(ns_client),
-            'TimeSheet': TimeSheet(ns_client),
-            'GiftCertificate': GiftCertificate(ns_client),
-            'KitItem': KitItem(ns_client),
-            'DescriptionItem': DescriptionItem(ns_client),
-            'ItemFulfillment': ItemFulfillment(ns_client),
-            'ContactCategory': ContactCategory(ns_client),
-            'CustomerMessage': CustomerMessage(ns_client),
-            'OtherChargeResaleItem': OtherChargeResaleItem(ns_client),
-            'NoteType': NoteType(ns_client),
-            'VendorReturnAuthorization': VendorReturnAuthorization(ns_client),
-            'Job': Job(ns_client),
-            'ExpenseCategory': ExpenseCategory(ns_client),
-            'CampaignSubscription': CampaignSubscription(ns_client),
-            'CampaignFamily': CampaignFamily(ns_client),
-            'CrmCustomField': CrmCustomField(ns_client),
-            'BinWorksheet': BinWorksheet(ns_client),
-            'SerializedInventoryItem': SerializedInventoryItem(ns_client),
-            'DiscountItem': DiscountItem(ns_client),
-            'CustomerRefund': CustomerRefund(ns_client),
-            'TransferOrder': TransferOrder(ns_client),
-            'PartnerCategory': PartnerCategory(ns_client),
-            'OtherChargePurchaseItem': OtherChargePurchaseItem(ns_client),
-            'BinTransfer': BinTransfer(ns_client),
-            'PaymentMethod': PaymentMethod(ns_client),
-            'ItemAccountMapping': ItemAccountMapping(ns_client),
-            'CustomerStatus': CustomerStatus(ns_client),
-            'Estimate': Estimate(ns_client),
-            'SalesRole': SalesRole(ns_client),
-            'ManufacturingCostTemplate': ManufacturingCostTemplate(ns_client),
-            'AssemblyUnbuild': AssemblyUnbuild(ns_client),
-            'ItemSupplyPlan': ItemSupplyPlan(ns_client),
-            'NonInventoryResaleItem': NonInventoryResaleItem(ns_client),
-            'BillingSchedule': BillingSchedule(ns_client),
-            'PaymentItem': PaymentItem(ns_client),
-            'CustomRecord': CustomRecords(ns_client),
-            'ItemGroup': ItemGroup(ns_client),
-            'WorkOrder': WorkOrder(ns_client),
-            'WorkOrderIssue': WorkOrderIssue(ns_client),
-            'SupportCaseIssue': SupportCaseIssue(ns_client),
-            'ContactRole': ContactRole(ns_client),
-            'CustomerPayment': CustomerPayment(ns_client),
-            'Employee': Employees(ns_client),
-            'PricingGroup': PricingGroup(ns_client),
-            'SupportCasePriority': SupportCasePriority(ns_client),
-            'Campaign': Campaign(ns_client),
-            'LotNumberedAssemblyItem': LotNumberedAssemblyItem(ns_client),
-            'InventoryNumber': InventoryNumber(ns_client),
-            'VendorCredit': VendorCredit(ns_client),
-            'CustomRecordCustomField': CustomRecordCustomField(ns_client),
-            'CustomerDeposit': CustomerDeposit(ns_client),
-            'SupportCase': SupportCase(ns_client),
-            'ServicePurchaseItem': ServicePurchaseItem(ns_client),
-            'CampaignOffer': CampaignOffer(ns_client),
-            'CampaignAudience': CampaignAudience(ns_client),
-            'AccountingPeriod': AccountingPeriod(ns_client),
-            'ServiceResaleItem': ServiceResaleItem(ns_client),
-            'CustomerCategory': CustomerCategory(ns_client),
-            'RevRecSchedule': RevRecSchedule(ns_client),
-            'CashSale': CashSale(ns_client),
-            'CalendarEvent': CalendarEvent(ns_client),
-            'File': Files(ns_client),
-            'CampaignVertical': CampaignVertical(ns_client),
-            'OtherCustomField': OtherCustomField(ns_client),
-            'EntityCustomField': EntityCustomField(ns_client),
-            'PayrollItem': PayrollItem(ns_client),
-            'SerializedAssemblyItem': SerializedAssemblyItem(ns_client),
-            'OtherNameCategory': OtherNameCategory(ns_client),
-            'ReturnAuthorization': ReturnAuthorization(ns_client),
-            'CustomList': CustomLists(ns_client),
-            'Nexus': Nexus(ns_client),
-            'TransactionBodyCustomField': TransactionBodyCustomField(ns_client),
-            'WorkOrderCompletion': WorkOrderCompletion(ns_client),
-            'BudgetCategory': BudgetCategory(ns_client),
-            'SiteCategory': SiteCategory(ns_client),
-            'DownloadItem': DownloadItem(ns_client),
-            'CustomRecordType': CustomRecordType(ns_client),
-            'ItemOptionCustomField': ItemOptionCustomField(ns_client),
-            'CashRefund': CashRefund(ns_client),
-            'ResourceAllocation': ResourceAllocation(ns_client),
-            'ItemReceipt': ItemReceipt(ns_client),
-            'ManufacturingOperationTask': ManufacturingOperationTask(ns_client),
-            'PhoneCall': PhoneCall(ns_client),
-            'BillingAccount': BillingAccount(ns_client),
-            'NonInventoryPurchaseItem': NonInventoryPurchaseItem(ns_client),
-            'MarkupItem': MarkupItem(ns_client),
-            'ProjectTask': ProjectTask(ns_client),
-            'PaycheckJournal': PaycheckJournal(ns_client),
-            'Partner': Partner(ns_client),
-            'AssemblyItem': AssemblyItem(ns_client),
-            'GiftCertificateItem': GiftCertificateItem(ns_client),
-            'JobStatus': JobStatus(ns_client),
-            'InterCompanyJournalEntry': InterCompanyJournalEntry(ns_client),
-            'Budget': Budget(ns_client),
-            'OtherChargeSaleItem': OtherChargeSaleItem(ns_client),
-            'Note': Note(ns_client),
-            'AssemblyBuild': AssemblyBuild(ns_client),
-            'Currency': Currencies(ns_client),
-            'Bin': Bin(ns_client),
-            'CampaignCategory': CampaignCategory(ns_client),
-            'TimeEntry': TimeEntry(ns_client),
-            'Check': Check(ns_client),
-            'ItemCustomField': ItemCustomField(ns_client),
-            'Message': Message(ns_client)
-        }
+    @functools.cached_property
+    def transaction_scan(self):
+        return TransactionScan(self.client)
+
+    @functools.cached_property
+    def item_scan(self):
+        return ItemScan(self.client)
 
     def _query_entity(self, data, entity, stream):
         to_get_results_for = data.get(stream)
@@ -248,15 +148,31 @@ class ExtendedNetSuiteConnection:
                         time.time() - start_time))
             yield to_return
 
-    def query_entity(self, stream=None, lastModifiedDate=None):
+    def _search_entity(self, stream):
+        entity = self.entities[stream]
+        if not hasattr(entity, 'get_all_keyset'):
+            # Entities of the SDK are searched like the search entities
+            entity = SearchEntity(self.client, EntityDefinition(entity.type_name, entity.type_name,
+                                                                require_lastModified_date=False))
+        return entity
+
+    def query_entity(self, stream=None, lastModifiedDate=None, header_only=False, keyset=False, after=None):
         start_time = time.time()
         LOGGER.info(f"Starting fetch data for stream {stream}")
-        entity = self.entities[stream]
+        entity = self._search_entity(stream) if keyset else self.entities[stream]
 
-        if hasattr(entity, 'require_lastModified_date') and entity.require_lastModified_date is True:
-            data = entity.get_all(lastModifiedDate)
-        else:
-            data = entity.get_all()
+        with self.client.header_only_searches() if header_only else contextlib.nullcontext():
+            if keyset:
+                # The pages are searched as they are iterated, each in header only mode
+                if getattr(entity, 'require_lastModified_date', False) is True:
+                    data = entity.get_all_keyset(last_modified_date=lastModifiedDate, after=after,
+                                                 header_only=header_only)
+                else:
+                    data = entity.get_all_keyset(after=after, header_only=header_only)
+            elif hasattr(entity, 'require_lastModified_date') and entity.require_lastModified_date is True:
+                data = entity.get_all(lastModifiedDate)
+            else:
+                data = entity.get_all()
 
         # It is broken, maybe because of the change in the _paginated_search_to_generator in the API
         # if hasattr(entity, 'require_paging') and entity.require_paging is True:
@@ -273,3 +189,33 @@ class ExtendedNetSuiteConnection:
         #     oj.write(json.dumps({stream: to_return}, default=str, indent=2))
 
         return to_return
+
+    def query_partitioned(self, stream, partitions, max_workers, ordered=True, header_only=False,
+                          lastModifiedDate=None):
+        """Searches the records of the stream in up to partitions internalId ranges fetched concurrently,
+        those modified since lastModifiedDate if the stream's searches require it."""
+        start_time = time.time()
+        LOGGER.info(f"Starting fetch data for stream {stream} in {partitions} partitions")
+        entity = self._search_entity(stream)
+        if getattr(entity, 'require_lastModified_date', False) is not True:
+            lastModifiedDate = None
+        to_return = entity.get_all_partitioned(partitions, max_workers, ordered, last_modified_date=lastModifiedDate,
+                                               header_only=header_only)
+        LOGGER.info("--- %s seconds ---" % (time.time() - start_time))
+        return to_return
+
+    def query_transactions(self, record_types, lastModifiedDate=None):
+        """Searches the Transaction records of all record_types at once."""
+        start_time = time.time()
+        LOGGER.info(f"Starting fetch data for transaction types {', '.join(record_types)}")
+        to_return = self.transaction_scan.get_all(record_types, lastModifiedDate)
+        LOGGER.info("--- %s seconds ---" % (time.time() - start_time))
+        return to_return
+
+    def query_items(self, record_types=None, lastModifiedDate=None):
+        """Searches the Item records of all record_types at once, or all items if None."""
+        start_time = time.time()
+        LOGGER.info(f"Starting fetch data for item types {', '.join(record_types or ['all'])}")
+        to_return = self.item_scan.get_all(record_types, lastModifiedDate)
+        LOGGER.info("--- %s seconds ---" % (time.time() - start_time))
+        return to_return
@@ -0,0 +1,451 @@
+import asyncio
+import contextvars
+import queue
+import threading
+from collections import deque
+from concurrent import futures
+from itertools import islice
+
+import singer
+from zeep.helpers import serialize_object
+
+from tap_netsuite.netsuite.exceptions import TapNetSuiteException
+from tap_netsuite.netsuite.retry import submit_in_context
+
+LOGGER = singer.get_logger()
+
+
+class SearchPages:
+    """Iterates over the record pages of a PaginatedSearch.
+
+    The search must have been performed, its result is the first page. Once
+    it is known how many pages there are, the remaining ones are independent
+    searchMoreWithId requests: with max_workers > 1 up to that many of them
+    are in flight at once, the pages are still yielded in page order.
+
+    The pages are also an async iterable, fetched on the loop of the client's
+    async engine, which iterating over them uses if the client has one.
+
+    NetSuite returns the records of a basic search in internalId order,
+    last_internal_id is that of the last record of the page yielded last."""
+
+    keyset = False
+
+    def __init__(self, paginated_search, max_workers=1):
+        self.paginated_search = paginated_search
+        self.max_workers = max(int(max_workers or 1), 1)
+        self.last_internal_id = None
+
+    @property
+    def total_records(self):
+        return self.paginated_search.total_records or 0
+
+    @property
+    def total_pages(self):
+        return self.paginated_search.total_pages or 0
+
+    def fetch_page(self, page_index):
+        result = self.paginated_search._ns.searchMoreWithId(  # pylint: disable=protected-access
+            searchId=self.paginated_search._result.searchId,  # pylint: disable=protected-access
+            pageIndex=page_index)
+        return search_page(result)
+
+    async def fetch_page_async(self, page_index):
+        result = await self.paginated_search._ns.search_more_with_id_async(  # pylint: disable=protected-access
+            self.paginated_search._result.searchId,  # pylint: disable=protected-access
+            page_index)
+        return search_page(result)
+
+    def __iter__(self):
+        for page in self._pages():
+            internal_id = last_internal_id(page)
+            if internal_id is not None:
+                self.last_internal_id = internal_id
+            yield page
+
+    def _pages(self):
+        if self.paginated_search.num_records == 0:
+            return
+
+        engine = getattr(self.paginated_search._ns, 'engine', None)  # pylint: disable=protected-access
+        if engine is not None:
+            yield from engine.iterate(self)
+            return
+
+        page_indexes = self._page_indexes()
+        yield search_page(self.paginated_search._result)  # pylint: disable=protected-access
+        if self.max_workers == 1 or len(page_indexes) <= 1:
+            for page_index in page_indexes:
+                LOGGER.debug('going to page %d', page_index)
+                yield self.fetch_page(page_index)
+            return
+
+        executor = futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            page_indexes = iter(page_indexes)
+            in_flight = deque(submit_in_context(executor, self.fetch_page, page_index)
+                              for page_index in islice(page_indexes, self.max_workers))
+            while in_flight:
+                page = in_flight.popleft().result()
+                page_index = next(page_indexes, None)
+                if page_index is not None:
+                    in_flight.append(submit_in_context(executor, self.fetch_page, page_index))
+                yield page
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aiter__(self):
+        if self.paginated_search.num_records == 0:
+            return
+
+        page_indexes = iter(self._page_indexes())
+        yield search_page(self.paginated_search._result)  # pylint: disable=protected-access
+        in_flight = deque(asyncio.ensure_future(self.fetch_page_async(page_index))
+                          for page_index in islice(page_indexes, self.max_workers))
+        try:
+            while in_flight:
+                page = await in_flight.popleft()
+                page_index = next(page_indexes, None)
+                if page_index is not None:
+                    in_flight.append(asyncio.ensure_future(self.fetch_page_async(page_index)))
+                yield page
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    def _page_indexes(self):
+        """The indexes of the pages fetched after the first one."""
+        LOGGER.debug('total pages = %d, records in page = %d', self.total_pages, self.paginated_search.num_records)
+        return range(2, self.total_pages + 1)
+
+
+class KeysetPages:
+    """Iterates over the record pages of a search in internalId order, one
+    search per page.
+
+    search_range(after, before) performs the search for the records with an
+    internalIdNumber greater than after and lower than before, either bound
+    None if there is none, and returns its PaginatedSearch. Its first page is
+    the next page; no search session is kept between pages, so a page is
+    searched again on its own when its request is retried and the iteration
+    can resume after any internalId. NetSuite returns the records of a basic
+    search in internalId order, a search that does not cannot be paged this way."""
+
+    keyset = True
+
+    def __init__(self, search_range, after=None, before=None):
+        self.search_range = search_range
+        self.last_internal_id = after
+        self.before = before
+        self.total_records = 0
+        self.total_pages = 0
+
+    def resume_after(self, internal_id):
+        """Starts the iteration after the record internal_id."""
+        self.last_internal_id = internal_id
+        return self
+
+    def __iter__(self):
+        first = True
+        while True:
+            paginated_search = self.search_range(self.last_internal_id, self.before)
+            if first:
+                # Pages searched later count the records left, not these
+                self.total_records = paginated_search.total_records or 0
+                self.total_pages = paginated_search.total_pages or 0
+                first = False
+            if not paginated_search.num_records:
+                return
+            records = paginated_search.records
+            if hasattr(records, 'internal_ids'):
+                # Streamed pages are kept as they are, their records converted when synced only
+                internal_ids = [int(internal_id) for internal_id in records.internal_ids()]
+            else:
+                records = search_page(paginated_search._result)  # pylint: disable=protected-access
+                internal_ids = [int(rec['internalId']) for rec in records]
+            if internal_ids != sorted(internal_ids) or (
+                    self.last_internal_id is not None and internal_ids[0] <= self.last_internal_id):
+                raise TapNetSuiteException('The search results are not in internalId order, '
+                                           'they cannot be paged by internalId')
+            self.last_internal_id = internal_ids[-1]
+            LOGGER.debug('records left = %d, last internalId = %d',
+                         paginated_search.total_records, self.last_internal_id)
+            yield records
+            if (paginated_search.total_pages or 0) <= 1:
+                return
+
+
+class PartitionedPages:
+    """Iterates over the pages of consecutive internalId ranges of a search,
+    each a KeysetPages, fetched concurrently.
+
+    Up to max_workers ranges are fetched at once. Ordered, the pages are
+    yielded in internalId order, range after range; otherwise as soon as
+    they are fetched. Each range holds at most BUFFERED_PAGES fetched pages
+    that were not yielded yet, a range waits for them to be yielded before
+    fetching more."""
+
+    keyset = False
+    BUFFERED_PAGES = 10
+
+    def __init__(self, partitions, max_workers=1, ordered=True, total_records=0):
+        self.partitions = partitions
+        self.max_workers = max(int(max_workers or 1), 1)
+        self.ordered = ordered
+        self.total_records = total_records
+
+    def __iter__(self):
+        stop = threading.Event()
+        if self.ordered:
+            queues = [queue.Queue(self.BUFFERED_PAGES) for _ in self.partitions]
+        else:
+            queues = [queue.Queue(self.BUFFERED_PAGES * len(self.partitions))] * len(self.partitions)
+
+        def put(partition_queue, item):
+            while not stop.is_set():
+                try:
+                    partition_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fetch(pages, partition_queue):
+            try:
+                for page in pages:
+                    if not put(partition_queue, page):
+                        return
+                put(partition_queue, None)
+            except BaseException as e:  # pylint: disable=broad-except
+                put(partition_queue, e)
+
+        executor = futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            # Ranges are started in order, a range waited for is always running or done
+            for pages, partition_queue in zip(self.partitions, queues):
+                submit_in_context(executor, fetch, pages, partition_queue)
+            pending = len(self.partitions)
+            partition_queues = iter(queues)
+            partition_queue = next(partition_queues, None)
+            while pending:
+                item = partition_queue.get()
+                if isinstance(item, BaseException):
+                    raise item
+                if item is None:
+                    pending -= 1
+                    if self.ordered:
+                        partition_queue = next(partition_queues, None)
+                    continue
+                yield item
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class SearchLines:
+    """Iterates over pages of the item lines of the records of a search.
+
+    Every line is a record of its own, holding the transaction's internalId
+    and lastModifiedDate, and an internalId made of the transaction's and
+    the line number. total_records counts transactions, not lines."""
+
+    def __init__(self, pages, list_name='itemList', item_name='item'):
+        self.pages = pages
+        self.list_name = list_name
+        self.item_name = item_name
+
+    @property
+    def total_records(self):
+        return self.pages.total_records
+
+    @property
+    def total_pages(self):
+        return self.pages.total_pages
+
+    @property
+    def keyset(self):
+        return self.pages.keyset
+
+    @property
+    def last_internal_id(self):
+        return self.pages.last_internal_id
+
+    def resume_after(self, internal_id):
+        self.pages.resume_after(internal_id)
+        return self
+
+    def record_lines(self, rec):
+        item_list = rec[self.list_name] if self.list_name in rec else None
+        for line in (item_list[self.item_name] if item_list is not None else None) or []:
+            line = serialize_object(line, dict)
+            line['transaction'] = rec['internalId']
+            line['internalId'] = f"{rec['internalId']}_{line.get('line')}"
+            line['lastModifiedDate'] = rec['lastModifiedDate']
+            yield line
+
+    def __iter__(self):
+        for page in self.pages:
+            yield [line for rec in page for line in self.record_lines(rec)]
+
+
+def last_internal_id(page):
+    """The internalId of the last record of a page, None if it is empty."""
+    if hasattr(page, 'last_internal_id'):
+        internal_id = page.last_internal_id
+    else:
+        internal_id = page[-1]['internalId'] if page else None
+    return int(internal_id) if internal_id is not None else None
+
+
+class FetchedPages:
+    """The pages of a search, all fetched when created, iterated as the search's.
+
+    last_internal_id is that of the search after the page yielded last."""
+
+    def __init__(self, pages):
+        self.keyset = getattr(pages, 'keyset', False)
+        self.last_internal_id = getattr(pages, 'last_internal_id', None)
+        self.pages = [(page, getattr(pages, 'last_internal_id', None)) for page in pages]
+
+    def __iter__(self):
+        for page, self.last_internal_id in self.pages:
+            yield page
+
+
+class ResponsePage(list):
+    """The records of a search page converted by zeep, with the bytes of their response."""
+
+    def __init__(self, records, response_bytes):
+        super().__init__(records)
+        self.response_bytes = response_bytes
+
+
+def search_page(result):
+    """The records of a search result, a ResponsePage unless they are streamed."""
+    records = result.records
+    if hasattr(records, 'content'):
+        return records
+    return ResponsePage(records or [], getattr(result, 'response_bytes', 0))
+
+
+def page_bytes(page):
+    """The bytes of the response of a page, 0 if unknown."""
+    content = getattr(page, 'content', None)
+    if content is not None:
+        return len(content)
+    return getattr(page, 'response_bytes', 0)
+
+
+class PrefetchBudget:
+    """The bytes of the pages fetched ahead by every PrefetchedPages sharing it, up to max_bytes."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.held = 0
+        self.condition = threading.Condition()
+
+    def fits(self, size):
+        return self.held + size <= self.max_bytes
+
+
+class PrefetchedPages:
+    """Iterates over pages fetched ahead from a thread of their own.
+
+    Up to depth pages are fetched and held while the page yielded last is
+    synced. Before a page is fetched, as many bytes as the page fetched
+    before it are reserved from the budget, and the fetch waits while they
+    would exceed its max_bytes with the pages held by every PrefetchedPages
+    sharing it, unless the page is the next one to yield. Once fetched, the
+    page holds the bytes of its response instead. last_internal_id is that
+    of the page yielded last, not of the page fetched last."""
+
+    def __init__(self, pages, depth, budget):
+        self.pages = pages
+        self.depth = max(int(depth or 1), 1)
+        self.budget = budget
+        self.last_internal_id = getattr(pages, 'last_internal_id', None)
+
+    @property
+    def total_records(self):
+        return self.pages.total_records
+
+    @property
+    def total_pages(self):
+        return self.pages.total_pages
+
+    @property
+    def keyset(self):
+        return getattr(self.pages, 'keyset', False)
+
+    def __iter__(self):
+        condition = self.budget.condition
+        held = deque()
+        stop = threading.Event()
+        fetched = []
+
+        def fetch():
+            # The pages of a search are about as large, the next one as the one fetched last
+            reserved = 0
+            try:
+                pages = iter(self.pages)
+                while True:
+                    with condition:
+                        while (len(held) >= self.depth or held and not self.budget.fits(reserved)) \
+                                and not stop.is_set():
+                            condition.wait()
+                        if stop.is_set():
+                            return
+                        self.budget.held += reserved
+                    try:
+                        page = next(pages, None)
+                    except BaseException:
+                        with condition:
+                            self.budget.held -= reserved
+                        raise
+                    size = page_bytes(page) if page is not None else 0
+                    with condition:
+                        # The page holds its own bytes instead of those reserved
+                        self.budget.held += size - reserved
+                        reserved = size
+                        if page is None or stop.is_set():
+                            self.budget.held -= size
+                            break
+                        held.append((page, size, getattr(self.pages, 'last_internal_id', None)))
+                        condition.notify_all()
+                fetched.append(None)
+            except BaseException as e:  # pylint: disable=broad-except
+                fetched.append(e)
+            with condition:
+                condition.notify_all()
+
+        threading.Thread(target=contextvars.copy_context().run, args=(fetch,),
+                         name='netsuite-prefetch', daemon=True).start()
+        try:
+            while True:
+                with condition:
+                    while not held and not fetched:
+                        condition.wait()
+                    if not held:
+                        if fetched[0] is not None:
+                            raise fetched[0]
+                        return
+                    page, size, self.last_internal_id = held.popleft()
+                    self.budget.held -= size
+                    condition.notify_all()
+                yield page
+        finally:
+            with condition:
+                stop.set()
+                self.budget.held -= sum(size for _, size, _ in held)
+                held.clear()
+                condition.notify_all()
+
+
+def prefetch(pages, depth, budget):
+    """The pages, fetched ahead by a PrefetchedPages. The lines of
+    SearchLines are made from the pages fetched ahead, as synced."""
+    if isinstance(pages, (list, FetchedPages)):
+        return pages
+    if isinstance(pages, SearchLines):
+        return SearchLines(prefetch(pages.pages, depth, budget), pages.list_name, pages.item_name)
+    return PrefetchedPages(pages, depth, budget)
@@ -0,0 +1,170 @@
+import os
+import re
+import threading
+import time
+
+import singer
+from singer import metrics
+
+from tap_netsuite.netsuite.exceptions import TapNetSuiteException
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+LOGGER = singer.get_logger()
+
+# Polling interval while every slot is taken, doubling up to the maximum
+POLL_SECONDS = 0.01
+MAX_POLL_SECONDS = 0.25
+
+# Requests waiting longer than this for a slot count as having waited
+WAIT_SECONDS = 0.001
+
+# Requests succeeding in a row after which a lowered limit is raised by one
+RECOVER_REQUESTS = 50
+
+
+class AccountSlots:
+    """The request slots of a NetSuite account, shared by every process of
+    the machine using the same directory.
+
+    Each slot is a lock file in directory, held with an exclusive flock for
+    the duration of a request. The locks of a process are released by the
+    system when it exits, even if it is killed. Processes configured with
+    fewer slots use the first ones only, so that the processes of an account
+    never make more requests at once than the largest slot count. Used like
+    a semaphore, a thread releases the slot it acquired."""
+
+    def __init__(self, account, slots, directory):
+        if fcntl is None:
+            raise TapNetSuiteException('Request slots shared across processes need fcntl file locks')
+        os.makedirs(directory, exist_ok=True)
+        name = re.sub(r'[^A-Za-z0-9_-]', '_', account)
+        self.paths = [os.path.join(directory, f'{name}.{slot}.lock') for slot in range(slots)]
+        self._files = [None] * slots
+        self._held = set()
+        self._local = threading.local()
+        # Threads of this process first wait for one of its own slots
+        self._threads = threading.BoundedSemaphore(slots)
+        self._lock = threading.Lock()
+
+    def _try_acquire(self):
+        with self._lock:
+            for slot, path in enumerate(self.paths):
+                if slot in self._held:
+                    continue
+                if self._files[slot] is None:
+                    self._files[slot] = open(path, 'a+b')  # pylint: disable=consider-using-with
+                try:
+                    fcntl.flock(self._files[slot].fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    continue
+                self._held.add(slot)
+                return slot
+        return None
+
+    def acquire(self):
+        self._local.slot = self.acquire_slot()
+        return True
+
+    def acquire_slot(self):
+        """Waits for a slot and returns it, to be released with release_slot from any thread."""
+        self._threads.acquire()
+        try:
+            poll_seconds = POLL_SECONDS
+            while True:
+                slot = self._try_acquire()
+                if slot is not None:
+                    return slot
+                time.sleep(poll_seconds)
+                poll_seconds = min(poll_seconds * 2, MAX_POLL_SECONDS)
+        except BaseException:
+            self._threads.release()
+            raise
+
+    def release(self):
+        self.release_slot(self._local.slot)
+
+    def release_slot(self, slot):
+        with self._lock:
+            fcntl.flock(self._files[slot].fileno(), fcntl.LOCK_UN)
+            self._held.discard(slot)
+        self._threads.release()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *args):
+        self.release()
+
+
+class SlotWaits:
+    """How long the requests waited for a slot."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.waited = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+
+    def add(self, seconds):
+        with self._lock:
+            self.requests += 1
+            self.seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+            if seconds > WAIT_SECONDS:
+                self.waited += 1
+
+    def log(self, account):
+        with self._lock:
+            tags = {'account': account,
+                    'requests': self.requests,
+                    'waited': self.waited,
+                    'max_seconds': round(self.max_seconds, 3)}
+            metrics.log(LOGGER, metrics.Point('timer', 'request_slot_wait', round(self.seconds, 3), tags))
+
+
+class AdaptiveLimit:
+    """How many requests of this process may be made at once, at most limit.
+
+    Used like a semaphore. Each time NetSuite throttles a request the limit
+    is halved, it is raised back by one after every RECOVER_REQUESTS
+    requests succeeding in a row."""
+
+    def __init__(self, limit):
+        self.max_limit = limit
+        self.limit = limit
+        self.active = 0
+        self.successes = 0
+        self._condition = threading.Condition()
+
+    def __enter__(self):
+        with self._condition:
+            while self.active >= self.limit:
+                self._condition.wait()
+            self.active += 1
+        return self
+
+    def __exit__(self, *args):
+        with self._condition:
+            self.active -= 1
+            self._condition.notify()
+
+    def throttled(self):
+        with self._condition:
+            self.successes = 0
+            if self.limit > 1:
+                self.limit = max(self.limit // 2, 1)
+                LOGGER.warning('NetSuite is throttling requests, lowering the concurrent requests to %s', self.limit)
+
+    def succeeded(self):
+        with self._condition:
+            self.successes += 1
+            if self.successes >= RECOVER_REQUESTS and self.limit < self.max_limit:
+                self.successes = 0
+                self.limit += 1
+                LOGGER.info('Raising the concurrent requests back to %s', self.limit)
+                self._condition.notify_all()
@@ -0,0 +1,127 @@
+import contextlib
+import contextvars
+import random
+import threading
+
+import requests
+import singer
+from lxml import etree
+from singer import metrics
+from zeep.exceptions import TransportError
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+LOGGER = singer.get_logger()
+
+# Faults NetSuite may answer any request with, the throttling ones also lower the concurrency
+CONCURRENCY_LIMIT = 'concurrency_limit'
+REQUEST_LIMIT = 'request_limit'
+SESSION_TIMEOUT = 'session_timeout'
+TRANSIENT = 'transient'
+THROTTLING_FAULTS = {CONCURRENCY_LIMIT, REQUEST_LIMIT}
+
+FAULT_MARKERS = [
+    (CONCURRENCY_LIMIT, ['concurrent request limit exceeded', 'WS_CONCUR_SESSION_DISALLWD',
+                         'ExceededConcurrentRequestLimit', 'Only one request may be made against a session']),
+    (REQUEST_LIMIT, ['WS_REQUEST_BLOCKED', 'ExceededRequestLimit', 'request limit exceeded']),
+    (SESSION_TIMEOUT, ['SESSION_TIMED_OUT', 'session has timed out', 'INVALID_SESSION']),
+    (TRANSIENT, ['UNEXPECTED_ERROR']),
+]
+HTTP_FAULTS = {429: CONCURRENCY_LIMIT, 500: TRANSIENT, 502: TRANSIENT, 503: TRANSIENT, 504: TRANSIENT}
+TRANSIENT_ERRORS = (requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout,
+                    requests.exceptions.ChunkedEncodingError)
+if httpx is not None:
+    # Those of the requests sent with httpx by the async engine
+    TRANSIENT_ERRORS += (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+# Requests that read only, and can be made again
+RETRIED_OPERATIONS = {'search', 'searchMore', 'searchMoreWithId', 'searchNext', 'get', 'getList', 'getAll',
+                      'getDeleted', 'getSelectValue', 'getItemAvailability'}
+
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_MAX_DELAY_SECONDS = 60
+BASE_DELAY_SECONDS = 1
+
+# Stream the requests of this context are made for, copied into the threads working for it
+CURRENT_STREAM = contextvars.ContextVar('current_stream', default=None)
+
+
+def classify_fault(error):
+    """The kind of NetSuite fault error is, or None if retrying would not help."""
+    if isinstance(error, TransportError):
+        return HTTP_FAULTS.get(error.status_code)
+    if isinstance(error, TRANSIENT_ERRORS):
+        return TRANSIENT
+    text = ' '.join(str(part) for part in (error, getattr(error, 'code', None)) if part)
+    detail = getattr(error, 'detail', None)
+    if detail is not None:
+        text += ' ' + etree.tostring(detail, encoding='unicode')
+    for fault, markers in FAULT_MARKERS:
+        if any(marker in text for marker in markers):
+            return fault
+    return None
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter: the n-th retry waits between half of
+    and BASE_DELAY_SECONDS * 2 ** n seconds, capped by max_delay_seconds."""
+
+    def __init__(self, max_retries=None, max_delay_seconds=None):
+        self.max_retries = int(DEFAULT_MAX_RETRIES if max_retries is None else max_retries)
+        self.max_delay_seconds = float(max_delay_seconds or DEFAULT_MAX_DELAY_SECONDS)
+
+    def delay(self, retry):
+        delay = min(BASE_DELAY_SECONDS * 2 ** retry, self.max_delay_seconds)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+
+class RetryStats:
+    """Retries and seconds waited before them, by stream and fault. The
+    retries of a stream are logged as metrics once, when it is synced."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._retries = {}
+
+    def add(self, fault, seconds):
+        key = (CURRENT_STREAM.get(), fault)
+        with self._lock:
+            retries, waited = self._retries.get(key, (0, 0.0))
+            self._retries[key] = (retries + 1, waited + seconds)
+
+    def log(self, stream):
+        with self._lock:
+            stream_retries = {key: self._retries.pop(key) for key in list(self._retries) if key[0] == stream}
+        for (_, fault), (retries, waited) in sorted(stream_retries.items()):
+            tags = {'endpoint': stream, 'fault': fault}
+            metrics.log(LOGGER, metrics.Point('counter', 'retry_count', retries, tags))
+            metrics.log(LOGGER, metrics.Point('timer', 'retry_wait', round(waited, 3), tags))
+
+    def log_all(self):
+        """Logs the retries not logged yet, e.g. those of the shared searches."""
+        with self._lock:
+            streams = {stream for stream, _ in self._retries}
+        for stream in sorted(streams, key=str):
+            self.log(stream)
+
+
+RETRY_STATS = RetryStats()
+
+
+@contextlib.contextmanager
+def stream_context(stream):
+    """Requests made in the block, and by the threads it starts in its context, are for stream."""
+    token = CURRENT_STREAM.set(stream)
+    try:
+        yield
+    finally:
+        CURRENT_STREAM.reset(token)
+
+
+def submit_in_context(executor, fn, *args):
+    """Submits fn to executor, to run in a copy of the current context."""
+    return executor.submit(contextvars.copy_context().run, fn, *args)
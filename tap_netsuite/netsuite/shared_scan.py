@@ -0,0 +1,104 @@
+import contextvars
+import queue
+import threading
+
+import singer
+
+from tap_netsuite.netsuite.decoder import DecodedRecord
+from tap_netsuite.netsuite.exceptions import TapNetSuiteException
+
+LOGGER = singer.get_logger()
+
+# Pages routed to a stream that may wait for it before the scan blocks
+QUEUE_PAGES = 8
+
+_DONE = object()
+
+
+def record_type_name(rec):
+    """The name of the type of a record, e.g. SalesOrder for a zeep SalesOrder."""
+    if isinstance(rec, DecodedRecord):
+        return rec.type_name
+    xsd_type = getattr(rec, '_xsd_type', None)
+    if xsd_type is not None:
+        return xsd_type.name
+    return type(rec).__name__
+
+
+class SharedScan:
+    """Demultiplexes the pages of one search into the streams reading from it.
+
+    search() performs the search and returns its pages, route(rec) returns
+    the streams a record belongs to. Each stream gets only the records
+    modified on or after its own start date, so it keeps its own bookmark.
+    The search runs on its own thread once started: every page is split by
+    stream and each part is queued for its stream. The streams must be
+    consumed concurrently, a stream that stops consuming is dropped. Once
+    stopped, the search is abandoned and the streams still reading fail."""
+
+    def __init__(self, search, route, start_dates):
+        self.search = search
+        self.route = route
+        self.start_dates = start_dates
+        self.queues = {stream: queue.Queue(maxsize=QUEUE_PAGES) for stream in start_dates}
+        self.closed = set()
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def __contains__(self, stream):
+        return stream in self.queues
+
+    def start(self):
+        self.thread = threading.Thread(target=contextvars.copy_context().run, args=(self.run,), name='shared-scan',
+                                       daemon=True)
+        self.thread.start()
+
+    def run(self):
+        try:
+            for page in self.search():
+                if self.stopped.is_set():
+                    return
+                parts = {}
+                for rec in page:
+                    modified = rec['lastModifiedDate']
+                    for stream in self.route(rec):
+                        if stream in self.queues and (modified is None or modified >= self.start_dates[stream]):
+                            parts.setdefault(stream, []).append(rec)
+                for stream, part in parts.items():
+                    self.put(stream, part)
+        except Exception as e:  # pylint: disable=broad-except
+            LOGGER.error('Shared search failed: %s', e)
+            for stream in self.queues:
+                self.put(stream, e)
+            return
+        for stream in self.queues:
+            self.put(stream, _DONE)
+
+    def put(self, stream, item):
+        while stream not in self.closed and not self.stopped.is_set():
+            try:
+                self.queues[stream].put(item, timeout=1)
+                return
+            except queue.Full:
+                continue
+
+    def stream_pages(self, stream):
+        """Yields the pages of the records routed to stream."""
+        try:
+            while True:
+                try:
+                    item = self.queues[stream].get(timeout=1)
+                except queue.Empty:
+                    if self.stopped.is_set():
+                        raise TapNetSuiteException('The shared search was stopped')
+                    continue
+                if item is _DONE:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            self.closed.add(stream)
+
+    def stop(self):
+        self.stopped.set()
@@ -1,5 +1,13 @@
 # pylint: disable=protected-access
+import datetime
+
 import singer
+import singer.utils as singer_utils
+from singer import metadata
+
+from tap_netsuite.netsuite.backfill import BackfillWindows, plan_windows
+from tap_netsuite.netsuite.checkpoint import read_checkpoint
+
 LOGGER = singer.get_logger()
 
 
@@ -12,8 +20,72 @@ class Soap:
     def query(self, catalog_entry, state):
         start_date = self.ns.get_start_date(state, catalog_entry)
         stream = catalog_entry['stream']
+        for shared_scan in self.ns.shared_scans:
+            if stream in shared_scan:
+                return shared_scan.stream_pages(stream)
+        checkpoint = None
+        if start_date:
+            checkpoint = read_checkpoint(state, catalog_entry['tap_stream_id'],
+                                         singer_utils.strptime_with_tz(start_date))
+        replication_key = metadata.to_map(catalog_entry['metadata']).get((), {}).get('replication-key')
+        if not replication_key and self.ns.full_table_partitions > 1:
+            # Searched from the start date, as the FULL_TABLE streams that are not partitioned
+            return self.ns_client.query_partitioned(stream,
+                                                    self.ns.full_table_partitions,
+                                                    self.ns.full_table_workers,
+                                                    ordered=self.ns.full_table_ordered,
+                                                    header_only=stream in self.ns.header_only_streams,
+                                                    lastModifiedDate={'searchValue': start_date,
+                                                                      'type': 'dateTime',
+                                                                      'operator': 'onOrAfter'})
+        if checkpoint is not None and replication_key:
+            # The window of the checkpoint is searched again after its last internalId, resumed by
+            # sync_records, then the records modified since its end
+            LOGGER.info('%s: Resuming the search of %s - %s after internalId %s',
+                        stream, start_date, singer_utils.strftime(checkpoint.end), checkpoint.last_internal_id)
+            return self._query_windows(stream=stream, start_date_str=start_date, first_window_end=checkpoint.end)
+        if stream in self.ns.keyset_pagination_streams:
+            return self._query_keyset(stream=stream, start_date_str=start_date)
+        if self._should_backfill(stream, start_date):
+            return self._query_windows(stream=stream, start_date_str=start_date)
         return self._query_recur(stream=stream, start_date_str=start_date)
 
+    def _should_backfill(self, stream, start_date_str):
+        """Backfills run for lastModifiedDate searches that span more than one window."""
+        if not self.ns.backfill_window_days or not start_date_str:
+            return False
+        entity = self.ns_client.entities[stream]
+        if getattr(entity, 'require_lastModified_date', False) is not True:
+            return False
+        window_size = datetime.timedelta(days=self.ns.backfill_window_days)
+        return singer_utils.now() - singer_utils.strptime_with_tz(start_date_str) > window_size
+
+    def _query_windows(self, stream, start_date_str, first_window_end=None):
+        start = singer_utils.strptime_to_utc(start_date_str)
+        window_size = datetime.timedelta(days=self.ns.backfill_window_days) if self.ns.backfill_window_days \
+            else singer_utils.now() - start
+        if first_window_end is None:
+            windows = plan_windows(start, singer_utils.now(), window_size)
+        else:
+            windows = [(start, first_window_end)] + plan_windows(first_window_end, singer_utils.now(), window_size)
+        LOGGER.info('%s: Backfilling from %s in %s windows', stream, start_date_str, len(windows))
+
+        def query_window(start, end, after=None):
+            # Records after an internalId are searched by internalId
+            return self.ns_client.query_entity(stream,
+                                               {'searchValue': singer_utils.strftime(start),
+                                                'searchValue2': singer_utils.strftime(end),
+                                                'type': 'dateTime',
+                                                'operator': 'within'},
+                                               header_only=stream in self.ns.header_only_streams,
+                                               keyset=stream in self.ns.keyset_pagination_streams or after is not None,
+                                               after=after)
+
+        return BackfillWindows(query_window,
+                               windows,
+                               max_records=self.ns.backfill_max_window_records,
+                               max_workers=self.ns.backfill_workers)
+
     # pylint: disable=too-many-arguments
     def _query_recur(
             self,
@@ -22,4 +94,13 @@ class Soap:
         return self.ns_client.query_entity(stream,
                                            {'searchValue': start_date_str,
                                             'type': 'dateTime',
-                                            'operator': 'onOrAfter'})
+                                            'operator': 'onOrAfter'},
+                                           header_only=stream in self.ns.header_only_streams)
+
+    def _query_keyset(self, stream, start_date_str):
+        return self.ns_client.query_entity(stream,
+                                           {'searchValue': start_date_str,
+                                            'type': 'dateTime',
+                                            'operator': 'onOrAfter'},
+                                           header_only=stream in self.ns.header_only_streams,
+                                           keyset=True)
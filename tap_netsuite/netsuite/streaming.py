@@ -0,0 +1,152 @@
+"""Streaming parse of the SOAP responses of searches.
+
+zeep parses a response into a full lxml tree, then the whole page into zeep
+objects, before the first record can be written. With stream_search_results
+the search operations return the response's bytes instead, which are read
+twice with iterparse:
+
+- once while the request is made, checking for a SOAP fault and reading the
+  searchResult's status, totalRecords, pageSize, totalPages, pageIndex and
+  searchId, and counting the records;
+- once more each time the page is iterated, converting its records one at a
+  time with the schema, as zeep would, and freeing their elements.
+
+A page held before it is synced, e.g. one fetched ahead, is then its bytes
+only, and a page being synced one record more. With a RecordDecoder the
+records are decoded into plain values instead of zeep objects."""
+import io
+import types
+
+from lxml import etree
+from zeep.exceptions import Fault, TransportError
+from zeep.xsd.context import XmlParserContext
+
+SOAP_ENVELOPE_NS = 'http://schemas.xmlsoap.org/soap/envelope/'
+
+# Operations answering with a searchResult, as the SDK's search and searchMoreWithId expect it
+STREAMED_OPERATIONS = {'search', 'searchMoreWithId'}
+
+# The elements read while the request is made: the fields of a searchResult, its records, a fault
+RESPONSE_TAGS = ('status', 'totalRecords', 'pageSize', 'totalPages', 'pageIndex', 'searchId', 'recordList',
+                 'searchRowList', 'record', 'Fault')
+
+
+def _localname(element):
+    return etree.QName(element).localname
+
+
+def _is_record(element):
+    """Whether element is a record of the recordList of a searchResult."""
+    if not element.tag.endswith('}record'):
+        return False
+    record_list = element.getparent()
+    if record_list is None or not record_list.tag.endswith('}recordList'):
+        return False
+    search_result = record_list.getparent()
+    return search_result is not None and search_result.tag.endswith('}searchResult')
+
+
+def _free(element):
+    """Frees an element parsed by iterparse, and its siblings parsed before it."""
+    element.clear()
+    parent = element.getparent()
+    while element.getprevious() is not None:
+        del parent[0]
+
+
+def _iterparse(content, tags):
+    return etree.iterparse(io.BytesIO(content), events=('end',), tag=[f'{{*}}{tag}' for tag in tags],
+                           remove_comments=True, resolve_entities=False, huge_tree=True)
+
+
+def _fault(element):
+    def text(name):
+        child = element.find(name)
+        return child.text if child is not None else None
+
+    return Fault(message=text('faultstring'), code=text('faultcode'), actor=text('faultactor'),
+                 detail=element.find('detail'))
+
+
+class StreamedRecords:
+    """The records of a search page, converted from its response each time they are iterated.
+
+    last_internal_id is the internalId of the page's last record."""
+
+    def __init__(self, content, count, record_element, schema, decoder=None, last_internal_id=None):
+        self.content = content
+        self.count = count
+        self.last_internal_id = last_internal_id
+        self.record_element = record_element
+        self.schema = schema
+        self.decoder = decoder
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        context = XmlParserContext()
+        for _, element in _iterparse(self.content, ['record']):
+            if _is_record(element):
+                if self.decoder is not None:
+                    record = self.decoder.decode(element, self.record_element)
+                else:
+                    record = self.record_element.parse(element, self.schema, context=context)
+                _free(element)
+                yield record
+
+    def internal_ids(self):
+        """The internalId of each record, read without converting the records."""
+        internal_ids = []
+        for _, element in _iterparse(self.content, ['record']):
+            if _is_record(element):
+                internal_ids.append(element.get('internalId'))
+                _free(element)
+        return internal_ids
+
+
+def parse_search_response(response, schema, decoder=None):
+    """Reads the searchResult of the raw response to a search operation.
+
+    Returns the response as the SDK expects it, response.body.searchResult,
+    with StreamedRecords as its recordList.record, decoded with decoder if
+    given. A SOAP fault is raised as
+    a zeep Fault, an HTTP error as a TransportError, as zeep does."""
+    values = {}
+    result_element = None
+    record_list_element = None
+    count = 0
+    last_internal_id = None
+    try:
+        for _, element in _iterparse(response.content, RESPONSE_TAGS):
+            parent = element.getparent()
+            if _is_record(element):
+                count += 1
+                last_internal_id = element.get('internalId')
+                _free(element)
+            elif element.tag == f'{{{SOAP_ENVELOPE_NS}}}Fault':
+                raise _fault(element)
+            elif parent is not None and parent.tag.endswith('}searchResult'):
+                if result_element is None:
+                    result_element = schema.get_element(parent.tag)
+                field = dict(result_element.type.elements)[_localname(element)]
+                if _localname(element) == 'recordList':
+                    record_list_element = field
+                else:
+                    values[_localname(element)] = field.parse(element, schema)
+    except etree.XMLSyntaxError as e:
+        raise TransportError(f'Server returned response ({response.status_code}) with invalid XML: {e}',
+                             status_code=response.status_code,
+                             content=response.content) from e
+    if response.status_code != 200 or result_element is None:
+        raise TransportError(f'Server returned HTTP status {response.status_code} without a searchResult',
+                             status_code=response.status_code,
+                             content=response.content)
+
+    result = types.SimpleNamespace(**{name: values.get(name) for name, _ in result_element.type.elements})
+    result.recordList = types.SimpleNamespace()
+    if count:
+        record_element = dict(record_list_element.type.elements)['record']
+        result.recordList.record = StreamedRecords(response.content, count, record_element, schema, decoder,
+                                                   last_internal_id)
+    return types.SimpleNamespace(body=types.SimpleNamespace(searchResult=result))
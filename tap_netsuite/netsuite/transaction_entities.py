@@ -1,10 +1,14 @@
-from collections import OrderedDict
+import contextlib
+import functools
+from collections import OrderedDict, namedtuple
 from netsuitesdk.internal.utils import PaginatedSearch
 
 from netsuitesdk.api.base import ApiBase
 
 import singer
 
+from .pagination import KeysetPages, PartitionedPages, SearchLines, SearchPages
+
 logger = singer.get_logger()
 
 
@@ -35,56 +39,168 @@ def prepare_custom_fields(that, eod):
     return None
 
 
-class Customers(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='customer')
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        search_record = self.ns_client.basic_search_factory(type_name="Customer",
-                                                            lastModifiedDate=last_modified_date)
-        ps = PaginatedSearch(client=self.ns_client, type_name='Customer', pageSize=page_size,
-                             search_record=search_record)
-        return self._paginated_search_to_generator(ps)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-class InventoryItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='InventoryItem')
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='InventoryItem', operator='contains')
-        search_record = self.ns_client.basic_search_factory(type_name="Item",
-                                                            recordType=record_type_search_field,
-                                                            lastModifiedDate=last_modified_date)
-        ps = PaginatedSearch(client=self.ns_client, type_name='InventoryItem', pageSize=page_size,
-                             search_record=search_record)
-        return self._paginated_search_to_generator(ps)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class Opportunity(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='opportunity')
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Opportunity', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction', recordType=record_type_search_field,
+class SearchEntity(ApiBase):
+    """An entity synced through a PaginatedSearch, as its EntityDefinition describes.
+
+    search_type_name is the record searched and record_type the value its
+    recordType must contain, if the search is filtered by record type."""
+
+    search_type_name = None
+    record_type = None
+
+    def __init__(self, ns_client, definition):
+        ApiBase.__init__(self, ns_client=ns_client, type_name=definition.type_name)
+        self.definition = definition
+        self.search_type_name = definition.search_type_name
+        self.record_type = definition.record_type
+        self.require_paging = definition.require_paging
+        self.require_lastModified_date = definition.require_lastModified_date
+
+    def get_all(self, last_modified_date=None):
+        return self.get_all_generator(last_modified_date=last_modified_date)
+
+    def get_all_generator(self, page_size=None, last_modified_date=None):
+        paginated_search = self._search(self._filters(last_modified_date), page_size)
+        return self._paginated_search_to_generator(paginated_search=paginated_search)
+
+    def get_all_keyset(self, page_size=None, last_modified_date=None, after=None, before=None, header_only=False):
+        """The pages of the records in internalId order, each searched on its own.
+
+        With header_only every page is searched as in header_only_searches,
+        from whichever thread iterates over the pages."""
+        def search_range(after, before):
+            filters = self._filters(last_modified_date)
+            internal_id_filter = self._internal_id_filter(after, before)
+            if internal_id_filter is not None:
+                filters['internalIdNumber'] = internal_id_filter
+            with self.ns_client.header_only_searches() if header_only else contextlib.nullcontext():
+                return self._search(filters, page_size)
+
+        return KeysetPages(search_range, after=after, before=before)
+
+    def get_all_partitioned(self, partitions, max_workers, ordered=True, page_size=None, last_modified_date=None,
+                            header_only=False):
+        """The pages of the records, from up to partitions internalId ranges fetched concurrently.
+
+        The ranges start at the first record of evenly spaced pages of one
+        search, so that they hold about as many records. A search of a
+        single page is returned as is. With header_only every search is
+        header only, those of the ranges too."""
+        with self.ns_client.header_only_searches() if header_only else contextlib.nullcontext():
+            pages = self.get_all_generator(page_size, last_modified_date)
+        if pages.total_pages <= 1 or partitions <= 1:
+            return pages
+        page_indexes = sorted({pages.total_pages * k // partitions + 1 for k in range(1, partitions)} - {1})
+        boundaries = []
+        for page_index in page_indexes:
+            first = next(iter(pages.fetch_page(page_index)), None)
+            if first is not None:
+                boundaries.append(int(first['internalId']))
+        boundaries = sorted(set(boundaries))
+        logger.info('Searching %s records in %s internalId ranges starting at %s',
+                    pages.total_records, len(boundaries) + 1, ', '.join(map(str, boundaries)))
+        ranges = zip([None] + [boundary - 1 for boundary in boundaries], boundaries + [None])
+        return PartitionedPages([self.get_all_keyset(page_size, last_modified_date, after, before, header_only)
+                                 for after, before in ranges],
+                                max_workers=max_workers,
+                                ordered=ordered,
+                                total_records=pages.total_records)
+
+    def _internal_id_filter(self, after, before):
+        if after is None and before is None:
+            return None
+        if before is None:
+            return self.ns_client.SearchLongField(searchValue=after, operator='greaterThan')
+        if after is None:
+            return self.ns_client.SearchLongField(searchValue=before, operator='lessThan')
+        return self.ns_client.SearchLongField(searchValue=after + 1, searchValue2=before - 1, operator='between')
+
+    def _filters(self, last_modified_date):
+        filters = {'lastModifiedDate': last_modified_date}
+        if self.record_type is not None:
+            filters['recordType'] = self.ns_client.SearchStringField(searchValue=self.record_type, operator='contains')
+        return filters
+
+    def _search(self, filters, page_size):
+        search = self.ns_client.basic_search_factory(self.search_type_name, **filters)
+        if self.definition.search_record:
+            return PaginatedSearch(client=self.ns_client,
+                                   search_record=search,
+                                   type_name=self.search_type_name,
+                                   pageSize=page_size or self.definition.page_size)
+        return PaginatedSearch(client=self.ns_client,
+                               basic_search=search,
+                               type_name=self.search_type_name,
+                               pageSize=page_size or self.definition.page_size)
+
+    def _paginated_search_to_generator(self, paginated_search):
+        return SearchPages(paginated_search, max_workers=self.ns_client.page_fetch_workers)
+
+    def post(self, data) -> OrderedDict:
+        return None
+
+
+# TransactionType values of the record types a shared Transaction scan can route
+TRANSACTION_TYPES = {
+    'AssemblyBuild': '_assemblyBuild',
+    'AssemblyUnbuild': '_assemblyUnbuild',
+    'BinTransfer': '_binTransfer',
+    'BinWorksheet': '_binWorksheet',
+    'CashRefund': '_cashRefund',
+    'CashSale': '_cashSale',
+    'Check': '_check',
+    'CreditMemo': '_creditMemo',
+    'CustomerDeposit': '_customerDeposit',
+    'CustomerPayment': '_customerPayment',
+    'CustomerRefund': '_customerRefund',
+    'Deposit': '_deposit',
+    'DepositApplication': '_depositApplication',
+    'Estimate': '_estimate',
+    'InterCompanyJournalEntry': '_interCompanyJournal',
+    'InterCompanyTransferOrder': '_interCompanyTransferOrder',
+    'InventoryAdjustment': '_inventoryAdjustment',
+    'InventoryCostRevaluation': '_inventoryCostRevaluation',
+    'InventoryTransfer': '_inventoryTransfer',
+    'Invoice': '_invoice',
+    'ItemFulfillment': '_itemFulfillment',
+    'ItemReceipt': '_itemReceipt',
+    'JournalEntry': '_journal',
+    'Opportunity': '_opportunity',
+    'PaycheckJournal': '_paycheckJournal',
+    'PurchaseOrder': '_purchaseOrder',
+    'PurchaseRequisition': '_purchaseRequisition',
+    'ReturnAuthorization': '_returnAuthorization',
+    'SalesOrder': '_salesOrder',
+    'StatisticalJournalEntry': '_statisticalJournal',
+    'TransferOrder': '_transferOrder',
+    'VendorBill': '_vendorBill',
+    'VendorCredit': '_vendorCredit',
+    'VendorPayment': '_vendorPayment',
+    'VendorReturnAuthorization': '_vendorReturnAuthorization',
+    'WorkOrder': '_workOrder',
+    'WorkOrderClose': '_workOrderClose',
+    'WorkOrderCompletion': '_workOrderCompletion',
+    'WorkOrderIssue': '_workOrderIssue',
+}
+
+
+class TransactionScan(SearchEntity):
+    """One Transaction search over several record types."""
+
+    search_type_name = 'Transaction'
+
+    def __init__(self, ns_client):
+        ApiBase.__init__(self, ns_client=ns_client, type_name='Transaction')
+
+    def get_all(self, record_types, last_modified_date=None):
+        return self.get_all_generator(record_types, last_modified_date=last_modified_date)
+
+    def get_all_generator(self, record_types, page_size=200, last_modified_date=None):
+        type_search_field = self.ns_client.SearchEnumMultiSelectField(
+            searchValue=[TRANSACTION_TYPES[record_type] for record_type in record_types],
+            operator='anyOf')
+        basic_search = self.ns_client.basic_search_factory(self.search_type_name,
+                                                           type=type_search_field,
                                                            lastModifiedDate=last_modified_date)
         paginated_search = PaginatedSearch(client=self.ns_client,
                                            basic_search=basic_search,
@@ -92,160 +208,90 @@ class Opportunity(ApiBase):
                                            pageSize=page_size)
         return self._paginated_search_to_generator(paginated_search=paginated_search)
 
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class SalesOrders(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='salesOrder')
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='SalesOrder', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-        
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
 
+# ItemType values of the record types a shared Item scan can route, several
+# record types share one ItemType (e.g. lot numbered and serialized items).
+ITEM_TYPES = {
+    'AssemblyItem': '_assembly',
+    'DescriptionItem': '_description',
+    'DiscountItem': '_discount',
+    'DownloadItem': '_downloadItem',
+    'GiftCertificateItem': '_giftCertificateItem',
+    'InventoryItem': '_inventoryItem',
+    'ItemGroup': '_itemGroup',
+    'KitItem': '_kit',
+    'LotNumberedAssemblyItem': '_assembly',
+    'LotNumberedInventoryItem': '_inventoryItem',
+    'MarkupItem': '_markup',
+    'NonInventoryPurchaseItem': '_nonInventoryItem',
+    'NonInventoryResaleItem': '_nonInventoryItem',
+    'NonInventorySaleItem': '_nonInventoryItem',
+    'OtherChargePurchaseItem': '_otherCharge',
+    'OtherChargeResaleItem': '_otherCharge',
+    'OtherChargeSaleItem': '_otherCharge',
+    'PaymentItem': '_payment',
+    'SerializedAssemblyItem': '_assembly',
+    'SerializedInventoryItem': '_inventoryItem',
+    'ServicePurchaseItem': '_service',
+    'ServiceResaleItem': '_service',
+    'ServiceSaleItem': '_service',
+    'SubtotalItem': '_subtotal',
+}
 
-class InventoryTransfer(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='InventoryTransfer')
-    
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='InventoryTransfer', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           recordType=record_type_search_field,
-                                                           lastModifiedDate=last_modified_date)
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           type_name='Transaction',
-                                           basic_search=basic_search,
-                                           pageSize=page_size)
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
 
-    def post(self, data) -> OrderedDict:
-        return None
+class ItemScan(SearchEntity):
+    """One Item search over several item record types, or all of them."""
 
+    search_type_name = 'Item'
 
-class Items(ApiBase):
     def __init__(self, ns_client):
         ApiBase.__init__(self, ns_client=ns_client, type_name='Item')
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        search_record = self.ns_client.basic_search_factory(type_name="Item",
-                                                            lastModifiedDate=last_modified_date)
-        ps = PaginatedSearch(client=self.ns_client, type_name='Item', pageSize=page_size,
-                             search_record=search_record)
-        return self._paginated_search_to_generator(ps)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
 
-class InventoryAdjustment(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='InventoryAdjustment')
-    
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
+    def get_all(self, record_types=None, last_modified_date=None):
+        return self.get_all_generator(record_types, last_modified_date=last_modified_date)
 
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='InventoryAdjustment', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           recordType=record_type_search_field,
-                                                           lastModifiedDate=last_modified_date)
+    def get_all_generator(self, record_types=None, page_size=200, last_modified_date=None):
+        filters = {'lastModifiedDate': last_modified_date}
+        if record_types is not None:
+            filters['type'] = self.ns_client.SearchEnumMultiSelectField(
+                searchValue=sorted({ITEM_TYPES[record_type] for record_type in record_types}),
+                operator='anyOf')
+        basic_search = self.ns_client.basic_search_factory(self.search_type_name, **filters)
         paginated_search = PaginatedSearch(client=self.ns_client,
-                                           type_name='Transaction',
                                            basic_search=basic_search,
+                                           type_name='Item',
                                            pageSize=page_size)
         return self._paginated_search_to_generator(paginated_search=paginated_search)
 
-    def post(self, data) -> OrderedDict:
-        return None
-    
 
-class VendorBills(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='VendorBills')
-    
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
+class TransactionLines(SearchEntity):
+    """The item lines of the records of a transaction entity class, one record per line."""
 
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='VendorBill', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           recordType=record_type_search_field,
-                                                           lastModifiedDate=last_modified_date)
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           type_name='Transaction',
-                                           basic_search=basic_search,
-                                           pageSize=page_size)
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
+    def __init__(self, ns_client, transaction):
+        self.transaction = transaction(ns_client)
+        ApiBase.__init__(self, ns_client=ns_client, type_name=self.transaction.type_name)
+        self.require_lastModified_date = getattr(self.transaction, 'require_lastModified_date', False)
 
-    def post(self, data) -> OrderedDict:
-        return None
-    
-class VendorPayments(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='VendorPayment')
-    
     def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='VendorPayment', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           recordType=record_type_search_field,
-                                                           lastModifiedDate=last_modified_date)
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           type_name='Transaction',
-                                           basic_search=basic_search,
-                                           pageSize=page_size)
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
+        if self.require_lastModified_date is True:
+            return SearchLines(self.transaction.get_all(last_modified_date))
+        return SearchLines(self.transaction.get_all())
 
+    def get_all_keyset(self, page_size=None, last_modified_date=None, after=None, before=None, header_only=False):
+        if self.require_lastModified_date is not True:
+            last_modified_date = None
+        return SearchLines(self.transaction.get_all_keyset(page_size, last_modified_date, after, before, header_only))
 
-class JournalEntries(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='journalEntry')
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='JournalEntry', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
+    def get_all_partitioned(self, partitions, max_workers, ordered=True, page_size=None, last_modified_date=None,
+                            header_only=False):
+        if self.require_lastModified_date is not True:
+            last_modified_date = None
+        return SearchLines(self.transaction.get_all_partitioned(partitions, max_workers, ordered, page_size,
+                                                                last_modified_date, header_only))
 
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
 
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
+class JournalEntries(SearchEntity):
+    """Journal entries, which can also be posted."""
 
     def post(self, data) -> OrderedDict:
         assert data['externalId'], 'missing external id'
@@ -286,4145 +332,198 @@ class JournalEntries(ApiBase):
         return self._serialize(res)
 
 
-class Invoice(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='invoice')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Invoice', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CreditMemos(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='creditmemo')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CreditMemo', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-class PurchaseOrder(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='PurchaseOrder')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='PurchaseOrder', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-class Address(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Address')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Address', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CustomFieldType(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CustomFieldType')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CustomFieldType', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class SubtotalItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='SubtotalItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='SubtotalItem', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class Topic(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Topic')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Topic', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CostCategory(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CostCategory')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CostCategory', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ItemDemandPlan(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ItemDemandPlan')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ItemDemandPlan', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-#1
-class LotNumberedInventoryItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='LotNumberedInventoryItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='LotNumberedInventoryItem',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CampaignChannel(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CampaignChannel')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CampaignChannel', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class State(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='State')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='State', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class TaxAcct(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='TaxAcct')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='TaxAcct', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CouponCode(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CouponCode')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CouponCode', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class VendorCategory(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='VendorCategory')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='VendorCategory', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class TaxType(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='TaxType')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='TaxType', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class NonInventorySaleItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='NonInventorySaleItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='NonInventorySaleItem',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class SupportCaseStatus(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='SupportCaseStatus')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='SupportCaseStatus',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class LeadSource(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='LeadSource')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='LeadSource', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CurrencyRate(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CurrencyRate')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CurrencyRate', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class WinLossReason(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='WinLossReason')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='WinLossReason', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class SupportCaseOrigin(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='SupportCaseOrigin')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='SupportCaseOrigin',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-
-class Deposit(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Deposit')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Deposit', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class TaxGroup(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='TaxGroup')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='TaxGroup', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class TransactionColumnCustomField(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='TransactionColumnCustomField')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='TransactionColumnCustomField',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ItemNumberCustomField(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ItemNumberCustomField')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ItemNumberCustomField',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class StatisticalJournalEntry(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='StatisticalJournalEntry')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='StatisticalJournalEntry',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class InventoryDetail(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='InventoryDetail')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='InventoryDetail', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CampaignSearchEngine(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CampaignSearchEngine')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CampaignSearchEngine',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class GlobalAccountMapping(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='GlobalAccountMapping')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='GlobalAccountMapping',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class FairValuePrice(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='FairValuePrice')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='FairValuePrice', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class SupportCaseType(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='SupportCaseType')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='SupportCaseType', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class Solution(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Solution')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Solution', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class RevRecTemplate(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='RevRecTemplate')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='RevRecTemplate', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class TimeBill(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='TimeBill')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='TimeBill', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class Charge(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Charge')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Charge', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-
-class InterCompanyTransferOrder(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='InterCompanyTransferOrder')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='InterCompanyTransferOrder',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ItemRevision(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ItemRevision')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ItemRevision', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class Contact(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Contact')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Contact', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CampaignResponse(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CampaignResponse')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CampaignResponse', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class PromotionCode(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='PromotionCode')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='PromotionCode', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class WorkOrderClose(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='WorkOrderClose')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='WorkOrderClose', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class Classification(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Classification')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Classification', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class PurchaseRequisition(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='PurchaseRequisition')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='PurchaseRequisition',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class JobType(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='JobType')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='JobType', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class Term(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Term')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Term', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-
-class Issue(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Issue')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Issue', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ManufacturingRouting(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ManufacturingRouting')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ManufacturingRouting',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ServiceSaleItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ServiceSaleItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ServiceSaleItem', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class InventoryCostRevaluation(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='InventoryCostRevaluation')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='InventoryCostRevaluation',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class UnitsType(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='UnitsType')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='UnitsType', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class EntityGroup(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='EntityGroup')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='EntityGroup', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class DepositApplication(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='DepositApplication')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='DepositApplication',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class SalesTaxItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='SalesTaxItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='SalesTaxItem', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CustomTransaction(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CustomTransaction')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CustomTransaction',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class LandedCost(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='LandedCost')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='LandedCost', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class Task(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Task')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Task', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class TimeSheet(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='TimeSheet')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='TimeSheet', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class GiftCertificate(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='GiftCertificate')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='GiftCertificate', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class KitItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='KitItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='KitItem', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class DescriptionItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='DescriptionItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='DescriptionItem', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ItemFulfillment(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ItemFulfillment')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ItemFulfillment', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ContactCategory(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ContactCategory')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ContactCategory', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CustomerMessage(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CustomerMessage')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CustomerMessage', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class OtherChargeResaleItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='OtherChargeResaleItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='OtherChargeResaleItem',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class NoteType(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='NoteType')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='NoteType', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class VendorReturnAuthorization(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='VendorReturnAuthorization')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='VendorReturnAuthorization',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-
-class Job(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Job')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Job', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-class CampaignSubscription(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CampaignSubscription')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CampaignSubscription',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CampaignFamily(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CampaignFamily')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CampaignFamily', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CrmCustomField(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CrmCustomField')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CrmCustomField', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class BinWorksheet(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='BinWorksheet')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='BinWorksheet', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class SerializedInventoryItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='SerializedInventoryItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='SerializedInventoryItem',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class DiscountItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='DiscountItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='DiscountItem', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CustomerRefund(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CustomerRefund')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CustomerRefund', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class TransferOrder(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='TransferOrder')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='TransferOrder', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class PartnerCategory(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='PartnerCategory')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='PartnerCategory', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class OtherChargePurchaseItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='OtherChargePurchaseItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='OtherChargePurchaseItem',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class BinTransfer(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='BinTransfer')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='BinTransfer', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class PaymentMethod(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='PaymentMethod')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='PaymentMethod', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ItemAccountMapping(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ItemAccountMapping')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ItemAccountMapping',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CustomerStatus(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CustomerStatus')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CustomerStatus', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-
-class Estimate(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Estimate')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Estimate', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class SalesRole(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='SalesRole')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='SalesRole', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ManufacturingCostTemplate(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ManufacturingCostTemplate')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ManufacturingCostTemplate',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class AssemblyUnbuild(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='AssemblyUnbuild')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='AssemblyUnbuild', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ItemSupplyPlan(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ItemSupplyPlan')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ItemSupplyPlan', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class NonInventoryResaleItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='NonInventoryResaleItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='NonInventoryResaleItem',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class BillingSchedule(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='BillingSchedule')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='BillingSchedule', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class PaymentItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='PaymentItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='PaymentItem', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ItemGroup(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ItemGroup')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ItemGroup', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class WorkOrder(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='WorkOrder')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='WorkOrder', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class WorkOrderIssue(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='WorkOrderIssue')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='WorkOrderIssue', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class SupportCaseIssue(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='SupportCaseIssue')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='SupportCaseIssue', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ContactRole(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ContactRole')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ContactRole', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CustomerPayment(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CustomerPayment')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CustomerPayment', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class PricingGroup(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='PricingGroup')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='PricingGroup', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class Vendor(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Vendor')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Vendor', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class SupportCasePriority(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='SupportCasePriority')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='SupportCasePriority',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class Campaign(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='campaign')
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=100, last_modified_date=None):
-        search_record = self.ns_client.basic_search_factory(type_name="Campaign",
-                                                            lastModifiedDate=last_modified_date)
-        ps = PaginatedSearch(client=self.ns_client, type_name='Campaign', pageSize=page_size,
-                             search_record=search_record)
-        return self._paginated_search_to_generator(ps)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class LotNumberedAssemblyItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='LotNumberedAssemblyItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='LotNumberedAssemblyItem',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class InventoryNumber(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='InventoryNumber')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='InventoryNumber', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class VendorCredit(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='VendorCredit')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='VendorCredit', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CustomRecordCustomField(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CustomRecordCustomField')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CustomRecordCustomField',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CustomerDeposit(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CustomerDeposit')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CustomerDeposit', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class SupportCase(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='SupportCase')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='SupportCase', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ServicePurchaseItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ServicePurchaseItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ServicePurchaseItem',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CampaignOffer(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CampaignOffer')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CampaignOffer', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-
-class CampaignAudience(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CampaignAudience')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CampaignAudience', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class AccountingPeriod(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='AccountingPeriod')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='AccountingPeriod', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ServiceResaleItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ServiceResaleItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ServiceResaleItem',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CustomerCategory(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CustomerCategory')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CustomerCategory', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class RevRecSchedule(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='RevRecSchedule')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='RevRecSchedule', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CashSale(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CashSale')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CashSale', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CalendarEvent(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CalendarEvent')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CalendarEvent', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CampaignVertical(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CampaignVertical')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CampaignVertical', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class OtherCustomField(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='OtherCustomField')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='OtherCustomField', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class Account(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Account')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Account', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class EntityCustomField(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='EntityCustomField')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='EntityCustomField',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class PayrollItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='PayrollItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='PayrollItem', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class SerializedAssemblyItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='SerializedAssemblyItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='SerializedAssemblyItem',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class OtherNameCategory(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='OtherNameCategory')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='OtherNameCategory',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ReturnAuthorization(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ReturnAuthorization')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ReturnAuthorization',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class Nexus(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Nexus')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Nexus', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class TransactionBodyCustomField(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='TransactionBodyCustomField')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='TransactionBodyCustomField',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class WorkOrderCompletion(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='WorkOrderCompletion')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='WorkOrderCompletion',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class BudgetCategory(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='BudgetCategory')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='BudgetCategory', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class SiteCategory(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='SiteCategory')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='SiteCategory', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class DownloadItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='DownloadItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='DownloadItem', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CustomRecordType(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CustomRecordType')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CustomRecordType', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ItemOptionCustomField(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ItemOptionCustomField')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ItemOptionCustomField',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CashRefund(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CashRefund')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CashRefund', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ResourceAllocation(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ResourceAllocation')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ResourceAllocation',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ItemReceipt(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ItemReceipt')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ItemReceipt', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ManufacturingOperationTask(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ManufacturingOperationTask')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ManufacturingOperationTask',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class PhoneCall(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='PhoneCall')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='PhoneCall', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class BillingAccount(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='BillingAccount')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='BillingAccount', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class NonInventoryPurchaseItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='NonInventoryPurchaseItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='NonInventoryPurchaseItem',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class MarkupItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='MarkupItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='MarkupItem', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ProjectTask(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ProjectTask')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ProjectTask', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class PaycheckJournal(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='PaycheckJournal')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='PaycheckJournal', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class Partner(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Partner')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Partner', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class AssemblyItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='AssemblyItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='AssemblyItem', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class GiftCertificateItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='GiftCertificateItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='GiftCertificateItem',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class PriceLevel(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='PriceLevel')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='PriceLevel', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class JobStatus(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='JobStatus')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='JobStatus', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class InterCompanyJournalEntry(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='InterCompanyJournalEntry')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='InterCompanyJournalEntry',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class Budget(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Budget')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Budget', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class OtherChargeSaleItem(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='OtherChargeSaleItem')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='OtherChargeSaleItem',
-                                                                    operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class Note(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Note')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Note', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class AssemblyBuild(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='AssemblyBuild')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='AssemblyBuild', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-
-class Bin(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Bin')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Bin', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class CampaignCategory(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='CampaignCategory')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='CampaignCategory', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class TimeEntry(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='TimeEntry')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='TimeEntry', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class Check(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Check')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Check', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class ItemCustomField(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='ItemCustomField')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='ItemCustomField', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
-
-
-class Message(ApiBase):
-    def __init__(self, ns_client):
-        ApiBase.__init__(self, ns_client=ns_client, type_name='Message')
-        self.require_paging = True
-        self.require_lastModified_date = True
-
-    def get_all(self, last_modified_date=None):
-        return self.get_all_generator(last_modified_date=last_modified_date)
-
-    def get_all_generator(self, page_size=200, last_modified_date=None):
-        record_type_search_field = self.ns_client.SearchStringField(searchValue='Message', operator='contains')
-        basic_search = self.ns_client.basic_search_factory('Transaction',
-                                                           lastModifiedDate=last_modified_date,
-                                                           recordType=record_type_search_field)
-
-        paginated_search = PaginatedSearch(client=self.ns_client,
-                                           basic_search=basic_search,
-                                           type_name='Transaction',
-                                           pageSize=page_size)
-
-        return self._paginated_search_to_generator(paginated_search=paginated_search)
-
-    def post(self, data) -> OrderedDict:
-        return None
+# How an entity is searched: type_name of the entity, search_type_name of the
+# record searched and record_type the value its recordType must contain, if
+# any. Entities requiring a lastModified date are searched for the records
+# modified since, the others for all records. search_record searches pass the
+# basic search as the search record, page_size is the records per page and
+# entity_class the SearchEntity subclass of the entity.
+EntityDefinition = namedtuple('EntityDefinition',
+                              ['type_name', 'search_type_name', 'record_type', 'require_paging',
+                               'require_lastModified_date', 'search_record', 'page_size', 'entity_class'],
+                              defaults=[None, True, True, False, 200, SearchEntity])
+
+# Stream names and the definitions of their entities
+ENTITY_DEFINITIONS = {
+    'Customer': EntityDefinition('customer', 'Customer', require_paging=False, search_record=True),
+    'Invoice': EntityDefinition('invoice', 'Transaction', 'Invoice'),
+    'JournalEntry': EntityDefinition('journalEntry', 'Transaction', 'JournalEntry', require_paging=False,
+                                     entity_class=JournalEntries),
+    'Commission': EntityDefinition('journalEntry', 'Transaction', 'JournalEntry', require_paging=False,
+                                   entity_class=JournalEntries),
+    'VendorBills': EntityDefinition('VendorBills', 'Transaction', 'VendorBill', require_paging=False,
+                                    require_lastModified_date=False),
+    'VendorPayment': EntityDefinition('VendorPayment', 'Transaction', 'VendorPayment', require_paging=False,
+                                      require_lastModified_date=False),
+    'InventoryAdjustment': EntityDefinition('InventoryAdjustment', 'Transaction', 'InventoryAdjustment',
+                                            require_paging=False, require_lastModified_date=False),
+    'InventoryTransfer': EntityDefinition('InventoryTransfer', 'Transaction', 'InventoryTransfer', require_paging=False,
+                                          require_lastModified_date=False),
+    'InventoryItem': EntityDefinition('InventoryItem', 'Item', 'InventoryItem', require_paging=False,
+                                      search_record=True),
+    'SalesOrders': EntityDefinition('salesOrder', 'Transaction', 'SalesOrder', require_paging=False),
+    'CreditMemos': EntityDefinition('creditmemo', 'Transaction', 'CreditMemo'),
+    'Items': EntityDefinition('Item', 'Item', require_paging=False, search_record=True),
+    'PurchaseOrder': EntityDefinition('PurchaseOrder', 'Transaction', 'PurchaseOrder'),
+    'Address': EntityDefinition('Address', 'Transaction', 'Address'),
+    'CustomFieldType': EntityDefinition('CustomFieldType', 'Transaction', 'CustomFieldType'),
+    'SubtotalItem': EntityDefinition('SubtotalItem', 'Transaction', 'SubtotalItem'),
+    'Topic': EntityDefinition('Topic', 'Transaction', 'Topic'),
+    'CostCategory': EntityDefinition('CostCategory', 'Transaction', 'CostCategory'),
+    'ItemDemandPlan': EntityDefinition('ItemDemandPlan', 'Transaction', 'ItemDemandPlan'),
+    'LotNumberedInventoryItem': EntityDefinition('LotNumberedInventoryItem', 'Transaction', 'LotNumberedInventoryItem'),
+    'CampaignChannel': EntityDefinition('CampaignChannel', 'Transaction', 'CampaignChannel'),
+    'State': EntityDefinition('State', 'Transaction', 'State'),
+    'TaxAcct': EntityDefinition('TaxAcct', 'Transaction', 'TaxAcct'),
+    'CouponCode': EntityDefinition('CouponCode', 'Transaction', 'CouponCode'),
+    'VendorCategory': EntityDefinition('VendorCategory', 'Transaction', 'VendorCategory'),
+    'TaxType': EntityDefinition('TaxType', 'Transaction', 'TaxType'),
+    'NonInventorySaleItem': EntityDefinition('NonInventorySaleItem', 'Transaction', 'NonInventorySaleItem'),
+    'SupportCaseStatus': EntityDefinition('SupportCaseStatus', 'Transaction', 'SupportCaseStatus'),
+    'LeadSource': EntityDefinition('LeadSource', 'Transaction', 'LeadSource'),
+    'CurrencyRate': EntityDefinition('CurrencyRate', 'Transaction', 'CurrencyRate'),
+    'WinLossReason': EntityDefinition('WinLossReason', 'Transaction', 'WinLossReason'),
+    'SupportCaseOrigin': EntityDefinition('SupportCaseOrigin', 'Transaction', 'SupportCaseOrigin'),
+    'Deposit': EntityDefinition('Deposit', 'Transaction', 'Deposit'),
+    'TaxGroup': EntityDefinition('TaxGroup', 'Transaction', 'TaxGroup'),
+    'TransactionColumnCustomField': EntityDefinition('TransactionColumnCustomField', 'Transaction',
+                                                     'TransactionColumnCustomField'),
+    'Opportunity': EntityDefinition('opportunity', 'Transaction', 'Opportunity', require_paging=False),
+    'ItemNumberCustomField': EntityDefinition('ItemNumberCustomField', 'Transaction', 'ItemNumberCustomField'),
+    'StatisticalJournalEntry': EntityDefinition('StatisticalJournalEntry', 'Transaction', 'StatisticalJournalEntry'),
+    'InventoryDetail': EntityDefinition('InventoryDetail', 'Transaction', 'InventoryDetail'),
+    'CampaignSearchEngine': EntityDefinition('CampaignSearchEngine', 'Transaction', 'CampaignSearchEngine'),
+    'GlobalAccountMapping': EntityDefinition('GlobalAccountMapping', 'Transaction', 'GlobalAccountMapping'),
+    'FairValuePrice': EntityDefinition('FairValuePrice', 'Transaction', 'FairValuePrice'),
+    'SupportCaseType': EntityDefinition('SupportCaseType', 'Transaction', 'SupportCaseType'),
+    'Solution': EntityDefinition('Solution', 'Transaction', 'Solution'),
+    'RevRecTemplate': EntityDefinition('RevRecTemplate', 'Transaction', 'RevRecTemplate'),
+    'TimeBill': EntityDefinition('TimeBill', 'Transaction', 'TimeBill'),
+    'Charge': EntityDefinition('Charge', 'Transaction', 'Charge'),
+    'InterCompanyTransferOrder': EntityDefinition('InterCompanyTransferOrder', 'Transaction',
+                                                  'InterCompanyTransferOrder'),
+    'ItemRevision': EntityDefinition('ItemRevision', 'Transaction', 'ItemRevision'),
+    'Contact': EntityDefinition('Contact', 'Transaction', 'Contact'),
+    'CampaignResponse': EntityDefinition('CampaignResponse', 'Transaction', 'CampaignResponse'),
+    'PromotionCode': EntityDefinition('PromotionCode', 'Transaction', 'PromotionCode'),
+    'WorkOrderClose': EntityDefinition('WorkOrderClose', 'Transaction', 'WorkOrderClose'),
+    'PurchaseRequisition': EntityDefinition('PurchaseRequisition', 'Transaction', 'PurchaseRequisition'),
+    'JobType': EntityDefinition('JobType', 'Transaction', 'JobType'),
+    'Term': EntityDefinition('Term', 'Transaction', 'Term'),
+    'Issue': EntityDefinition('Issue', 'Transaction', 'Issue'),
+    'ManufacturingRouting': EntityDefinition('ManufacturingRouting', 'Transaction', 'ManufacturingRouting'),
+    'ServiceSaleItem': EntityDefinition('ServiceSaleItem', 'Transaction', 'ServiceSaleItem'),
+    'InventoryCostRevaluation': EntityDefinition('InventoryCostRevaluation', 'Transaction', 'InventoryCostRevaluation'),
+    'UnitsType': EntityDefinition('UnitsType', 'Transaction', 'UnitsType'),
+    'EntityGroup': EntityDefinition('EntityGroup', 'Transaction', 'EntityGroup'),
+    'DepositApplication': EntityDefinition('DepositApplication', 'Transaction', 'DepositApplication'),
+    'SalesTaxItem': EntityDefinition('SalesTaxItem', 'Transaction', 'SalesTaxItem'),
+    'CustomTransaction': EntityDefinition('CustomTransaction', 'Transaction', 'CustomTransaction'),
+    'LandedCost': EntityDefinition('LandedCost', 'Transaction', 'LandedCost'),
+    'Task': EntityDefinition('Task', 'Transaction', 'Task'),
+    'TimeSheet': EntityDefinition('TimeSheet', 'Transaction', 'TimeSheet'),
+    'GiftCertificate': EntityDefinition('GiftCertificate', 'Transaction', 'GiftCertificate'),
+    'KitItem': EntityDefinition('KitItem', 'Transaction', 'KitItem'),
+    'DescriptionItem': EntityDefinition('DescriptionItem', 'Transaction', 'DescriptionItem'),
+    'ItemFulfillment': EntityDefinition('ItemFulfillment', 'Transaction', 'ItemFulfillment'),
+    'ContactCategory': EntityDefinition('ContactCategory', 'Transaction', 'ContactCategory'),
+    'CustomerMessage': EntityDefinition('CustomerMessage', 'Transaction', 'CustomerMessage'),
+    'OtherChargeResaleItem': EntityDefinition('OtherChargeResaleItem', 'Transaction', 'OtherChargeResaleItem'),
+    'NoteType': EntityDefinition('NoteType', 'Transaction', 'NoteType'),
+    'VendorReturnAuthorization': EntityDefinition('VendorReturnAuthorization', 'Transaction',
+                                                  'VendorReturnAuthorization'),
+    'Job': EntityDefinition('Job', 'Transaction', 'Job'),
+    'CampaignSubscription': EntityDefinition('CampaignSubscription', 'Transaction', 'CampaignSubscription'),
+    'CampaignFamily': EntityDefinition('CampaignFamily', 'Transaction', 'CampaignFamily'),
+    'CrmCustomField': EntityDefinition('CrmCustomField', 'Transaction', 'CrmCustomField'),
+    'BinWorksheet': EntityDefinition('BinWorksheet', 'Transaction', 'BinWorksheet'),
+    'SerializedInventoryItem': EntityDefinition('SerializedInventoryItem', 'Transaction', 'SerializedInventoryItem'),
+    'DiscountItem': EntityDefinition('DiscountItem', 'Transaction', 'DiscountItem'),
+    'CustomerRefund': EntityDefinition('CustomerRefund', 'Transaction', 'CustomerRefund'),
+    'TransferOrder': EntityDefinition('TransferOrder', 'Transaction', 'TransferOrder'),
+    'PartnerCategory': EntityDefinition('PartnerCategory', 'Transaction', 'PartnerCategory'),
+    'OtherChargePurchaseItem': EntityDefinition('OtherChargePurchaseItem', 'Transaction', 'OtherChargePurchaseItem'),
+    'BinTransfer': EntityDefinition('BinTransfer', 'Transaction', 'BinTransfer'),
+    'PaymentMethod': EntityDefinition('PaymentMethod', 'Transaction', 'PaymentMethod'),
+    'ItemAccountMapping': EntityDefinition('ItemAccountMapping', 'Transaction', 'ItemAccountMapping'),
+    'CustomerStatus': EntityDefinition('CustomerStatus', 'Transaction', 'CustomerStatus'),
+    'Estimate': EntityDefinition('Estimate', 'Transaction', 'Estimate'),
+    'SalesRole': EntityDefinition('SalesRole', 'Transaction', 'SalesRole'),
+    'ManufacturingCostTemplate': EntityDefinition('ManufacturingCostTemplate', 'Transaction',
+                                                  'ManufacturingCostTemplate'),
+    'AssemblyUnbuild': EntityDefinition('AssemblyUnbuild', 'Transaction', 'AssemblyUnbuild'),
+    'ItemSupplyPlan': EntityDefinition('ItemSupplyPlan', 'Transaction', 'ItemSupplyPlan'),
+    'NonInventoryResaleItem': EntityDefinition('NonInventoryResaleItem', 'Transaction', 'NonInventoryResaleItem'),
+    'BillingSchedule': EntityDefinition('BillingSchedule', 'Transaction', 'BillingSchedule'),
+    'PaymentItem': EntityDefinition('PaymentItem', 'Transaction', 'PaymentItem'),
+    'ItemGroup': EntityDefinition('ItemGroup', 'Transaction', 'ItemGroup'),
+    'WorkOrder': EntityDefinition('WorkOrder', 'Transaction', 'WorkOrder'),
+    'WorkOrderIssue': EntityDefinition('WorkOrderIssue', 'Transaction', 'WorkOrderIssue'),
+    'SupportCaseIssue': EntityDefinition('SupportCaseIssue', 'Transaction', 'SupportCaseIssue'),
+    'ContactRole': EntityDefinition('ContactRole', 'Transaction', 'ContactRole'),
+    'CustomerPayment': EntityDefinition('CustomerPayment', 'Transaction', 'CustomerPayment'),
+    'PricingGroup': EntityDefinition('PricingGroup', 'Transaction', 'PricingGroup'),
+    'SupportCasePriority': EntityDefinition('SupportCasePriority', 'Transaction', 'SupportCasePriority'),
+    'Campaign': EntityDefinition('campaign', 'Campaign', require_paging=False, search_record=True, page_size=100),
+    'LotNumberedAssemblyItem': EntityDefinition('LotNumberedAssemblyItem', 'Transaction', 'LotNumberedAssemblyItem'),
+    'InventoryNumber': EntityDefinition('InventoryNumber', 'Transaction', 'InventoryNumber'),
+    'VendorCredit': EntityDefinition('VendorCredit', 'Transaction', 'VendorCredit'),
+    'CustomRecordCustomField': EntityDefinition('CustomRecordCustomField', 'Transaction', 'CustomRecordCustomField'),
+    'CustomerDeposit': EntityDefinition('CustomerDeposit', 'Transaction', 'CustomerDeposit'),
+    'SupportCase': EntityDefinition('SupportCase', 'Transaction', 'SupportCase'),
+    'ServicePurchaseItem': EntityDefinition('ServicePurchaseItem', 'Transaction', 'ServicePurchaseItem'),
+    'CampaignOffer': EntityDefinition('CampaignOffer', 'Transaction', 'CampaignOffer'),
+    'CampaignAudience': EntityDefinition('CampaignAudience', 'Transaction', 'CampaignAudience'),
+    'AccountingPeriod': EntityDefinition('AccountingPeriod', 'Transaction', 'AccountingPeriod'),
+    'ServiceResaleItem': EntityDefinition('ServiceResaleItem', 'Transaction', 'ServiceResaleItem'),
+    'CustomerCategory': EntityDefinition('CustomerCategory', 'Transaction', 'CustomerCategory'),
+    'RevRecSchedule': EntityDefinition('RevRecSchedule', 'Transaction', 'RevRecSchedule'),
+    'CashSale': EntityDefinition('CashSale', 'Transaction', 'CashSale'),
+    'CalendarEvent': EntityDefinition('CalendarEvent', 'Transaction', 'CalendarEvent'),
+    'CampaignVertical': EntityDefinition('CampaignVertical', 'Transaction', 'CampaignVertical'),
+    'OtherCustomField': EntityDefinition('OtherCustomField', 'Transaction', 'OtherCustomField'),
+    'EntityCustomField': EntityDefinition('EntityCustomField', 'Transaction', 'EntityCustomField'),
+    'PayrollItem': EntityDefinition('PayrollItem', 'Transaction', 'PayrollItem'),
+    'SerializedAssemblyItem': EntityDefinition('SerializedAssemblyItem', 'Transaction', 'SerializedAssemblyItem'),
+    'OtherNameCategory': EntityDefinition('OtherNameCategory', 'Transaction', 'OtherNameCategory'),
+    'ReturnAuthorization': EntityDefinition('ReturnAuthorization', 'Transaction', 'ReturnAuthorization'),
+    'Nexus': EntityDefinition('Nexus', 'Transaction', 'Nexus'),
+    'TransactionBodyCustomField': EntityDefinition('TransactionBodyCustomField', 'Transaction',
+                                                   'TransactionBodyCustomField'),
+    'WorkOrderCompletion': EntityDefinition('WorkOrderCompletion', 'Transaction', 'WorkOrderCompletion'),
+    'BudgetCategory': EntityDefinition('BudgetCategory', 'Transaction', 'BudgetCategory'),
+    'SiteCategory': EntityDefinition('SiteCategory', 'Transaction', 'SiteCategory'),
+    'DownloadItem': EntityDefinition('DownloadItem', 'Transaction', 'DownloadItem'),
+    'CustomRecordType': EntityDefinition('CustomRecordType', 'Transaction', 'CustomRecordType'),
+    'ItemOptionCustomField': EntityDefinition('ItemOptionCustomField', 'Transaction', 'ItemOptionCustomField'),
+    'CashRefund': EntityDefinition('CashRefund', 'Transaction', 'CashRefund'),
+    'ResourceAllocation': EntityDefinition('ResourceAllocation', 'Transaction', 'ResourceAllocation'),
+    'ItemReceipt': EntityDefinition('ItemReceipt', 'Transaction', 'ItemReceipt'),
+    'ManufacturingOperationTask': EntityDefinition('ManufacturingOperationTask', 'Transaction',
+                                                   'ManufacturingOperationTask'),
+    'PhoneCall': EntityDefinition('PhoneCall', 'Transaction', 'PhoneCall'),
+    'BillingAccount': EntityDefinition('BillingAccount', 'Transaction', 'BillingAccount'),
+    'NonInventoryPurchaseItem': EntityDefinition('NonInventoryPurchaseItem', 'Transaction', 'NonInventoryPurchaseItem'),
+    'MarkupItem': EntityDefinition('MarkupItem', 'Transaction', 'MarkupItem'),
+    'ProjectTask': EntityDefinition('ProjectTask', 'Transaction', 'ProjectTask'),
+    'PaycheckJournal': EntityDefinition('PaycheckJournal', 'Transaction', 'PaycheckJournal'),
+    'Partner': EntityDefinition('Partner', 'Transaction', 'Partner'),
+    'AssemblyItem': EntityDefinition('AssemblyItem', 'Transaction', 'AssemblyItem'),
+    'GiftCertificateItem': EntityDefinition('GiftCertificateItem', 'Transaction', 'GiftCertificateItem'),
+    'JobStatus': EntityDefinition('JobStatus', 'Transaction', 'JobStatus'),
+    'InterCompanyJournalEntry': EntityDefinition('InterCompanyJournalEntry', 'Transaction', 'InterCompanyJournalEntry'),
+    'Budget': EntityDefinition('Budget', 'Transaction', 'Budget'),
+    'OtherChargeSaleItem': EntityDefinition('OtherChargeSaleItem', 'Transaction', 'OtherChargeSaleItem'),
+    'Note': EntityDefinition('Note', 'Transaction', 'Note'),
+    'AssemblyBuild': EntityDefinition('AssemblyBuild', 'Transaction', 'AssemblyBuild'),
+    'Bin': EntityDefinition('Bin', 'Transaction', 'Bin'),
+    'CampaignCategory': EntityDefinition('CampaignCategory', 'Transaction', 'CampaignCategory'),
+    'TimeEntry': EntityDefinition('TimeEntry', 'Transaction', 'TimeEntry'),
+    'Check': EntityDefinition('Check', 'Transaction', 'Check'),
+    'ItemCustomField': EntityDefinition('ItemCustomField', 'Transaction', 'ItemCustomField'),
+    'Message': EntityDefinition('Message', 'Transaction', 'Message'),
+}
+
+# Stream names and the factories of their entities, built from the definitions
+SEARCH_ENTITIES = {stream: functools.partial(definition.entity_class, definition=definition)
+                   for stream, definition in ENTITY_DEFINITIONS.items()}
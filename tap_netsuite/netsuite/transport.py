@@ -0,0 +1,64 @@
+import threading
+
+import requests
+import singer
+from singer import metrics
+from zeep.transports import Transport
+
+from .retry import CURRENT_STREAM
+
+LOGGER = singer.get_logger()
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 30
+# NetSuite ends web services requests running longer than 15 minutes
+DEFAULT_READ_TIMEOUT_SECONDS = 900
+
+
+class NetSuiteTransport(Transport):
+    """The transport of the SOAP requests made to NetSuite.
+
+    Responses are requested gzip compressed over kept alive connections,
+    from a pool of pool_size connections, as many as the requests the tap
+    makes at once. A connection taking longer than connect_timeout seconds
+    to open, or a response read_timeout seconds to send more data, fails
+    the request, which is then retried as any failed connection.
+
+    Each request logs the bytes of its response on the wire and once
+    decompressed, and the seconds before its first byte arrived. The latter
+    are also kept for the thread that made it (response_bytes)."""
+
+    def __init__(self, pool_size=None, connect_timeout=None, read_timeout=None, cache=None):
+        super().__init__(cache=cache,
+                         operation_timeout=(float(connect_timeout or DEFAULT_CONNECT_TIMEOUT_SECONDS),
+                                            float(read_timeout or DEFAULT_READ_TIMEOUT_SECONDS)))
+        self.pool_size = int(pool_size or DEFAULT_POOL_SIZE)
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({'Accept-Encoding': 'gzip, deflate', 'Connection': 'keep-alive'})
+        self._local = threading.local()
+
+    def post(self, address, message, headers):
+        response = Transport.post(self, address, message, headers)
+        # The bytes read off the connection, before they were decompressed
+        wire_bytes = response.raw.tell() if hasattr(response.raw, 'tell') else len(response.content)
+        self.log_response(headers.get('SOAPAction', '').strip('"'), response, wire_bytes,
+                          response.elapsed.total_seconds())
+        self._local.response_bytes = len(response.content)
+        return response
+
+    def response_bytes(self):
+        """The decompressed bytes of the response to the last request of the calling thread."""
+        return getattr(self._local, 'response_bytes', 0)
+
+    @staticmethod
+    def log_response(operation, response, wire_bytes, time_to_first_byte):
+        tags = {'endpoint': CURRENT_STREAM.get(),
+                'operation': operation,
+                'http_status_code': response.status_code,
+                'content_encoding': response.headers.get('Content-Encoding', 'identity'),
+                'decoded_bytes': len(response.content)}
+        metrics.log(LOGGER, metrics.Point('counter', 'response_bytes', wire_bytes, tags))
+        metrics.log(LOGGER, metrics.Point('timer', 'time_to_first_byte', round(time_to_first_byte, 3),
+                                          {'endpoint': tags['endpoint'], 'operation': operation}))
@@ -0,0 +1,147 @@
+"""Pre-parsed NetSuite WSDL bundles.
+
+Building the client downloads the NetSuite WSDL and its XSDs, which the
+persistent cache of wsdl_cache_dir keeps between runs, and parses them into
+several thousand types. A bundle is the parsed WSDL pickled once, so that
+the client can be built without the network and without parsing:
+
+    tap-netsuite --config config.json --warm-cache
+
+The bundle is only used by the zeep version and the WSDL it was built with,
+otherwise the WSDL is parsed as usual. It is unpickled, only load bundles
+you built."""
+import contextlib
+import copyreg
+import gc
+import os
+import pickle
+import threading
+
+import singer
+import zeep
+from lxml import etree
+from zeep.settings import Settings
+from zeep.transports import Transport
+from zeep.wsdl import Document
+from zeep.xsd.valueobjects import ArrayValue
+
+import netsuitesdk.internal.client as netsuite_client_module
+
+LOGGER = singer.get_logger()
+
+MAGIC = b'NSWSDL1\n'
+
+# Classes zeep creates while parsing, pickled by how they are created again
+_DYNAMIC_TYPES_MODULE = 'zeep.xsd.dynamic_types'
+_VALUE_OBJECTS_MODULE = 'zeep.objects'
+
+_client_class_lock = threading.Lock()
+
+
+def _dynamic_type(name, bases, attributes):
+    return type(name, bases, attributes)
+
+
+class _BundlePickler(pickle.Pickler):
+    dispatch_table = copyreg.dispatch_table.copy()
+    dispatch_table[etree.QName] = lambda qname: (etree.QName, (qname.text,))
+    dispatch_table[etree._Element] = (  # pylint: disable=protected-access
+        lambda element: (etree.fromstring, (etree.tostring(element),)))
+
+    def persistent_id(self, obj):
+        # The transport and settings are those of the client loading the bundle
+        if isinstance(obj, Transport):
+            return 'transport'
+        if isinstance(obj, Settings):
+            return 'settings'
+        return None
+
+    def reducer_override(self, obj):
+        if isinstance(obj, type):
+            if obj.__module__ == _DYNAMIC_TYPES_MODULE:
+                attributes = {name: value for name, value in vars(obj).items() if name in ('__module__', '_xsd_name')}
+                return _dynamic_type, (obj.__name__, obj.__bases__, attributes)
+            if obj.__module__ == _VALUE_OBJECTS_MODULE:
+                return getattr, (obj._xsd_type, '_array_class' if issubclass(obj, ArrayValue) else '_value_class')
+        return NotImplemented
+
+
+class _BundleUnpickler(pickle.Unpickler):
+    def __init__(self, file, transport, settings):
+        pickle.Unpickler.__init__(self, file)
+        self.transport = transport
+        self.settings = settings
+
+    def persistent_load(self, pid):
+        if pid == 'transport':
+            return self.transport
+        if pid == 'settings':
+            return self.settings
+        raise pickle.UnpicklingError(f'unknown persistent id {pid}')
+
+
+def _header(wsdl_url):
+    # The account's host does not change the WSDL, its version does
+    wsdl_path = wsdl_url.split('/wsdl/', 1)[-1]
+    return MAGIC + f'{zeep.__version__} {wsdl_path}\n'.encode('utf-8')
+
+
+def save_bundle(document, wsdl_url, path):
+    """Pickles the parsed WSDL document of wsdl_url to path."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(_header(wsdl_url))
+        _BundlePickler(f, protocol=pickle.HIGHEST_PROTOCOL).dump(document)
+    os.replace(temp_path, path)
+
+
+def load_bundle(wsdl_url, path, transport=None):
+    """The parsed WSDL document of wsdl_url pickled to path, or None if
+    there is no bundle for this zeep version and WSDL."""
+    try:
+        with open(path, 'rb') as f:
+            if f.readline() + f.readline() != _header(wsdl_url):
+                LOGGER.warning('WSDL bundle %s was built for another zeep version or WSDL, not using it', path)
+                return None
+            # Unpickling allocates the types by the thousand, the cyclic
+            # garbage collector would run many times over without freeing any
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                document = _BundleUnpickler(f, transport or Transport(), Settings()).load()
+            finally:
+                if gc_enabled:
+                    gc.enable()
+    except FileNotFoundError:
+        LOGGER.info('WSDL bundle %s not found, parsing the WSDL', path)
+        return None
+    except Exception as e:  # pylint: disable=broad-except
+        LOGGER.warning('WSDL bundle %s could not be loaded (%s), parsing the WSDL', path, e)
+        return None
+    if not isinstance(document, Document):
+        LOGGER.warning('WSDL bundle %s does not hold a WSDL document, parsing the WSDL', path)
+        return None
+    return document
+
+
+@contextlib.contextmanager
+def preparsed_wsdl(bundle_path):
+    """NetSuiteClients built in the block use the WSDL document of the
+    bundle at bundle_path, if it can be loaded, instead of parsing their WSDL."""
+
+    def client_class(wsdl, transport=None, **kwargs):
+        document = load_bundle(wsdl, bundle_path, transport)
+        if document is None:
+            return zeep.Client(wsdl, transport=transport, **kwargs)
+        LOGGER.info('Using the WSDL parsed in %s', bundle_path)
+        return zeep.Client(document, transport=transport, **kwargs)
+
+    # NetSuiteClient builds its zeep client with the Client of its module
+    with _client_class_lock:
+        original = netsuite_client_module.Client
+        netsuite_client_module.Client = client_class
+        try:
+            yield
+        finally:
+            netsuite_client_module.Client = original
@@ -0,0 +1,104 @@
+import sys
+import threading
+import time
+
+import singer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+LOGGER = singer.get_logger()
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+
+class MessageWriter:
+    """Writes Singer messages to stdout, batching RECORD messages.
+
+    RECORD messages are buffered until the buffer reaches buffer_size bytes
+    or flush_interval seconds passed since the last flush. Any other message
+    (SCHEMA, STATE, ACTIVATE_VERSION) is appended to the buffer and flushed
+    with it, so it is always written after the records that preceded it and
+    a bookmark is never emitted ahead of its records."""
+
+    def __init__(self, buffer_size=DEFAULT_BUFFER_SIZE, flush_interval=DEFAULT_FLUSH_INTERVAL, use_orjson=False):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.use_orjson = use_orjson and orjson is not None
+        if use_orjson and orjson is None:
+            LOGGER.warning('orjson is not installed, falling back to the standard JSON encoder')
+
+        self._buffer = []
+        self._buffered_bytes = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
+
+    def format_message(self, message):
+        if self.use_orjson:
+            try:
+                return orjson.dumps(message.asdict()).decode('utf-8')
+            except TypeError:
+                # e.g. Decimal values, which only simplejson writes as numbers
+                pass
+        return singer.format_message(message)
+
+    def write_message(self, message):
+        line = self.format_message(message) + '\n'
+        with self._lock:
+            self._buffer.append(line)
+            self._buffered_bytes += len(line)
+            if (not isinstance(message, singer.RecordMessage)
+                    or self._buffered_bytes >= self.buffer_size
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self.flush()
+
+    def flush(self):
+        with self._lock:
+            if self._buffer:
+                sys.stdout.write(''.join(self._buffer))
+                self._buffer = []
+                self._buffered_bytes = 0
+            sys.stdout.flush()
+            self._last_flush = time.monotonic()
+
+
+WRITER = MessageWriter()
+
+
+def configure(buffer_size=None, flush_interval=None, use_orjson=False):
+    """Replaces the module writer, flushing whatever the previous one buffered."""
+    global WRITER  # pylint: disable=global-statement
+    WRITER.flush()
+    WRITER = MessageWriter(
+        buffer_size=DEFAULT_BUFFER_SIZE if buffer_size is None else int(buffer_size),
+        flush_interval=DEFAULT_FLUSH_INTERVAL if flush_interval is None else float(flush_interval),
+        use_orjson=use_orjson)
+
+
+def write_message(message):
+    WRITER.write_message(message)
+
+
+def write_state(value):
+    WRITER.write_message(singer.StateMessage(value=value))
+
+
+def write_schema(stream_name, schema, key_properties, bookmark_properties=None, stream_alias=None):
+    if isinstance(key_properties, (str, bytes)):
+        key_properties = [key_properties]
+    if not isinstance(key_properties, list):
+        raise Exception("key_properties must be a string or list of strings")
+
+    WRITER.write_message(
+        singer.SchemaMessage(
+            stream=(stream_alias or stream_name),
+            schema=schema,
+            key_properties=key_properties,
+            bookmark_properties=bookmark_properties))
+
+
+def flush():
+    WRITER.flush()
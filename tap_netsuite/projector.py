@@ -0,0 +1,143 @@
+import datetime
+import json
+from decimal import Decimal
+
+import pytz
+from singer import Transformer
+from singer.transform import SchemaMismatch, string_to_datetime
+from singer.utils import strftime
+
+
+def _types(schema):
+    types = schema.get('type', [])
+    if not isinstance(types, list):
+        types = [types]
+    return set(types)
+
+
+def _is_plain(schema, types):
+    """True when the schema is only a 'type' keyword with exactly these types."""
+    return set(schema) == {'type'} and _types(schema) == types
+
+
+def _is_datetime(schema):
+    sub_schemas = schema.get('anyOf')
+    if set(schema) != {'anyOf'} or not isinstance(sub_schemas, list) or len(sub_schemas) != 2:
+        return False
+    date_time, fallback = sub_schemas
+    return (set(date_time) == {'type', 'format'}
+            and _types(date_time) == {'string'}
+            and date_time['format'] == 'date-time'
+            and _is_plain(fallback, {'string', 'null'}))
+
+
+class _Fallback(Exception):
+    """Raised by a specialized converter for values it does not handle."""
+
+
+def _string(value):
+    if value is None or value == "":
+        return None
+    if isinstance(value, dict):
+        return json.dumps(value, default=str)
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _number(value):
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float, Decimal)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.replace(",", ""))
+        except ValueError:
+            pass
+    raise _Fallback()
+
+
+def _boolean(value):
+    if isinstance(value, str):
+        return False if value.lower() == "false" else bool(value)
+    if isinstance(value, dict):
+        # The pre_hook turns objects into a (non-empty) JSON string.
+        return True
+    return bool(value)
+
+
+def _date_time(value):
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime.datetime):
+        if value.utcoffset() is None:
+            return strftime(value.replace(tzinfo=pytz.UTC))
+        return strftime(value.astimezone(pytz.UTC))
+    if isinstance(value, str):
+        return string_to_datetime(value) or value
+    raise _Fallback()
+
+
+def _transformer_converter(pre_hook, property_schema, _property):
+    """Converts a single property with singer's Transformer, exactly as the
+    default sync path does for the whole record."""
+
+    def convert(value):
+        if isinstance(value, datetime.datetime):
+            value = value.isoformat()
+        transformer = Transformer(pre_hook=pre_hook)
+        success, result = transformer.transform_recur(value, property_schema, [_property])
+        if not success:
+            raise SchemaMismatch(transformer.errors)
+        return result
+
+    return convert
+
+
+def _specialized_converter(converter, fallback):
+    def convert(value):
+        try:
+            return converter(value)
+        except _Fallback:
+            return fallback(value)
+
+    return convert
+
+
+def _property_converter(pre_hook, property_schema, _property):
+    fallback = _transformer_converter(pre_hook, property_schema, _property)
+
+    if _is_plain(property_schema, {'string', 'null'}):
+        return _string
+    if _is_plain(property_schema, {'boolean', 'null'}):
+        return _boolean
+    if _is_plain(property_schema, {'number', 'null'}):
+        return _specialized_converter(_number, fallback)
+    if _is_datetime(property_schema):
+        return _specialized_converter(_date_time, fallback)
+
+    return fallback
+
+
+def compile_projector(field_map, schema, pre_hook):
+    """Compiles a function mapping a serialized NetSuite record straight to the
+    record written for the stream.
+
+    The output is the same as running singer's Transformer with the stream's
+    pre_hook over the record: the property schemas emitted by discovery get
+    a specialized converter and anything else is delegated to the Transformer
+    for that property only. Returns None if the stream schema is not an
+    object schema the projector can handle."""
+    if _types(schema) != {'object'} or not isinstance(schema.get('properties'), dict):
+        return None
+
+    properties = schema['properties']
+    converters = [(_property, prop, _property_converter(pre_hook, properties[_property], _property))
+                  for _property, prop in field_map]
+
+    def project(record):
+        get = record.get
+        return {_property: convert(get(prop)) for _property, prop, convert in converters}
+
+    return project
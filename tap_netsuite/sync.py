@@ -9,6 +9,13 @@ from jsonpath_ng import jsonpath, parse
 import json
 from zeep.helpers import serialize_object
 import types
+from tap_netsuite import output
+from tap_netsuite.netsuite.backfill import BackfillWindows
+from tap_netsuite.netsuite.checkpoint import clear_checkpoint, read_checkpoint, write_checkpoint
+from tap_netsuite.netsuite.decoder import DecodedRecord
+from tap_netsuite.netsuite.exceptions import TapNetSuiteException
+from tap_netsuite.netsuite.pagination import KeysetPages, PartitionedPages, SearchLines, SearchPages, prefetch
+from tap_netsuite.projector import compile_projector
 
 LOGGER = singer.get_logger()
 
@@ -22,15 +29,91 @@ def get_internal_name_by_name(ns, stream):
     return to_return
 
 
-def transform_data_hook(ns, stream):
+def get_selected_properties(catalog_entry):
+    """Returns the schema properties to sync, in schema order.
+
+    Like singer's Transformer, a property is left out only when its metadata
+    deselects it or marks it unsupported, automatic properties are always kept."""
+    mdata = metadata.to_map(catalog_entry['metadata'])
+    selected = []
+    for _property in catalog_entry['schema'].get('properties', {}):
+        field_metadata = mdata.get(('properties', _property), {})
+        if field_metadata.get('inclusion') != 'automatic' and (
+                field_metadata.get('selected') is False or field_metadata.get('inclusion') == 'unsupported'):
+            continue
+        selected.append(_property)
+    return selected
+
+
+def serialize_fields(rec, fields):
+    """Serializes only the given top level fields of a zeep record.
+
+    zeep's serialize_object copies the whole object graph (sublists, null
+    field lists, every RecordRef) into OrderedDicts, this reads the fields
+    straight off the CompoundValue (or dict) and skips everything else.
+    Decoded records already hold plain values."""
+    if isinstance(rec, DecodedRecord):
+        return {field: rec.get(field) for field in fields}
+    return {field: serialize_object(rec[field]) if field in rec else None for field in fields}
+
+
+def build_field_map(internal_name_by_property, schema, properties=None):
+    """Compiles the per-stream lookups used by the pre_hook.
+
+    Returns the (displayName, internal name) pairs for the schema properties
+    (or the given subset of them) and, keyed by the id of each (sub)schema, whether it coerces '0.0' to '0'
+    (integer types) and empty strings to None (nullable types)."""
+    if properties is None:
+        properties = schema.get('properties', {})
+    field_map = [(_property, internal_name_by_property[_property]) for _property in properties]
+
+    coercions = {}
+    schemas = [schema]
+    while schemas:
+        sub_schema = schemas.pop()
+        types = sub_schema.get('type', [])
+        coercions[id(sub_schema)] = ('integer' in types, 'null' in types)
+        schemas.extend(sub_schema.get('anyOf', []))
+        schemas.extend(sub_schema.get('properties', {}).values())
+        if isinstance(sub_schema.get('items'), dict):
+            schemas.append(sub_schema['items'])
+
+    return field_map, coercions
+
+
+def max_replication_key_value(values, until):
+    """The highest of the replication key values of the records of a page
+    that is not after until, as a UTC datetime, or None.
+
+    The values are those of the source records, where zeep already parsed
+    them into datetimes; strings are only parsed for records holding them."""
+    highest = None
+    for value in values:
+        if not isinstance(value, datetime.datetime):
+            if not value:
+                continue
+            value = singer_utils.strptime_with_tz(value)
+        elif value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        if value <= until and (highest is None or value > highest):
+            highest = value
+    return highest.astimezone(datetime.timezone.utc) if highest is not None else None
+
+
+def transform_data_hook(ns, stream, stream_schema, properties=None):
+    internal_name_by_property = get_internal_name_by_name(ns, stream)
+    field_map, coercions = build_field_map(internal_name_by_property, stream_schema, properties)
+
     def pre_hook(data, typ, schema):
-        internal_name_by_property = get_internal_name_by_name(ns, stream)
         result = data
         if isinstance(data, dict):
             result = {}
-            schema_properties = schema.get('properties', {})
-            for _property in schema_properties:
-                prop = internal_name_by_property[_property]
+            if schema is stream_schema:
+                properties = field_map
+            else:
+                properties = [(_property, internal_name_by_property[_property])
+                              for _property in schema.get('properties', {})]
+            for _property, prop in properties:
                 data_property = data.get(prop, None)
                 if isinstance(data_property, datetime.datetime) is True:
                     data_property = data_property.isoformat()
@@ -39,16 +122,19 @@ def transform_data_hook(ns, stream):
             if not typ == 'object':
                 result = json.dumps(data, default=str)
 
+        coerce_integer, nullable = coercions.get(id(schema)) or (
+            'integer' in schema.get('type', []), 'null' in schema.get('type', []))
+
         # NetSuite can return the value '0.0' for integer typed fields. This
         # causes a schema violation. Convert it to '0' if schema['type'] has
         # integer.
-        if data == '0.0' and 'integer' in schema.get('type', []):
+        if data == '0.0' and coerce_integer:
             result = '0'
 
         # NetSuite Bulk API returns CSV's with empty strings for text fields.
         # When the text field is nillable and the data value is an empty string,
         # change the data so that it is None.
-        if data == "" and "null" in schema['type']:
+        if data == "" and nullable:
             result = None
 
         return result
@@ -68,19 +154,25 @@ def get_stream_version(catalog_entry, state):
 
     if replication_key:
         return stream_version
+    # A FULL_TABLE sync resumed after its last internalId keeps the version of the rows written before
+    if stream_version is not None and singer.get_bookmark(state, tap_stream_id, 'LastInternalId') is not None:
+        return stream_version
     return int(time.time() * 1000)
 
 
-def sync_stream(ns, catalog_entry, state):
+def sync_stream(ns, catalog_entry, state, write_state=output.write_state):
     stream = catalog_entry['stream']
 
     with metrics.record_counter(stream) as counter:
         try:
-            sync_records(ns, catalog_entry, state, counter)
-            singer.write_state(state)
+            sync_records(ns, catalog_entry, state, counter, write_state)
+            write_state(state)
         except RequestException as ex:
             raise Exception("Error syncing {}: {} Response: {}".format(
                 stream, ex, ex.response.text))
+        except TapNetSuiteException:
+            # Kept as they are, main exits with their exit code
+            raise
         except Exception as ex:
             raise Exception("Error syncing {}: {}".format(
                 stream, ex)) from ex
@@ -88,9 +180,10 @@ def sync_stream(ns, catalog_entry, state):
         return counter
 
 
-def sync_records(ns, catalog_entry, state, counter):
+def sync_records(ns, catalog_entry, state, counter, write_state=output.write_state):
     chunked_bookmark = singer_utils.strptime_with_tz(ns.get_start_date(state, catalog_entry))
     stream = catalog_entry['stream']
+    tap_stream_id = catalog_entry['tap_stream_id']
     schema = catalog_entry['schema']
     stream_alias = catalog_entry.get('stream_alias')
     catalog_metadata = metadata.to_map(catalog_entry['metadata'])
@@ -104,50 +197,121 @@ def sync_records(ns, catalog_entry, state, counter):
     LOGGER.info('Syncing NetSuite data for stream %s', stream)
 
     previous_max_replication_key = None
+    highest_bookmark = None
 
     query_func = ns.query
     query_result = query_func(ns, catalog_entry, state)
 
-    if not isinstance(query_result, types.GeneratorType):
-        if query_result is not None:
-            query_result = [query_result]
-        else:
-            query_result = []
-
-    for page in query_result:
-        for rec in page:
-            counter.increment()
-            with Transformer(pre_hook=transform_data_hook(ns, stream)) as transformer:
-                rec = transformer.transform(serialize_object(rec), schema)
-
-            singer.write_message(
-                singer.RecordMessage(
-                    stream=(
-                            stream_alias or stream),
-                    record=rec,
-                    version=stream_version,
-                    time_extracted=start_time))
+    if isinstance(query_result, BackfillWindows):
+        windows = query_result
+    else:
+        if not isinstance(query_result,
+                          (types.GeneratorType, SearchPages, KeysetPages, PartitionedPages, SearchLines)):
+            if query_result is not None:
+                query_result = [query_result]
+            else:
+                query_result = []
+        windows = [(None, query_result)]
+
+    # The pages of a search are checkpointed as they are written, a search
+    # resumed from its checkpoint starts after the last internalId written.
+    # Searches paged by internalId are checkpointed without a replication key too.
+    searched = isinstance(query_result, (BackfillWindows, SearchPages, KeysetPages, SearchLines))
+    keyset = getattr(query_result, 'keyset', False)
+    checkpointed = searched and (bool(replication_key) or keyset)
+    checkpoint = None
+    resumed_pages = 0
+    if checkpointed:
+        checkpoint = read_checkpoint(state, tap_stream_id, chunked_bookmark)
+    if checkpoint is not None:
+        resumed_pages = checkpoint.pages
+        query_result.resume_after(checkpoint.last_internal_id)
+        if checkpoint.highest_bookmark:
+            highest_bookmark = checkpoint.highest_bookmark
+            previous_max_replication_key = singer_utils.strptime_with_tz(highest_bookmark)
+
+    properties = get_selected_properties(catalog_entry)
+    internal_name_by_property = get_internal_name_by_name(ns, stream)
+    field_map, _ = build_field_map(internal_name_by_property, schema, properties)
+    fields = [prop for _, prop in field_map]
+    replication_key_field = internal_name_by_property.get(replication_key, replication_key)
+
+    pre_hook = transform_data_hook(ns, stream, schema, properties)
+    project = None
+    if ns.use_record_projector:
+        project = compile_projector(field_map, schema, pre_hook)
+        if project is None:
+            LOGGER.info('%s: Schema is not supported by the record projector, using the Transformer', stream)
+
+    window_start = chunked_bookmark
+    for window_end, pages in windows:
+        # The next pages of a search are fetched while the current one is synced
+        if ns.prefetch_pages and searched:
+            pages = prefetch(pages, ns.prefetch_pages, ns.prefetch_budget)
+        pages_written = resumed_pages
+        resumed_pages = 0
+        for page in pages:
+            replication_key_values = []
+            for rec in page:
+                counter.increment()
+                if replication_key:
+                    replication_key_values.append(rec[replication_key_field] if replication_key_field in rec else None)
+                rec = serialize_fields(rec, fields)
+                if project is not None:
+                    rec = project(rec)
+                else:
+                    with Transformer(pre_hook=pre_hook) as transformer:
+                        rec = transformer.transform(rec, schema)
+
+                output.write_message(
+                    singer.RecordMessage(
+                        stream=(
+                                stream_alias or stream),
+                        record=rec,
+                        version=stream_version,
+                        time_extracted=start_time))
 
             if replication_key:
-                _rec = rec.get(replication_key, None)
-                original_replication_key_value = ""
-                replication_key_value = None
-                if replication_key and _rec is not None:
-                    original_replication_key_value = _rec
-                    replication_key_value = singer_utils.strptime_with_tz(original_replication_key_value)
-
-                if previous_max_replication_key is None or (
-                        replication_key_value and replication_key_value <= start_time and replication_key_value > previous_max_replication_key
-                ):
-                    state = singer.write_bookmark(
-                        state,
-                        catalog_entry['tap_stream_id'],
-                        replication_key,
-                        original_replication_key_value)
+                replication_key_value = max_replication_key_value(replication_key_values, start_time)
+                if replication_key_value is not None and (
+                        previous_max_replication_key is None or replication_key_value > previous_max_replication_key):
+                    highest_bookmark = singer_utils.strftime(replication_key_value)
                     previous_max_replication_key = replication_key_value
 
+            if checkpointed:
+                pages_written += 1
+                # A search with no window ends when the sync started, its records modified since are
+                # searched again when it is resumed
+                state = write_checkpoint(state, tap_stream_id, window_start, window_end or start_time,
+                                         pages_written, highest_bookmark, getattr(pages, 'last_internal_id', None))
+                if not replication_key:
+                    # Kept by the resumed sync, whose ActivateVersion then keeps these rows
+                    state = singer.write_bookmark(state, tap_stream_id, 'version', stream_version)
+                write_state(state)
+
+            if ns.stop_streams.is_set():
+                raise TapNetSuiteException('{}: Stopped, another stream failed'.format(stream))
+
+        # A backfill window is yielded once every record modified before its
+        # end was written, so its end is a safe bookmark to resume from.
+        if window_end is not None and replication_key:
+            state = clear_checkpoint(state, tap_stream_id)
+            state = singer.write_bookmark(
+                state,
+                tap_stream_id,
+                replication_key,
+                singer_utils.strftime(window_end))
+            highest_bookmark = singer_utils.strftime(window_end)
+            previous_max_replication_key = window_end
+            window_start = window_end
+            write_state(state)
+
+    if replication_key or checkpointed:
+        state = clear_checkpoint(state, tap_stream_id)
+    if replication_key and highest_bookmark is not None:
+        state = singer.write_bookmark(state, tap_stream_id, replication_key, highest_bookmark)
 
     if not replication_key:
-        singer.write_message(activate_version_message)
+        output.write_message(activate_version_message)
         state = singer.write_bookmark(
             state, catalog_entry['tap_stream_id'], 'version', None)
@@ -0,0 +1,142 @@
+import contextlib
+import datetime
+import io
+import json
+import threading
+import types
+
+import pytest
+import singer.utils as singer_utils
+from netsuitesdk.internal.client import NetSuiteClient
+from singer import metadata
+
+import tap_netsuite
+from tap_netsuite import create_property_schema, output
+from tap_netsuite.netsuite import NetSuite
+from tap_netsuite.netsuite.netsuite_client import ExtendedNetSuiteClient
+from tap_netsuite.netsuite.netsuite_connection import ExtendedNetSuiteConnection
+from tap_netsuite.netsuite.transaction_entities import EntityDefinition, SearchEntity
+
+PAGE_SIZE = 5
+START_DATE = '2021-01-01T00:00:00Z'
+
+
+class FakeClient(ExtendedNetSuiteClient):
+    """Answers searches from records in internalId order, filtered by their
+    lastModifiedDate and internalId. Fetching page fail_at_page fails."""
+
+    def __init__(self, records, fail_at_page=None):  # pylint: disable=super-init-not-called
+        self._local = threading.local()
+        self.page_fetch_workers = 1
+        self.records = records
+        self.fail_at_page = fail_at_page
+        self.results = {}
+
+    def search_factory(self, type_name):  # pylint: disable=arguments-differ
+        return types.SimpleNamespace(type_name=type_name)
+
+    def SearchLongField(self, **kwargs):  # pylint: disable=invalid-name
+        return types.SimpleNamespace(**kwargs)
+
+    @staticmethod
+    def matches(basic, rec):
+        date_filter = basic.lastModifiedDate
+        since = singer_utils.strptime_to_utc(date_filter['searchValue'])
+        if rec['lastModifiedDate'] < since:
+            return False
+        if date_filter['operator'] == 'within' and rec['lastModifiedDate'] > singer_utils.strptime_to_utc(
+                date_filter['searchValue2']):
+            return False
+        internal_id_filter = getattr(basic, 'internalIdNumber', None)
+        return internal_id_filter is None or int(rec['internalId']) > internal_id_filter.searchValue
+
+    def page(self, search_id, page_index):
+        records = self.results[search_id]
+        return types.SimpleNamespace(totalRecords=len(records),
+                                     pageSize=PAGE_SIZE,
+                                     totalPages=(len(records) + PAGE_SIZE - 1) // PAGE_SIZE,
+                                     pageIndex=page_index,
+                                     searchId=search_id,
+                                     records=records[(page_index - 1) * PAGE_SIZE:page_index * PAGE_SIZE])
+
+    def search(self, searchRecord):  # pylint: disable=invalid-name,arguments-differ
+        search_id = len(self.results)
+        self.results[search_id] = [dict(rec) for rec in self.records if self.matches(searchRecord.basic, rec)]
+        return self.page(search_id, 1)
+
+    def searchMoreWithId(self, searchId, pageIndex):  # pylint: disable=invalid-name,arguments-differ
+        if pageIndex == self.fail_at_page:
+            raise RuntimeError('Search session expired')
+        return self.page(searchId, pageIndex)
+
+
+def catalog_entry(ns, stream):
+    properties = {}
+    mdata = metadata.new()
+    for field in ns.describe(stream):
+        properties[field['displayName']], mdata = create_property_schema(field, mdata)
+        mdata = metadata.write(mdata, ('properties', field['displayName']), 'selected-by-default', True)
+    mdata = metadata.write(mdata, (), 'selected', True)
+    mdata = metadata.write(mdata, (), 'replication-key', 'lastModifiedDate')
+    mdata = metadata.write(mdata, (), 'replication-method', 'INCREMENTAL')
+    mdata = metadata.write(mdata, (), 'table-key-properties', ['Id'])
+    return {'stream': stream,
+            'tap_stream_id': stream,
+            'schema': {'type': 'object', 'additionalProperties': False, 'properties': properties},
+            'metadata': metadata.to_list(mdata)}
+
+
+def sync(client, state, **config):
+    connection = ExtendedNetSuiteConnection.__new__(ExtendedNetSuiteConnection)
+    connection.client = client
+    definition = EntityDefinition('SalesOrders', 'Transaction', page_size=PAGE_SIZE)
+    connection.entities = {'SalesOrders': SearchEntity(client, definition)}
+    ns = NetSuite(default_start_date=START_DATE, **config)
+    ns.ns_client = connection
+    catalog = {'streams': [catalog_entry(ns, 'SalesOrders')]}
+
+    stdout = io.StringIO()
+    error = None
+    with contextlib.redirect_stdout(stdout):
+        output.configure()
+        try:
+            tap_netsuite.do_sync(ns, catalog, tap_netsuite.build_state(state, catalog))
+        except Exception as exc:  # pylint: disable=broad-except
+            error = exc
+        output.flush()
+    messages = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    records = [message['record'] for message in messages if message['type'] == 'RECORD']
+    states = [message['value'] for message in messages if message['type'] == 'STATE']
+    return records, states[-1], error
+
+
+@pytest.fixture(name='records')
+def fixture_records(monkeypatch):
+    monkeypatch.setattr(NetSuiteClient, 'basic_search_factory',
+                        lambda self, type_name, **kwargs: types.SimpleNamespace(type_name=type_name, **kwargs))
+    start = singer_utils.strptime_to_utc(START_DATE)
+    return [{'internalId': str(internal_id), 'lastModifiedDate': start + datetime.timedelta(minutes=internal_id)}
+            for internal_id in range(1, 26)]
+
+
+@pytest.mark.parametrize('config', [{}, {'backfill_window_days': 365}, {'prefetch_pages': 2}])
+def test_resumed_search_keeps_records_modified_or_deleted_since(records, config):
+    written, state, error = sync(FakeClient(records, fail_at_page=3), {}, **config)
+    assert error is not None
+    assert [int(rec['Id']) for rec in written] == list(range(1, 11))
+    assert state['bookmarks']['SalesOrders']['LastInternalId'] == 10
+
+    # Between both runs a written record and one still to write are modified, and one written is deleted
+    modified = singer_utils.now()
+    records[2]['lastModifiedDate'] = modified
+    records[19]['lastModifiedDate'] = modified
+    del records[3]
+
+    resumed, state, error = sync(FakeClient(records), state, **config)
+    assert error is None
+    resumed_ids = [int(rec['Id']) for rec in resumed]
+    # The interrupted window is searched on after the last record written, then the records modified since
+    assert resumed_ids[:14] == [internal_id for internal_id in range(11, 26) if internal_id != 20]
+    assert sorted(resumed_ids[14:]) == [3, 20]
+    assert 'LastInternalId' not in state['bookmarks']['SalesOrders']
+    assert singer_utils.strptime_to_utc(state['bookmarks']['SalesOrders']['lastModifiedDate']) >= modified
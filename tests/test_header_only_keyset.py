@@ -0,0 +1,91 @@
+import threading
+import types
+
+import pytest
+from netsuitesdk.internal.client import NetSuiteClient
+
+from tap_netsuite.netsuite.netsuite_client import ExtendedNetSuiteClient
+from tap_netsuite.netsuite.netsuite_connection import ExtendedNetSuiteConnection
+from tap_netsuite.netsuite.transaction_entities import EntityDefinition, SearchEntity
+
+PAGE_SIZE = 2
+
+
+class FakeClient(ExtendedNetSuiteClient):
+    """Answers searches from internal_ids, recording each one as
+    (search type, whether it matches main lines only, whether it is header only)."""
+
+    def __init__(self, internal_ids):  # pylint: disable=super-init-not-called
+        self._local = threading.local()
+        self.page_fetch_workers = 1
+        self.internal_ids = internal_ids
+        self.searches = []
+        self.lock = threading.Lock()
+
+    def search_factory(self, type_name):  # pylint: disable=arguments-differ
+        return types.SimpleNamespace(type_name=type_name)
+
+    def SearchBooleanField(self, **kwargs):  # pylint: disable=invalid-name
+        return types.SimpleNamespace(**kwargs)
+
+    def SearchLongField(self, **kwargs):  # pylint: disable=invalid-name
+        return types.SimpleNamespace(**kwargs)
+
+    def search(self, searchRecord):  # pylint: disable=invalid-name,arguments-differ
+        basic = searchRecord.basic
+        with self.lock:
+            self.searches.append((basic.type_name, hasattr(basic, 'mainLine'), self._header_only()))
+        internal_id_filter = getattr(basic, 'internalIdNumber', None)
+        matching = [internal_id for internal_id in self.internal_ids
+                    if internal_id_filter is None
+                    or (internal_id_filter.operator == 'greaterThan' and internal_id > internal_id_filter.searchValue)
+                    or (internal_id_filter.operator == 'lessThan' and internal_id < internal_id_filter.searchValue)
+                    or (internal_id_filter.operator == 'between'
+                        and internal_id_filter.searchValue <= internal_id <= internal_id_filter.searchValue2)]
+        return types.SimpleNamespace(totalRecords=len(matching),
+                                     pageSize=PAGE_SIZE,
+                                     totalPages=(len(matching) + PAGE_SIZE - 1) // PAGE_SIZE,
+                                     pageIndex=1,
+                                     searchId='search',
+                                     records=[{'internalId': str(internal_id)} for internal_id in matching[:PAGE_SIZE]])
+
+    def searchMoreWithId(self, searchId, pageIndex):  # pylint: disable=invalid-name,arguments-differ
+        first = (pageIndex - 1) * PAGE_SIZE
+        return types.SimpleNamespace(records=[{'internalId': str(internal_id)}
+                                              for internal_id in self.internal_ids[first:first + PAGE_SIZE]])
+
+
+@pytest.fixture(name='connection')
+def fixture_connection(monkeypatch):
+    monkeypatch.setattr(NetSuiteClient, 'basic_search_factory',
+                        lambda self, type_name, **kwargs: types.SimpleNamespace(type_name=type_name, **kwargs))
+    connection = ExtendedNetSuiteConnection.__new__(ExtendedNetSuiteConnection)
+    connection.client = FakeClient(list(range(1, 10)))
+    definition = EntityDefinition('SalesOrders', 'Transaction', require_lastModified_date=False, page_size=PAGE_SIZE)
+    connection.entities = {'SalesOrders': SearchEntity(connection.client, definition)}
+    return connection
+
+
+def synced_ids(pages):
+    return [int(rec['internalId']) for page in pages for rec in page]
+
+
+def test_keyset_pages_are_searched_header_only(connection):
+    pages = connection.query_entity('SalesOrders', header_only=True, keyset=True)
+    assert synced_ids(pages) == list(range(1, 10))
+    assert len(connection.client.searches) == 5
+    assert set(connection.client.searches) == {('Transaction', True, True)}
+    assert not connection.client._header_only()  # pylint: disable=protected-access
+
+
+def test_keyset_pages_are_searched_with_sublists(connection):
+    pages = connection.query_entity('SalesOrders', keyset=True)
+    assert synced_ids(pages) == list(range(1, 10))
+    assert set(connection.client.searches) == {('Transaction', False, False)}
+
+
+def test_partitioned_ranges_are_searched_header_only(connection):
+    pages = connection.query_partitioned('SalesOrders', partitions=3, max_workers=3, header_only=True)
+    assert synced_ids(pages) == list(range(1, 10))
+    assert len(connection.client.searches) > 1
+    assert set(connection.client.searches) == {('Transaction', True, True)}
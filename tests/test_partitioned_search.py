@@ -0,0 +1,83 @@
+import threading
+import types
+
+import pytest
+from netsuitesdk.internal.client import NetSuiteClient
+
+from tap_netsuite.netsuite.netsuite_client import ExtendedNetSuiteClient
+from tap_netsuite.netsuite.netsuite_connection import ExtendedNetSuiteConnection
+from tap_netsuite.netsuite.transaction_entities import EntityDefinition, SearchEntity
+
+PAGE_SIZE = 2
+LAST_MODIFIED_DATE = {'searchValue': '2021-01-01T00:00:00Z', 'type': 'dateTime', 'operator': 'onOrAfter'}
+
+
+class FakeClient(ExtendedNetSuiteClient):
+    """Answers searches from records in internalId order, each record a pair
+    (internalId, whether it was modified since LAST_MODIFIED_DATE)."""
+
+    def __init__(self, records):  # pylint: disable=super-init-not-called
+        self._local = threading.local()
+        self.page_fetch_workers = 1
+        self.records = records
+        self.results = {}
+        self.lock = threading.Lock()
+
+    def search_factory(self, type_name):  # pylint: disable=arguments-differ
+        return types.SimpleNamespace(type_name=type_name)
+
+    def SearchLongField(self, **kwargs):  # pylint: disable=invalid-name
+        return types.SimpleNamespace(**kwargs)
+
+    @staticmethod
+    def matches(basic, internal_id, modified):
+        if getattr(basic, 'lastModifiedDate', None) is not None and not modified:
+            return False
+        internal_id_filter = getattr(basic, 'internalIdNumber', None)
+        return (internal_id_filter is None
+                or (internal_id_filter.operator == 'greaterThan' and internal_id > internal_id_filter.searchValue)
+                or (internal_id_filter.operator == 'lessThan' and internal_id < internal_id_filter.searchValue)
+                or (internal_id_filter.operator == 'between'
+                    and internal_id_filter.searchValue <= internal_id <= internal_id_filter.searchValue2))
+
+    def page(self, search_id, page_index):
+        records = self.results[search_id]
+        return types.SimpleNamespace(totalRecords=len(records),
+                                     pageSize=PAGE_SIZE,
+                                     totalPages=(len(records) + PAGE_SIZE - 1) // PAGE_SIZE,
+                                     pageIndex=page_index,
+                                     searchId=search_id,
+                                     records=records[(page_index - 1) * PAGE_SIZE:page_index * PAGE_SIZE])
+
+    def search(self, searchRecord):  # pylint: disable=invalid-name,arguments-differ
+        with self.lock:
+            search_id = len(self.results)
+            self.results[search_id] = [{'internalId': str(internal_id)} for internal_id, modified in self.records
+                                       if self.matches(searchRecord.basic, internal_id, modified)]
+        return self.page(search_id, 1)
+
+    def searchMoreWithId(self, searchId, pageIndex):  # pylint: disable=invalid-name,arguments-differ
+        return self.page(searchId, pageIndex)
+
+
+@pytest.fixture(name='connection')
+def fixture_connection(monkeypatch):
+    monkeypatch.setattr(NetSuiteClient, 'basic_search_factory',
+                        lambda self, type_name, **kwargs: types.SimpleNamespace(type_name=type_name, **kwargs))
+    connection = ExtendedNetSuiteConnection.__new__(ExtendedNetSuiteConnection)
+    connection.client = FakeClient([(internal_id, internal_id % 3 != 0) for internal_id in range(1, 20)])
+    definition = EntityDefinition('SalesOrders', 'Transaction', page_size=PAGE_SIZE)
+    connection.entities = {'SalesOrders': SearchEntity(connection.client, definition)}
+    return connection
+
+
+def synced_ids(pages):
+    return [int(rec['internalId']) for page in pages for rec in page]
+
+
+def test_partitioned_search_keeps_the_last_modified_date_filter(connection):
+    pages = connection.query_entity('SalesOrders', LAST_MODIFIED_DATE)
+    partitioned_pages = connection.query_partitioned('SalesOrders', partitions=3, max_workers=3,
+                                                     lastModifiedDate=LAST_MODIFIED_DATE)
+    assert synced_ids(partitioned_pages) == synced_ids(pages)
+    assert synced_ids(pages) == [internal_id for internal_id in range(1, 20) if internal_id % 3 != 0]
@@ -0,0 +1,43 @@
+import threading
+import time
+
+from tap_netsuite.netsuite.pagination import PrefetchBudget, PrefetchedPages, ResponsePage
+
+PAGE_BYTES = 1000
+
+
+class Pages:
+    """Pages of zeep records of PAGE_BYTES bytes each, recording the bytes of the pages alive, not synced yet,
+    once each one is fetched."""
+
+    def __init__(self, count):
+        self.count = count
+        self.alive = 0
+        self.alive_when_fetched = []
+        self.lock = threading.Lock()
+
+    def __iter__(self):
+        for internal_id in range(self.count):
+            with self.lock:
+                self.alive += PAGE_BYTES
+                self.alive_when_fetched.append(self.alive)
+            yield ResponsePage([{'internalId': str(internal_id)}], PAGE_BYTES)
+
+    def synced(self):
+        with self.lock:
+            self.alive -= PAGE_BYTES
+
+
+def test_pages_fetched_ahead_stay_within_the_budget():
+    pages = Pages(20)
+    budget = PrefetchBudget(int(2.5 * PAGE_BYTES))
+    synced = []
+    for page in PrefetchedPages(pages, 4, budget):
+        time.sleep(0.005)
+        synced.append(int(page[0]['internalId']))
+        pages.synced()
+
+    assert synced == list(range(20))
+    # The page being synced, and at most the two that fit in the budget fetched ahead
+    assert max(pages.alive_when_fetched) <= 3 * PAGE_BYTES
+    assert budget.held == 0
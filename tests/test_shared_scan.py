@@ -0,0 +1,45 @@
+import datetime
+import types
+
+from singer import metadata
+
+from tap_netsuite.netsuite import NetSuite
+from tap_netsuite.netsuite.transaction_entities import SEARCH_ENTITIES
+
+START_DATE = '2021-01-01T00:00:00Z'
+
+
+def catalog_entry(stream):
+    mdata = metadata.write(metadata.new(), (), 'replication-key', 'lastModifiedDate')
+    return {'stream': stream, 'tap_stream_id': stream, 'metadata': metadata.to_list(mdata)}
+
+
+def item(record_type, internal_id):
+    modified = datetime.datetime(2021, 1, 2, tzinfo=datetime.timezone.utc)
+    return type(record_type, (dict,), {})(internalId=str(internal_id), lastModifiedDate=modified)
+
+
+def test_item_scan_routes_the_records_of_the_item_streams_own_searches():
+    records = [item(record_type, internal_id) for internal_id, record_type in
+               enumerate(['InventoryItem', 'LotNumberedInventoryItem', 'SerializedInventoryItem', 'KitItem'])]
+    searches = []
+
+    def query_items(record_types=None, lastModifiedDate=None):  # pylint: disable=invalid-name
+        searches.append(record_types)
+        return [records]
+
+    ns = NetSuite(default_start_date=START_DATE, shared_item_scan=True)
+    ns.ns_client = types.SimpleNamespace(entities={stream: SEARCH_ENTITIES[stream](None)
+                                                   for stream in ('InventoryItem', 'Items')},
+                                         query_items=query_items)
+    members = ns.start_shared_scans([catalog_entry('InventoryItem'), catalog_entry('Items')], {})
+    assert len(members) == 2
+    shared_scan, = ns.shared_scans
+    routed = {stream: [rec['internalId'] for page in shared_scan.stream_pages(stream) for rec in page]
+              for stream in ('InventoryItem', 'Items')}
+    ns.stop_shared_scans()
+
+    assert searches == [None]
+    # InventoryItem's own search, whose recordType contains InventoryItem, also returns lot numbered
+    # and serialized inventory items
+    assert routed == {'InventoryItem': ['0', '1', '2'], 'Items': ['0', '1', '2', '3']}